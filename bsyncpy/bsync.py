@@ -6,21 +6,221 @@ it easier to build BuildingSync XML files.
 """
 
 import datetime
+import types
 from lxml import etree
 
-from typing import Any, List, Tuple
+from typing import Any, Callable, Dict, List, Mapping, Tuple
 
+# the attributes of most of the elements with an identifier, shared by all of
+# them rather than each class having its own list
+_ID_ATTRS = ("ID",)
+
+# many classes have the same (child name, child type) pairs in their element
+# children like ("Capacity", Capacity), this keeps one copy of each
+_element_children_pairs: Dict[Tuple[str, type], Tuple[str, type]] = {}
+
+# classes with the same children, like LinkedSiteID and LinkedBuildingID,
+# share one table and one read-only mapping of the children by name
+_element_children: Dict[tuple, Tuple[tuple, Mapping[str, type]]] = {}
+
+# some classes have the same enumerations, like the climate zones in the
+# DOE and Building America systems, this keeps one copy of each
+_element_enumerations: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# the schema tables of the element classes, always stored as tuples so they
+# cannot be changed in place behind the lookups computed from them
+_element_tables = (
+    "element_attributes",
+    "element_enumerations",
+    "element_children",
+    "element_union",
+)
+
+# class attributes that are computed from the schema tables the first time
+# they are needed, these are thrown away when the table is changed
+_element_caches: Dict[str, Tuple[str, ...]] = {
+    "element_children": ("_toxml_children", "_children_by_tag", "_children_by_type"),
+    "element_enumerations": ("_enumerations",),
+}
+
+
+def _boolean_text(value: Any) -> str:
+    if not isinstance(value, bool):
+        raise TypeError("boolean expected")
+    return "true" if value else "false"
+
+
+def _integer_text(value: Any) -> str:
+    if not isinstance(value, int):
+        raise TypeError("integer expected")
+    return f"{value:d}"
+
+
+def _non_negative_integer_text(value: Any) -> str:
+    if not isinstance(value, int):
+        raise TypeError("integer expected")
+    if value < 0:
+        raise ValueError("non-negative integer expected")
+    return f"{value:d}"
+
+
+def _decimal_text(value: Any) -> str:
+    if not isinstance(value, float):
+        raise TypeError("decimal (float) expected")
+    return f"{value:f}"
+
+
+def _float_text(value: Any) -> str:
+    if not isinstance(value, float):
+        raise TypeError("float expected")
+    return f"{value:G}"
+
+
+def _string_text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError("string expected")
+    return value
+
+
+def _date_text(value: Any) -> str:
+    if not isinstance(value, datetime.date):
+        raise TypeError("datetime.date expected")
+    return value.isoformat()
+
+
+def _time_text(value: Any) -> str:
+    if not isinstance(value, datetime.time):
+        raise TypeError("datetime.time expected")
+    return value.isoformat()
+
+
+def _date_time_text(value: Any) -> str:
+    if not isinstance(value, datetime.datetime):
+        raise TypeError("datetime.datetime expected")
+    return value.isoformat()
+
+
+def _month_day_text(value: Any) -> str:
+    if not isinstance(value, datetime.date):
+        raise TypeError("datetime.date expected")
+    return value.strftime("--%m-%d")
+
+
+# the function that checks the value of a simple element and returns its
+# text, by element type, so the constructor does one lookup rather than
+# comparing the type with each of them
+_element_type_text: Dict[str, Callable[[Any], str]] = {
+    "xs:boolean": _boolean_text,
+    "xs:integer": _integer_text,
+    "xs:int": _integer_text,
+    "xs:nonNegativeInteger": _non_negative_integer_text,
+    "xs:decimal": _decimal_text,
+    "xs:float": _float_text,
+    "xs:string": _string_text,
+    "xs:date": _date_text,
+    "xs:time": _time_text,
+    "xs:dateTime": _date_time_text,
+    "xs:gMonthDay": _month_day_text,
+    "xs:gYear": _integer_text,
+}
+
+
+class BSElementMeta(type):
+    """Metaclass for BuildingSync elements.  The generated module assigns the
+    element children of a class after the class statement, this shares the
+    (child name, child type) pairs and the enumerations between all of the
+    classes, builds a read-only mapping of the children by name for the class,
+    and makes sure nothing computed from an older table is left on the class
+    or the subclasses that inherit it.  The instances of the generated
+    element classes only have the slots of BSElement, there is no instance
+    dictionary, subclasses written outside of this module keep theirs.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if namespace.get("__module__") == __name__:
+            namespace.setdefault("__slots__", ())
+
+        # tables in the class body are set like the generated ones
+        tables = {}
+        for attr in _element_tables:
+            if attr in namespace:
+                tables[attr] = namespace.pop(attr)
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        for attr, value in tables.items():
+            setattr(cls, attr, value)
+        return cls
+
+    def __setattr__(cls, attr, value):
+        if attr == "element_children":
+            child_pairs = []
+            for child_pair in value:
+                child_pair = tuple(child_pair)
+                # catch a missing or misspelled class when the table is set
+                # rather than when an instance is being built or read
+                if len(child_pair) != 2:
+                    raise TypeError(
+                        f"{repr(cls.__name__)} child is not a (name, class) pair: {repr(child_pair)}"
+                    )
+                child_name, child_type = child_pair
+                if not isinstance(child_type, BSElementMeta):
+                    raise TypeError(
+                        f"{repr(cls.__name__)} child {repr(child_name)} is not an element class: {repr(child_type)}"
+                    )
+                child_pairs.append(
+                    _element_children_pairs.setdefault(child_pair, child_pair)
+                )
+            value = tuple(child_pairs)
+            shared = _element_children.get(value)
+            if shared is None:
+                shared = _element_children[value] = (
+                    value,
+                    types.MappingProxyType(dict(value)),
+                )
+            value, children_by_name = shared
+            super().__setattr__("_children_by_name", children_by_name)
+        elif attr == "element_enumerations":
+            value = tuple(value)
+            value = _element_enumerations.setdefault(value, value)
+        elif attr == "element_union":
+            value = tuple(value)
+            for union_type in value:
+                if not isinstance(union_type, BSElementMeta):
+                    raise TypeError(
+                        f"{repr(cls.__name__)} union member is not an element class: {repr(union_type)}"
+                    )
+        elif attr in _element_tables:
+            value = tuple(value)
+        super().__setattr__(attr, value)
+
+        cache_names = _element_caches.get(attr)
+        if cache_names:
+            classes = [cls]
+            while classes:
+                klass = classes.pop()
+                for cache_name in cache_names:
+                    if cache_name in klass.__dict__:
+                        type.__delattr__(klass, cache_name)
+                classes.extend(klass.__subclasses__())
+
+
+class BSElement(metaclass=BSElementMeta):
+    """Base class of the BuildingSync elements.  Elements are compared and
+    hashed by identity, two elements with the same value and children are
+    not equal, so they can be used in sets and as dictionary keys without
+    walking their children.
+    """
+
+    __slots__ = ("_children_values", "_text", "_attributes")
 
-class BSElement:
     element_type: str = ""
-    element_attributes: List[str] = []
-    element_enumerations: List[str] = []
-    element_children: List[Tuple[str, type]] = []
-    element_union: List[type] = []
+    element_attributes: Tuple[str, ...] = ()
+    element_enumerations: Tuple[str, ...] = ()
+    element_children: Tuple[Tuple[str, type], ...] = ()
+    element_union: Tuple[type, ...] = ()
 
     def __init__(self, *args, **kwargs):
         """Create an instance of a BuildingSync element."""
-        self._children_by_name = dict(self.element_children)
         self._children_values = {}
         self._text = None
 
@@ -29,8 +229,7 @@ class BSElement:
             if self.element_enumerations:
                 if len(args) > 1:
                     raise RuntimeError("too many arguments")
-                if args[0] not in self.element_enumerations:
-                    raise ValueError("invalid enumeration")
+                self._check_enumeration(args[0])
                 self._text = args[0]
 
             elif self.element_union:
@@ -46,84 +245,10 @@ class BSElement:
                 else:
                     raise ValueError("invalid argument")
 
-            elif self.element_type == "xs:boolean":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, bool):
-                    raise TypeError("boolean expected")
-                self._text = "true" if args[0] else "false"
-
-            elif self.element_type == "xs:integer" or self.element_type == "xs:int":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, int):
-                    raise TypeError("integer expected")
-                self._text = f"{arg_value:d}"
-
-            elif self.element_type == "xs:nonNegativeInteger":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, int):
-                    raise TypeError("integer expected")
-                if arg_value < 0:
-                    raise ValueError("non-negative integer expected")
-                self._text = f"{arg_value:d}"
-
-            elif self.element_type == "xs:decimal":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, float):
-                    raise TypeError("decimal (float) expected")
-                self._text = f"{arg_value:f}"
-
-            elif self.element_type == "xs:float":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, float):
-                    raise TypeError("float expected")
-                self._text = f"{arg_value:G}"
-
-            elif self.element_type == "xs:string":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, str):
-                    raise TypeError("string expected")
-                self._text = arg_value
-
-            elif self.element_type == "xs:date":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, datetime.date):
-                    raise TypeError("datetime.date expected")
-                self._text = arg_value.isoformat()
-
-            elif self.element_type == "xs:time":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, datetime.time):
-                    raise TypeError("datetime.time expected")
-                self._text = arg_value.isoformat()
-
-            elif self.element_type == "xs:dateTime":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, datetime.datetime):
-                    raise TypeError("datetime.datetime expected")
-                self._text = arg_value.isoformat()
-
-            elif self.element_type == "xs:gMonthDay":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, datetime.date):
-                    raise TypeError("datetime.date expected")
-                self._text = arg_value.strftime("--%m-%d")
-
-            elif self.element_type == "xs:gYear":
+            elif self.element_type in _element_type_text:
                 if len(args) > 1:
                     raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, int):
-                    raise TypeError("integer expected")
-                self._text = f"{arg_value:d}"
+                self._text = _element_type_text[self.element_type](arg_value)
 
             else:
                 # add the args as child elements
@@ -180,16 +305,25 @@ class BSElement:
     def __add__(self, value):
         """Add an element value by finding the child element name with the
         correct class.  Return this element so other child element values can
-        be added like 'thing + Child1() + Child2()'.
+        be added like 'thing + Child1() + Child2()'.  The child element name
+        found for each type of value is cached for each class.
         """
-        for child_name, child_type in self.element_children:
-            if isinstance(value, child_type):
-                break
-        else:
-            child_type_names = list(
-                child_type.__name__ for child_name, child_type in self.element_children
-            )
-            raise ValueError(f"expecting one of: {', '.join(child_type_names)}")
+        children_by_type = self.__class__.__dict__.get("_children_by_type")
+        if children_by_type is None:
+            children_by_type = self.__class__._children_by_type = {}
+
+        child_name = children_by_type.get(type(value))
+        if child_name is None:
+            for child_name, child_type in self.element_children:
+                if isinstance(value, child_type):
+                    break
+            else:
+                child_type_names = list(
+                    child_type.__name__
+                    for child_name, child_type in self.element_children
+                )
+                raise ValueError(f"expecting one of: {', '.join(child_type_names)}")
+            children_by_type[type(value)] = child_name
 
         # if this child already has a value, add this to the end
         if child_name in self._children_values:
@@ -246,14 +380,192 @@ class BSElement:
         for k, v in self._attributes.items():
             myroot.set(k, v)
 
-        # maybe I have children
-        for child_name, child_type in self.element_children:
-            for child_value in self._children_values.get(child_name, []):
-                child_value.toxml(myroot, child_name)
+        # maybe I have children, added by a function specialized for this
+        # class that is compiled the first time it is needed
+        if self._children_values:
+            toxml_children = self.__class__.__dict__.get("_toxml_children")
+            if toxml_children is None:
+                toxml_children = self.__class__._compile_toxml_children()
+            toxml_children(self, myroot)
 
         # return this "root" element
         return myroot
 
+    @classmethod
+    def _compile_toxml_children(cls) -> Any:
+        """Compile and cache a function that adds the child element values
+        of an instance to its XML element.  The element children are fixed
+        for each class, so the loop over them is unrolled into straight-line
+        code with the child names as constants.
+        """
+        source = ["def _toxml_children(self, myroot):"]
+        source.append("    values = self._children_values")
+        for child_name, child_type in cls.element_children:
+            source.append(f"    if {child_name!r} in values:")
+            source.append(f"        for child_value in values[{child_name!r}]:")
+            source.append(f"            child_value.toxml(myroot, {child_name!r})")
+
+        namespace: Dict[str, Any] = {}
+        code = compile("\n".join(source), f"<{cls.__qualname__}>", "exec")
+        exec(code, namespace)
+
+        # cache it in this class, subclasses may have different children
+        toxml_children = namespace["_toxml_children"]
+        cls._toxml_children = toxml_children
+        return toxml_children
+
+    @classmethod
+    def fromxml(cls, element) -> "BSElement":
+        """Return an instance of this class from an ElementTree element, the
+        reverse of toxml().  The child elements are matched with the element
+        children by name and any namespace is ignored, so documents with the
+        'auc:' prefix can be read.
+        """
+        self = cls()
+
+        # maybe I have a value
+        if cls.element_type or cls.element_union:
+            if cls.element_enumerations:
+                cls._check_enumeration(element.text)
+            self._text = element.text
+
+        # maybe I have attributes
+        self._attributes = dict(element.attrib)
+
+        # maybe I have children
+        for child in element:
+            # skip over comments and processing instructions
+            if not isinstance(child.tag, str):
+                continue
+
+            child_name, child_type = cls._child_for_tag(child.tag)
+            child_value = child_type.fromxml(child)
+
+            # if this child already has a value, add this to the end
+            if child_name in self._children_values:
+                self._children_values[child_name].append(child_value)
+            else:
+                self._children_values[child_name] = [child_value]
+
+        return self
+
+    @classmethod
+    def fromfile(cls, source) -> "BSElement":
+        """Return an instance of this class read from an XML document, given
+        a file name or a file object, where the document element is one of
+        these, or any element when called as BSElement.fromfile().  The
+        document is parsed incrementally and each XML element is thrown away
+        once it has been read, so large documents are never held in memory
+        twice.
+        """
+        root = None
+        stack: List[BSElement] = []
+
+        # documents may come from anywhere, so entities are never resolved,
+        # a file could otherwise pull in the contents of other files
+        for event, element in etree.iterparse(
+            source, events=("start", "end"), resolve_entities=False
+        ):
+            if event == "start":
+                if stack:
+                    parent = stack[-1]
+                    child_name, child_type = parent._child_for_tag(element.tag)
+                    value = child_type()
+
+                    # if this child already has a value, add this to the end
+                    if child_name in parent._children_values:
+                        parent._children_values[child_name].append(value)
+                    else:
+                        parent._children_values[child_name] = [value]
+                else:
+                    element_name = etree.QName(element).localname
+                    root_type = cls
+                    if cls is BSElement:
+                        element_class = globals().get(element_name)
+                        if (
+                            not isinstance(element_class, BSElementMeta)
+                            or element_class is BSElement
+                        ):
+                            raise ValueError(
+                                f"no element class for document element {repr(element_name)}"
+                            )
+                        root_type = element_class
+                    if element_name != root_type.__name__:
+                        raise ValueError(
+                            f"expecting {repr(root_type.__name__)}, got {repr(element_name)}"
+                        )
+                    root = value = root_type()
+
+                # the attributes are complete at the start
+                value._attributes = dict(element.attrib)
+                stack.append(value)
+
+            else:
+                # the text is complete at the end
+                value = stack.pop()
+                if value.element_type or value.element_union:
+                    if value.element_enumerations:
+                        value._check_enumeration(element.text)
+                    value._text = element.text
+
+                # done with this element and the ones before it, the document
+                # element has no parent but may follow comments and processing
+                # instructions
+                element.clear()
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+        return root
+
+    @classmethod
+    def _child_for_tag(cls, tag: str) -> Tuple[str, type]:
+        """Return the child element name and type for an XML tag.  The tags
+        are cached for each class so the namespace is only stripped the first
+        time a tag is seen.
+        """
+        children_by_tag = cls.__dict__.get("_children_by_tag")
+        if children_by_tag is None:
+            children_by_tag = cls._children_by_tag = {}
+
+        try:
+            return children_by_tag[tag]
+        except KeyError:
+            pass
+
+        child_name = etree.QName(tag).localname
+        for name, child_type in cls.element_children:
+            if name == child_name:
+                children_by_tag[tag] = (name, child_type)
+                return (name, child_type)
+        raise ValueError(f"{repr(cls.__name__)} object has no child {repr(child_name)}")
+
+    @classmethod
+    def _check_enumeration(cls, text: str) -> None:
+        """Make sure a value is one of the enumerations.  The enumerations are
+        turned into a set the first time they are checked so long lists are
+        not searched for every element that is created or read.
+        """
+        enumerations = cls.__dict__.get("_enumerations")
+        if enumerations is None:
+            enumerations = cls._enumerations = frozenset(cls.element_enumerations)
+
+        if not isinstance(text, str) or text not in enumerations:
+            raise ValueError(f"{repr(cls.__name__)} invalid enumeration {repr(text)}")
+
+    def __repr__(self) -> str:
+        """Return a short description of the element with its value and
+        attributes.  The children are not included so this stays cheap for
+        elements at the top of large documents.
+        """
+        description = [self.__class__.__qualname__]
+        if self._text:
+            description.append(repr(self._text))
+        for k, v in self._attributes.items():
+            description.append(f"{k}={repr(v)}")
+        return f"<{' '.join(description)}>"
+
     def __str__(self):
         """Convert the element into a string."""
         return etree.tostring(self.toxml(), pretty_print=True).decode()
@@ -278,7 +590,7 @@ class ProgramClassification(BSElement):
     """The classification or type of the program."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Audit",
         "Performance",
         "Deemed",
@@ -286,20 +598,20 @@ class ProgramClassification(BSElement):
         "Rebate",
         "Other",
         "Not Applicable",
-    ]
+    )
 
 
 # Tightness
 class Tightness(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Very Tight",
         "Tight",
         "Average",
         "Leaky",
         "Very Leaky",
         "Unknown",
-    ]
+    )
 
 
 # BuildingSync.Facilities.Facility.Systems.AirInfiltrationSystems.AirInfiltrationSystem.AirInfiltrationNotes
@@ -321,7 +633,7 @@ class AirInfiltrationValueUnits(BSElement):
     """Units associated with Air Infiltration Value."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "CFM25",
         "CFM50",
         "CFM75",
@@ -330,7 +642,7 @@ class AirInfiltrationValueUnits(BSElement):
         "ACHnatural",
         "Effective Leakage Area",
         "Other",
-    ]
+    )
 
 
 # BuildingSync.Facilities.Facility.Systems.AirInfiltrationSystems.AirInfiltrationSystem.AirInfiltrationTest
@@ -338,7 +650,7 @@ class AirInfiltrationTest(BSElement):
     """Type of air infiltration test performed on the building."""
 
     element_type = "xs:string"
-    element_enumerations = ["Blower door", "Tracer gas", "Checklist", "Other"]
+    element_enumerations = ("Blower door", "Tracer gas", "Checklist", "Other")
 
 
 # BuildingSync.Facilities.Facility.Systems.WaterInfiltrationSystems.WaterInfiltrationSystem.LocationsOfExteriorWaterIntrusionDamages.LocationsOfExteriorWaterIntrusionDamage
@@ -346,7 +658,7 @@ class LocationsOfExteriorWaterIntrusionDamage(BSElement):
     """Location of observed moisture problems on the outside of the building."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Roof",
         "Interior ceiling",
         "Foundation",
@@ -355,7 +667,7 @@ class LocationsOfExteriorWaterIntrusionDamage(BSElement):
         "Walls",
         "Around windows",
         "Other",
-    ]
+    )
 
 
 # BuildingSync.Facilities.Facility.Systems.WaterInfiltrationSystems.WaterInfiltrationSystem.LocationsOfInteriorWaterIntrusionDamages.LocationsOfInteriorWaterIntrusionDamage
@@ -363,7 +675,7 @@ class LocationsOfInteriorWaterIntrusionDamage(BSElement):
     """Location of observed moisture problems on the inside of the building."""
 
     element_type = "xs:string"
-    element_enumerations = ["Kitchen", "Bathroom", "Basement", "Other"]
+    element_enumerations = ("Kitchen", "Bathroom", "Basement", "Other")
 
 
 # BuildingSync.Facilities.Facility.Systems.WaterInfiltrationSystems.WaterInfiltrationSystem.WaterInfiltrationNotes
@@ -392,7 +704,7 @@ class eGRIDRegionCode(BSElement):
     """WARNING: eGRIDRegionCode will be deprecated in BuildingSync 3.0 - use eGRIDSubregionCodes."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "AKGD",
         "AKMS",
         "AZNM",
@@ -422,7 +734,7 @@ class eGRIDRegionCode(BSElement):
         "SRTV",
         "SRVC",
         "Other",
-    ]
+    )
 
 
 # WeatherDataStationID
@@ -444,7 +756,7 @@ class WeatherStationCategory(BSElement):
     """Describes the type of weather station used to specify the site's weather. WARNING: This element is being deprecated, use WeatherStations/WeatherStation/WeatherStationCategory instead"""
 
     element_type = "xs:string"
-    element_enumerations = ["FAA", "ICAO", "NWS", "WBAN", "WMO", "Other"]
+    element_enumerations = ("FAA", "ICAO", "NWS", "WBAN", "WMO", "Other")
 
 
 # Longitude
@@ -466,7 +778,7 @@ class Ownership(BSElement):
     """The type of organization, association, business, etc. that owns the premises."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Property management company",
         "Corporation/partnership/LLC",
         "Privately owned",
@@ -481,7 +793,7 @@ class Ownership(BSElement):
         "Local government",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OwnershipStatus
@@ -489,7 +801,7 @@ class OwnershipStatus(BSElement):
     """Ownership status of the premises with respect to the occupant."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Owned",
         "Mortgaged",
         "Leased",
@@ -497,7 +809,7 @@ class OwnershipStatus(BSElement):
         "Occupied without payment of rent",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # PrimaryContactID
@@ -505,9 +817,7 @@ class PrimaryContactID(BSElement):
     """Primary contact ID number for the premises."""
 
 
-PrimaryContactID.element_attributes = [
-    "IDref",  # IDREF
-]
+PrimaryContactID.element_attributes = ("IDref",)  # IDREF
 
 
 # BuildingType.BuildingClassification
@@ -515,12 +825,12 @@ class BuildingClassification(BSElement):
     """Specify the type of building."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Commercial",
         "Residential",
         "Mixed use commercial",
         "Other",
-    ]
+    )
 
 
 # BuildingType.MultiTenant
@@ -647,7 +957,7 @@ class HeightDistribution(BSElement):
     """Uniformity of building height."""
 
     element_type = "xs:string"
-    element_enumerations = ["Multiple Heights", "Uniform Height"]
+    element_enumerations = ("Multiple Heights", "Uniform Height")
 
 
 # BuildingType.HorizontalSurroundings
@@ -655,13 +965,13 @@ class HorizontalSurroundings(BSElement):
     """Attachments to the outermost horizontal surfaces of the premises."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "No abutments",
         "Attached from Above",
         "Attached from Below",
         "Attached from Above and Below",
         "Unknown",
-    ]
+    )
 
 
 # BuildingType.VerticalSurroundings
@@ -669,14 +979,14 @@ class VerticalSurroundings(BSElement):
     """Attachments to the outermost vertical surfaces of the premises. This can be used if the more detailed input for Surface Exposure is not known. Illustrations for the constrained list choices will be provided when the web site is developed."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Stand-alone",
         "Attached on one side",
         "Attached on two sides",
         "Attached on three sides",
         "Within a building",
         "Unknown",
-    ]
+    )
 
 
 # YearOfConstruction
@@ -747,14 +1057,14 @@ class OperatorType(BSElement):
     """Entity responsible for the operation of the facility."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Owner",
         "Occupant",
         "Tenant",
         "Landlord",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # BuildingType.FederalBuilding.Agency
@@ -781,7 +1091,7 @@ class AssessmentProgram(BSElement):
     """Program which issues energy labels, ratings, or sustainability certifications."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "ENERGY STAR",
         "ENERGY STAR Certified Homes",
         "LEED",
@@ -801,7 +1111,7 @@ class AssessmentProgram(BSElement):
         "Commercial Building Energy Asset Score",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # BuildingType.Assessments.Assessment.AssessmentLevel
@@ -809,7 +1119,7 @@ class AssessmentLevel(BSElement):
     """Value from assessment program, such as LEED "Platinum"."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Bronze",
         "Silver",
         "Gold",
@@ -821,7 +1131,7 @@ class AssessmentLevel(BSElement):
         "Three Star",
         "Four Star",
         "Other",
-    ]
+    )
 
 
 # BuildingType.Assessments.Assessment.AssessmentValue
@@ -850,7 +1160,7 @@ class SideNumber(BSElement):
     """Alphanumeric designation of the side of the section as defined in the BuildingSync Geometry Reference Sheet."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "A1",
         "A2",
         "A3",
@@ -865,7 +1175,7 @@ class SideNumber(BSElement):
         "D3",
         "AO1",
         "BO1",
-    ]
+    )
 
 
 # BuildingType.Sections.Section.Sides.Side.SideLength
@@ -880,7 +1190,7 @@ class EquipmentCondition(BSElement):
     """Assessed condition of equipment or system."""
 
     element_type = "xs:string"
-    element_enumerations = ["Excellent", "Good", "Average", "Poor", "Other", "Unknown"]
+    element_enumerations = ("Excellent", "Good", "Average", "Poor", "Other", "Unknown")
 
 
 # BuildingType.Sections.Section.Roofs.Roof.RoofID.SkylightIDs.SkylightID.PercentSkylightArea
@@ -937,14 +1247,14 @@ class SectionType(BSElement):
     """The type of section such as Whole building, Space function data, or other types. * Whole building - describes the whole building, Space function - describes a space function (refer to SPC 211 Standard for Commercial Building Energy Audits), Component - describes a subspace of a primary premises such as HVAC zone, retails shops in a mall, etc., Tenant - describes a section for a tenant, Virtual - describes a section loosely with potentially overlap with other sections and section types, Other - not well-described by other types."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Whole building",
         "Space function",
         "Component",
         "Tenant",
         "Virtual",
         "Other",
-    ]
+    )
 
 
 # BuildingType.Sections.Section.FootprintShape
@@ -952,7 +1262,7 @@ class FootprintShape(BSElement):
     """General shape of the section of the building as a footprint defined in the BuildingSync Geometry Reference Sheet."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Rectangular",
         "L-Shape",
         "U-Shape",
@@ -961,7 +1271,7 @@ class FootprintShape(BSElement):
         "O-Shape",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # BuildingType.Sections.Section.NumberOfSides
@@ -983,13 +1293,13 @@ class ThermalZoneLayout(BSElement):
     """Type of zoning used for space conditioning."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Perimeter",
         "Perimeter and core",
         "Single zone",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # BuildingType.Sections.Section.PerimeterZoneDepth
@@ -1067,14 +1377,14 @@ class HeatLowered(BSElement):
     """Times when the HVAC equipment is setback. For example, when the heat is lowered during the heating season, or the cooling setpoint increased during the cooling season."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "During the day",
         "At night",
         "During sleeping and unoccupied hours",
         "Never / rarely",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # ThermalZoneType.SetpointTemperatureCooling
@@ -1096,7 +1406,7 @@ class ACAdjusted(BSElement):
     """Times when the HVAC equipment is setback. For example, when the heat is lowered during the heating season, or the cooling setpoint increased during the cooling season."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "During the day",
         "At night",
         "During sleeping and unoccupied hours",
@@ -1104,7 +1414,7 @@ class ACAdjusted(BSElement):
         "Never-rarely",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # ThermalZoneType.DeliveryIDs.DeliveryID
@@ -1112,9 +1422,7 @@ class DeliveryID(BSElement):
     """ID number of HVAC delivery systems supporting the zone."""
 
 
-DeliveryID.element_attributes = [
-    "IDref",  # IDREF
-]
+DeliveryID.element_attributes = ("IDref",)  # IDREF
 
 
 # ThermalZoneType.HVACScheduleIDs.HVACScheduleID
@@ -1122,9 +1430,7 @@ class HVACScheduleID(BSElement):
     """ID numbers of the heating, cooling, or other HVAC schedules associated with the zone."""
 
 
-HVACScheduleID.element_attributes = [
-    "IDref",  # IDREF
-]
+HVACScheduleID.element_attributes = ("IDref",)  # IDREF
 
 
 # SpaceType.OccupantsActivityLevel
@@ -1132,7 +1438,7 @@ class OccupantsActivityLevel(BSElement):
     """The activity level that drives the amount of internal gains due to occupants. "Low" corresponds to typical office/retail work (Sensible load 250 Btu/hr, Latent load 200 Btu/hr), "High" corresponds to heavier factory work or gymnasiums (Sensible load 580 Btu/hr, Latent load 870 Btu/hr)."""
 
     element_type = "xs:string"
-    element_enumerations = ["Low", "High", "Unknown"]
+    element_enumerations = ("Low", "High", "Unknown")
 
 
 # SpaceType.DaylitFloorArea
@@ -1168,9 +1474,7 @@ class OccupancyScheduleID(BSElement):
     """ID numbers of the occupancy schedules associated with the space."""
 
 
-OccupancyScheduleID.element_attributes = [
-    "IDref",  # IDREF
-]
+OccupancyScheduleID.element_attributes = ("IDref",)  # IDREF
 
 
 # ScheduleType.SchedulePeriodBeginDate
@@ -1192,7 +1496,7 @@ class DayType(BSElement):
     """Type of day for which the schedule will be specified."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "All week",
         "Weekday",
         "Weekend",
@@ -1204,7 +1508,7 @@ class DayType(BSElement):
         "Wednesday",
         "Thursday",
         "Friday",
-    ]
+    )
 
 
 # ScheduleType.ScheduleDetails.ScheduleDetail.ScheduleCategory
@@ -1212,7 +1516,7 @@ class ScheduleCategory(BSElement):
     """Type of schedule (e.g., occupancy, lighting, heating, etc.) that will be specified."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Business",
         "Occupied",
         "Unoccupied",
@@ -1230,7 +1534,7 @@ class ScheduleCategory(BSElement):
         "Off-peak",
         "Super off-peak",
         "Other",
-    ]
+    )
 
 
 # ScheduleType.ScheduleDetails.ScheduleDetail.DayStartTime
@@ -1280,7 +1584,7 @@ class ContactRole(BSElement):
     """Characterization of the contact."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Premises",
         "Occupant",
         "Agency",
@@ -1322,7 +1626,7 @@ class ContactRole(BSElement):
         "Originator",
         "Submitter",
         "Other",
-    ]
+    )
 
 
 # ContactType.ContactTelephoneNumbers.ContactTelephoneNumber.ContactTelephoneNumberLabel
@@ -1330,7 +1634,7 @@ class ContactTelephoneNumberLabel(BSElement):
     """The type of telephone number, to distinguish between multiple instances of Telephone Number."""
 
     element_type = "xs:string"
-    element_enumerations = ["Days", "Evenings", "Cell", "Other"]
+    element_enumerations = ("Days", "Evenings", "Cell", "Other")
 
 
 # TelephoneNumber
@@ -1345,7 +1649,7 @@ class ContactEmailAddressLabel(BSElement):
     """The type of email address, to distinguish between multiple instances of Email Address."""
 
     element_type = "xs:string"
-    element_enumerations = ["Personal", "Work", "Other"]
+    element_enumerations = ("Personal", "Work", "Other")
 
 
 # EmailAddress
@@ -1367,7 +1671,7 @@ class TenantTelephoneNumberLabel(BSElement):
     """The type of telephone number, to distinguish between multiple instances of Telephone Number."""
 
     element_type = "xs:string"
-    element_enumerations = ["Days", "Evenings", "Cell", "Other"]
+    element_enumerations = ("Days", "Evenings", "Cell", "Other")
 
 
 # TenantType.TenantEmailAddresses.TenantEmailAddress.TenantEmailAddressLabel
@@ -1375,7 +1679,7 @@ class TenantEmailAddressLabel(BSElement):
     """The type of email address, to distinguish between multiple instances of Email Address."""
 
     element_type = "xs:string"
-    element_enumerations = ["Personal", "Work", "Other"]
+    element_enumerations = ("Personal", "Work", "Other")
 
 
 # TenantType.ContactIDs.ContactID
@@ -1383,9 +1687,7 @@ class ContactID(BSElement):
     pass
 
 
-ContactID.element_attributes = [
-    "IDref",  # IDREF
-]
+ContactID.element_attributes = ("IDref",)  # IDREF
 
 
 # AuditCycleType.AuditCycleName
@@ -1435,7 +1737,7 @@ class TemporalStatus(BSElement):
     """Temporal characteristic of this measurement."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Pre retrofit",
         "Post retrofit",
         "Baseline",
@@ -1451,7 +1753,7 @@ class TemporalStatus(BSElement):
         "Previous day",
         "Previous day last year",
         "Other",
-    ]
+    )
 
 
 # ScenarioType.Normalization
@@ -1459,13 +1761,13 @@ class Normalization(BSElement):
     """Normalization criteria to shift or scaled the measurement, where the intention is that these normalized values allow the comparison of corresponding normalized values for different datasets."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "National Median",
         "Regional Median",
         "Adjusted to specific year",
         "Weather normalized",
         "Other",
-    ]
+    )
 
 
 # ScenarioType.AnnualHeatingDegreeDays
@@ -1508,7 +1810,7 @@ class CodeName(BSElement):
     """The name of an energy efficiency code or standard that is applied to building construction requirements."""
 
     element_type = "xs:string"
-    element_enumerations = ["ASHRAE", "IECC", "California Title 24", "IgCC", "Other"]
+    element_enumerations = ("ASHRAE", "IECC", "California Title 24", "IgCC", "Other")
 
 
 # ScenarioType.ScenarioType.Benchmark.BenchmarkType.CodeMinimum.CodeVersion
@@ -1544,14 +1846,14 @@ class BenchmarkTool(BSElement):
     """Benchmarking tools provide a performance ranking based on a peer group of similar buildings."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Portfolio Manager",
         "Buildings Performance Database Tool",
         "EnergyIQ",
         "Labs21",
         "Fabs21",
         "Other",
-    ]
+    )
 
 
 # ScenarioType.ScenarioType.Benchmark.BenchmarkYear
@@ -1571,9 +1873,7 @@ class ReferenceCase(BSElement):
     """ID number for scenario that serves as the reference case for calculating energy savings, simple payback, etc."""
 
 
-ReferenceCase.element_attributes = [
-    "IDref",  # IDREF
-]
+ReferenceCase.element_attributes = ("IDref",)  # IDREF
 
 
 # AnnualSavingsSiteEnergy
@@ -1677,7 +1977,7 @@ class InternalRateOfReturn(BSElement):
 # LowMedHigh
 class LowMedHigh(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Low", "Medium", "High"]
+    element_enumerations = ("Low", "Medium", "High")
 
 
 # ScenarioType.ScenarioType.PackageOfMeasures.SimpleImpactAnalysis.EstimatedAnnualSavings
@@ -1702,7 +2002,7 @@ class CostCategory(BSElement):
     """Classification of the cost of the package (per SPC 211 Standard for Commercial Building Energy Audits sections 5.3.5 and 5.3.6)"""
 
     element_type = "xs:string"
-    element_enumerations = ["Low-Cost or No-Cost", "Capital"]
+    element_enumerations = ("Low-Cost or No-Cost", "Capital")
 
 
 # AnnualDemandSavingsCost
@@ -1808,7 +2108,7 @@ class CostEffectivenessScreeningMethod(BSElement):
     """Method for calculating cost-effectiveness for measures or project."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Simple payback",
         "Return on investment",
         "Lifecycle cost",
@@ -1818,7 +2118,7 @@ class CostEffectivenessScreeningMethod(BSElement):
         "Levelized cost of energy",
         "Savings to investment ratio",
         "Other",
-    ]
+    )
 
 
 # ScenarioType.ScenarioType.PackageOfMeasures.NonquantifiableFactors
@@ -1847,7 +2147,7 @@ class WeatherDataSource(BSElement):
     """Method for determining weather data associated with the time series."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "On Site Measurement",
         "Weather Station",
         "TMY",
@@ -1857,7 +2157,7 @@ class WeatherDataSource(BSElement):
         "CWEC",
         "CZRV2",
         "Other",
-    ]
+    )
 
 
 # ScenarioType.WeatherType.AdjustedToYear.WeatherYear
@@ -1872,9 +2172,7 @@ class Actual(BSElement):
     pass
 
 
-Actual.element_children = [
-    ("WeatherDataSource", WeatherDataSource),
-]
+Actual.element_children = (("WeatherDataSource", WeatherDataSource),)
 
 
 # OtherType
@@ -1887,13 +2185,13 @@ class MeteringConfiguration(BSElement):
     """The structure of how the various meters are arranged."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Direct metering",
         "Master meter without sub metering",
         "Master meter with sub metering",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # UtilityType.TypeOfResourceMeter
@@ -1901,7 +2199,7 @@ class TypeOfResourceMeter(BSElement):
     """Meters can be divided into several categories based on their capabilities."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Revenue grade meter",
         "Advanced resource meter",
         "Analog",
@@ -1914,7 +2212,7 @@ class TypeOfResourceMeter(BSElement):
         "PDU output meter",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # UtilityType.FuelInterruptibility
@@ -1922,7 +2220,7 @@ class FuelInterruptibility(BSElement):
     """This refers to the practice of supplementing fuel (electricity, natural gas, fuel oil.) by other means when there are interruptions in supply from the utility."""
 
     element_type = "xs:string"
-    element_enumerations = ["Interruptible", "Firm", "Other", "Unknown"]
+    element_enumerations = ("Interruptible", "Firm", "Other", "Unknown")
 
 
 # UtilityType.EIAUtilityID
@@ -2119,7 +2417,7 @@ class TierDirection(BSElement):
     """Whether the rates increase or decrease as energy use increases."""
 
     element_type = "xs:string"
-    element_enumerations = ["Increasing", "Decreasing", "Other"]
+    element_enumerations = ("Increasing", "Decreasing", "Other")
 
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.RealTimePricing
@@ -2161,7 +2459,7 @@ class RateStructureSector(BSElement):
     """Sector to which the rate structure is applicable."""
 
     element_type = "xs:string"
-    element_enumerations = ["Residential", "Commercial", "Industrial", "Other"]
+    element_enumerations = ("Residential", "Commercial", "Industrial", "Other")
 
 
 # UtilityType.RateSchedules.RateSchedule.ReferenceForRateStructure
@@ -2232,7 +2530,7 @@ class ResourceBoundary(BSElement):
     """The boundary that encompasses the measured resource."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Site",
         "Source",
         "Onsite",
@@ -2240,7 +2538,7 @@ class ResourceBoundary(BSElement):
         "Net",
         "Gross",
         "Other",
-    ]
+    )
 
 
 # WaterResource
@@ -2248,7 +2546,7 @@ class WaterResource(BSElement):
     """Water type used as a resource on the premises."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Potable water",
         "Wastewater",
         "Greywater",
@@ -2256,7 +2554,7 @@ class WaterResource(BSElement):
         "Captured rainwater",
         "Alternative water",
         "Other",
-    ]
+    )
 
 
 # ResourceUnits
@@ -2264,7 +2562,7 @@ class ResourceUnits(BSElement):
     """Units for resource consumption or generation."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Cubic Meters",
         "kcf",
         "MCF",
@@ -2284,7 +2582,7 @@ class ResourceUnits(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # ResourceUseType.PercentResource
@@ -2299,13 +2597,13 @@ class SharedResourceSystem(BSElement):
     """Situation that applies if a resource is shared with multiple premises, such as shared chilled water among buildings."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Multiple buildings on a single lot",
         "Multiple buildings on multiple lots",
         "Not shared",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # ResourceUseType.PercentEndUse
@@ -2334,7 +2632,7 @@ class PeakResourceUnits(BSElement):
     """Units for peak demand."""
 
     element_type = "xs:string"
-    element_enumerations = ["kW", "MMBtu/day"]
+    element_enumerations = ("kW", "MMBtu/day")
 
 
 # ResourceUseType.AnnualPeakNativeUnits
@@ -2377,9 +2675,7 @@ class ParentResourceUseID(BSElement):
     """If this ResourceUse is intended to represent a submetered end use ('Total Lighting', 'Heating', 'Plug load', etc.), this ResourceUse should link to a parent ResourceUse that this would 'roll up to'."""
 
 
-ParentResourceUseID.element_attributes = [
-    "IDref",  # IDREF
-]
+ParentResourceUseID.element_attributes = ("IDref",)  # IDREF
 
 
 # ResourceUseType.AnnualFuelUseLinkedTimeSeriesIDs.LinkedTimeSeriesID
@@ -2387,9 +2683,7 @@ class LinkedTimeSeriesID(BSElement):
     pass
 
 
-LinkedTimeSeriesID.element_attributes = [
-    "IDref",  # IDREF
-]
+LinkedTimeSeriesID.element_attributes = ("IDref",)  # IDREF
 
 
 # ResourceUseType.UtilityIDs.UtilityID
@@ -2397,9 +2691,7 @@ class UtilityID(BSElement):
     """ID of utility associated with this resource use."""
 
 
-UtilityID.element_attributes = [
-    "IDref",  # IDREF
-]
+UtilityID.element_attributes = ("IDref",)  # IDREF
 
 
 # ResourceUseType.Emissions.Emission.EmissionsLinkedTimeSeriesIDs.EmissionsLinkedTimeSeriesID
@@ -2407,9 +2699,7 @@ class EmissionsLinkedTimeSeriesID(BSElement):
     pass
 
 
-EmissionsLinkedTimeSeriesID.element_attributes = [
-    "IDref",  # IDREF
-]
+EmissionsLinkedTimeSeriesID.element_attributes = ("IDref",)  # IDREF
 
 
 # ResourceUseType.Emissions.Emission.EmissionBoundary
@@ -2417,7 +2707,7 @@ class EmissionBoundary(BSElement):
     """The boundary that encompasses the measured emissions."""
 
     element_type = "xs:string"
-    element_enumerations = ["Direct", "Indirect", "Net", "Other"]
+    element_enumerations = ("Direct", "Indirect", "Net", "Other")
 
 
 # ResourceUseType.Emissions.Emission.EmissionsType
@@ -2425,7 +2715,7 @@ class EmissionsType(BSElement):
     """Category of greenhouse gas or other emission."""
 
     element_type = "xs:string"
-    element_enumerations = ["CO2e", "CO2", "CH4", "N2O", "NOx", "SO2", "Other"]
+    element_enumerations = ("CO2e", "CO2", "CH4", "N2O", "NOx", "SO2", "Other")
 
 
 # ResourceUseType.Emissions.Emission.EmissionsFactor
@@ -2440,7 +2730,7 @@ class EmissionsFactorSource(BSElement):
     """Data source for emissions factors."""
 
     element_type = "xs:string"
-    element_enumerations = ["US EIA", "US EPA", "Utility", "Other"]
+    element_enumerations = ("US EIA", "US EPA", "Utility", "Other")
 
 
 # ResourceUseType.Emissions.Emission.GHGEmissions
@@ -2609,7 +2899,7 @@ class ReadingType(BSElement):
     """Type of data recorded by the meter or other source."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Point",
         "Median",
         "Average",
@@ -2619,7 +2909,7 @@ class ReadingType(BSElement):
         "Load factor",
         "Cost",
         "Unknown",
-    ]
+    )
 
 
 # TimeSeriesType.PeakType
@@ -2627,7 +2917,7 @@ class PeakType(BSElement):
     """When ReadingType is "Peak", this element specifies when the peak occurred."""
 
     element_type = "xs:string"
-    element_enumerations = ["On-peak", "Off-peak", "Mid-peak", "Unknown"]
+    element_enumerations = ("On-peak", "Off-peak", "Mid-peak", "Unknown")
 
 
 # TimeSeriesType.TimeSeriesReadingQuantity
@@ -2635,7 +2925,7 @@ class TimeSeriesReadingQuantity(BSElement):
     """Type of energy, water, power, weather metric included in the time series."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Currency",
         "Cost",
         "Current",
@@ -2659,7 +2949,7 @@ class TimeSeriesReadingQuantity(BSElement):
         "Wet Bulb Temperature",
         "Wind Speed",
         "Other",
-    ]
+    )
 
 
 # StartTimestamp
@@ -2695,7 +2985,7 @@ class Phase(BSElement):
     """Phase information associated with electricity readings."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Phase AN",
         "Phase A",
         "Phase AB",
@@ -2714,7 +3004,7 @@ class Phase(BSElement):
         "Phase S1S2N",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # TimeSeriesType.EnergyFlowDirection
@@ -2722,7 +3012,7 @@ class EnergyFlowDirection(BSElement):
     """Direction associated with current related time series data."""
 
     element_type = "xs:string"
-    element_enumerations = ["Forward", "Reverse", "Unknown"]
+    element_enumerations = ("Forward", "Reverse", "Unknown")
 
 
 # TimeSeriesType.HeatingDegreeDays
@@ -2744,9 +3034,7 @@ class ResourceUseID(BSElement):
     """ID number of resource use that this time series contributes to. This field is not used for non-energy data such as weather."""
 
 
-ResourceUseID.element_attributes = [
-    "IDref",  # IDREF
-]
+ResourceUseID.element_attributes = ("IDref",)  # IDREF
 
 
 # TimeSeriesType.WeatherStationID
@@ -2754,9 +3042,7 @@ class WeatherStationID(BSElement):
     """ID number of weather station this time series contributes to."""
 
 
-WeatherStationID.element_attributes = [
-    "IDref",  # IDREF
-]
+WeatherStationID.element_attributes = ("IDref",)  # IDREF
 
 
 # IntervalFrequencyType
@@ -2764,7 +3050,7 @@ class IntervalFrequencyType(BSElement):
     """Indicates frequency of data that's available for a given variable. Data that's available can range from 1 minute interval to annual. This interval frequency can be applied to resource or other time series data like weather."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "1 minute",
         "10 minute",
         "15 minute",
@@ -2777,7 +3063,7 @@ class IntervalFrequencyType(BSElement):
         "Quarter",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # MeasureType.SystemCategoryAffected
@@ -2785,7 +3071,7 @@ class SystemCategoryAffected(BSElement):
     """Category of building system(s) affected by the measure. In some cases a single measure may include multiple components affecting multiple systems."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Air Distribution",
         "Heating System",
         "Cooling System",
@@ -2814,7 +3100,7 @@ class SystemCategoryAffected(BSElement):
         "Pool",
         "Water Use",
         "Other",
-    ]
+    )
 
 
 # MeasureType.MeasureScaleOfApplication
@@ -2822,7 +3108,7 @@ class MeasureScaleOfApplication(BSElement):
     """Scale at which the measure is applied, such as an individual system, multiple systems, or entire facility."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Individual system",
         "Multiple systems",
         "Individual premise",
@@ -2832,7 +3118,7 @@ class MeasureScaleOfApplication(BSElement):
         "Entire building",
         "Common areas",
         "Tenant areas",
-    ]
+    )
 
 
 # MeasureType.CustomMeasureName
@@ -2854,14 +3140,14 @@ class MVOption(BSElement):
     """Recommended approach for verification of energy savings for this measure, based on the International Performance Measurement and Verification Protocol (IPMVP)."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Option A: Retrofit Isolation With Partial Measurement",
         "Option B: Retrofit Isolation With Full Measurement",
         "Option C: Whole Building Measurement",
         "Option D: Calibrated Simulation",
         "Combination",
         "Other",
-    ]
+    )
 
 
 # MeasureType.UsefulLife
@@ -2932,7 +3218,7 @@ class ImplementationStatus(BSElement):
     """Implementation status of measure."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Proposed",
         "Evaluated",
         "Selected",
@@ -2945,7 +3231,7 @@ class ImplementationStatus(BSElement):
         "Unsatisfactory",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # MeasureType.DiscardReason
@@ -2953,7 +3239,7 @@ class DiscardReason(BSElement):
     """Reason why the proposed measure was discarded, if appropriate."""
 
     element_type = "xs:string"
-    element_enumerations = ["Long payback", "Requires permit", "Other", "Unknown"]
+    element_enumerations = ("Long payback", "Requires permit", "Other", "Unknown")
 
 
 # MeasureType.TypeOfMeasure.Replacements.Replacement.ExistingSystemReplaced
@@ -2961,9 +3247,7 @@ class ExistingSystemReplaced(BSElement):
     """ID numbers of any existing systems replaced by the measure."""
 
 
-ExistingSystemReplaced.element_attributes = [
-    "IDref",  # IDREF
-]
+ExistingSystemReplaced.element_attributes = ("IDref",)  # IDREF
 
 
 # MeasureType.TypeOfMeasure.Replacements.Replacement.AlternativeSystemReplacement
@@ -2971,9 +3255,7 @@ class AlternativeSystemReplacement(BSElement):
     """ID numbers of alternative systems that would replace the existing systems."""
 
 
-AlternativeSystemReplacement.element_attributes = [
-    "IDref",  # IDREF
-]
+AlternativeSystemReplacement.element_attributes = ("IDref",)  # IDREF
 
 
 # ExistingScheduleAffected
@@ -2981,9 +3263,7 @@ class ExistingScheduleAffected(BSElement):
     """ID numbers of schedules replaced by the measure."""
 
 
-ExistingScheduleAffected.element_attributes = [
-    "IDref",  # IDREF
-]
+ExistingScheduleAffected.element_attributes = ("IDref",)  # IDREF
 
 
 # ModifiedSchedule
@@ -2991,9 +3271,7 @@ class ModifiedSchedule(BSElement):
     """ID numbers of schedules associated with the improved systems."""
 
 
-ModifiedSchedule.element_attributes = [
-    "IDref",  # IDREF
-]
+ModifiedSchedule.element_attributes = ("IDref",)  # IDREF
 
 
 # MeasureType.TypeOfMeasure.ModificationRetrocommissions.ModificationRetrocommissioning.ExistingSystemAffected
@@ -3001,9 +3279,7 @@ class ExistingSystemAffected(BSElement):
     """ID numbers of any existing systems affected by the measure."""
 
 
-ExistingSystemAffected.element_attributes = [
-    "IDref",  # IDREF
-]
+ExistingSystemAffected.element_attributes = ("IDref",)  # IDREF
 
 
 # MeasureType.TypeOfMeasure.ModificationRetrocommissions.ModificationRetrocommissioning.ModifiedSystem
@@ -3011,9 +3287,7 @@ class ModifiedSystem(BSElement):
     """ID numbers of alternative systems that represent "improvements" to existing systems."""
 
 
-ModifiedSystem.element_attributes = [
-    "IDref",  # IDREF
-]
+ModifiedSystem.element_attributes = ("IDref",)  # IDREF
 
 
 # MeasureType.TypeOfMeasure.Additions.Addition.AlternativeSystemAdded
@@ -3021,9 +3295,7 @@ class AlternativeSystemAdded(BSElement):
     """ID numbers of alternative systems that would be added as part of the measure."""
 
 
-AlternativeSystemAdded.element_attributes = [
-    "IDref",  # IDREF
-]
+AlternativeSystemAdded.element_attributes = ("IDref",)  # IDREF
 
 
 # MeasureType.TypeOfMeasure.Removals.Removal.ExistingSystemRemoved
@@ -3031,9 +3303,7 @@ class ExistingSystemRemoved(BSElement):
     """ID numbers of any existing systems removed as part of the measure."""
 
 
-ExistingSystemRemoved.element_attributes = [
-    "IDref",  # IDREF
-]
+ExistingSystemRemoved.element_attributes = ("IDref",)  # IDREF
 
 
 # MeasureType.MeasureSavingsAnalysis.MeasureRank
@@ -3055,7 +3325,7 @@ class AuditFilingStatus(BSElement):
     """The status of an audit filing, used to clarify whether or not this audit report is an initial submission (Initial filing) or an amendment to a previously submitted report (Amended filing)."""
 
     element_type = "xs:string"
-    element_enumerations = ["Initial filing", "Amended filing"]
+    element_enumerations = ("Initial filing", "Amended filing")
 
 
 # ReportType.EarlyCompliance
@@ -3070,12 +3340,12 @@ class ASHRAEAuditLevel(BSElement):
     """Energy audit level as defined in SPC 211 Standard for Commercial Building Energy Audits."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Preliminary Energy-Use Analysis",
         "Level 1: Walk-through",
         "Level 2: Energy Survey and Analysis",
         "Level 3: Detailed Survey and Analysis",
-    ]
+    )
 
 
 # ReportType.RetrocommissioningAudit
@@ -3146,14 +3416,14 @@ class AuditExemption(BSElement):
     """Conditions under which the building is exempt from a mandated audit."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "EPA ENERGY STAR certified",
         "LEED certified",
         "Simple building",
         "Class 1 building",
         "Other",
         "None",
-    ]
+    )
 
 
 # ReportType.AuditorContactID
@@ -3161,9 +3431,7 @@ class AuditorContactID(BSElement):
     """Contact ID of auditor responsible for the audit report."""
 
 
-AuditorContactID.element_attributes = [
-    "IDref",  # IDREF
-]
+AuditorContactID.element_attributes = ("IDref",)  # IDREF
 
 
 # ReportType.AuditDates.AuditDate.Date
@@ -3178,7 +3446,7 @@ class DateType(BSElement):
     """Type of AuditDate."""
 
     element_type = "xs:string"
-    element_enumerations = ["Site Visit", "Conducted", "Completion", "Custom", "Other"]
+    element_enumerations = ("Site Visit", "Conducted", "Completion", "Custom", "Other")
 
 
 # ReportType.AuditDates.AuditDate.CustomDateType
@@ -3199,7 +3467,7 @@ class EscalationRate(BSElement):
 class AuditorQualificationType(BSElement):
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "AABC Commissioning Group (ACG) Commissioning Authority (CxA)",
         "ASHRAE Building Commissioning Professional (BCxP)",
         "ASHRAE Building Energy Assessment Professional (BEAP)",
@@ -3276,13 +3544,13 @@ class AuditorQualificationType(BSElement):
         "University of Wisconsin Accredited Green Commissioning Process Provider (GCxP or GCP)"
         "Other",
         "None",
-    ]
+    )
 
 
 # State
 class State(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "AA",
         "AE",
         "AL",
@@ -3358,7 +3626,7 @@ class State(BSElement):
         "NT",
         "NU",
         "YT",
-    ]
+    )
 
 
 # ReportType.Qualifications.Qualification.AuditTeamMemberCertificationType
@@ -3385,9 +3653,7 @@ class CertifiedAuditTeamMemberContactID(BSElement):
     """Contact ID of auditor team member with certification."""
 
 
-CertifiedAuditTeamMemberContactID.element_attributes = [
-    "IDref",  # IDREF
-]
+CertifiedAuditTeamMemberContactID.element_attributes = ("IDref",)  # IDREF
 
 # ReportType.Qualifications.Qualification.AuditorYearsOfExperience
 class AuditorYearsOfExperience(BSElement):
@@ -3401,7 +3667,7 @@ class Location(BSElement):
     """Location of system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Roof",
         "Mechanical Room",
         "Mechanical Floor",
@@ -3413,7 +3679,7 @@ class Location(BSElement):
         "Attic",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # Priority
@@ -3421,7 +3687,7 @@ class Priority(BSElement):
     """Order of precedence relative to other applicable systems. Enter Primary if this is the only system."""
 
     element_type = "xs:string"
-    element_enumerations = ["Primary", "Secondary", "Tertiary", "Back-up", "Other"]
+    element_enumerations = ("Primary", "Secondary", "Tertiary", "Back-up", "Other")
 
 
 # HVACSystemType.FrequencyOfMaintenance
@@ -3429,7 +3695,7 @@ class FrequencyOfMaintenance(BSElement):
     """Frequency of maintenance on the premises or equipment."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "As needed",
         "Daily",
         "Weekly",
@@ -3440,7 +3706,7 @@ class FrequencyOfMaintenance(BSElement):
         "Semi-annually",
         "Annually",
         "Unknown",
-    ]
+    )
 
 
 # HVACSystemType.PrimaryHVACSystemType
@@ -3448,7 +3714,7 @@ class PrimaryHVACSystemType(BSElement):
     """Primary HVAC type. WARNING: This element is being deprecated, use PrincipalHVACSystemType instead."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Packaged Terminal Air Conditioner",
         "Four Pipe Fan Coil Unit",
         "Packaged Terminal Heat Pump",
@@ -3466,7 +3732,7 @@ class PrimaryHVACSystemType(BSElement):
         "VRF Terminal Unit",
         "Chilled Beam",
         "Other",
-    ]
+    )
 
 
 # PrincipalHVACSystemType
@@ -3474,7 +3740,7 @@ class PrincipalHVACSystemType(BSElement):
     """Principal HVAC type."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Packaged Terminal Air Conditioner",
         "Four Pipe Fan Coil Unit",
         "Packaged Terminal Heat Pump",
@@ -3492,7 +3758,7 @@ class PrincipalHVACSystemType(BSElement):
         "VRF Terminal Unit",
         "Chilled Beam",
         "Other",
-    ]
+    )
 
 
 # Quantity
@@ -3507,7 +3773,7 @@ class FurnaceType(BSElement):
     """General type of furnace used for space heating."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Warm air",
         "Fireplace",
         "Heating stove",
@@ -3515,7 +3781,7 @@ class FurnaceType(BSElement):
         "Individual space heater",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # BurnerType
@@ -3523,14 +3789,14 @@ class BurnerType(BSElement):
     """Type of burner on boiler or furnace, if applicable."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Atmospheric",
         "Power",
         "Sealed Combustion",
         "Rotary Cup",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # BurnerControlType
@@ -3538,14 +3804,14 @@ class BurnerControlType(BSElement):
     """Control type of burner, if applicable."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Full Modulation Manual",
         "Full Modulation Automatic",
         "Step Modulation",
         "High Low",
         "On Off",
         "Unknown",
-    ]
+    )
 
 
 # BurnerQuantity
@@ -3574,12 +3840,12 @@ class IgnitionType(BSElement):
     """Ignition mechanism in gas heating equipment. Either pilot light or an intermittent ignition device (IID)."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Intermittent ignition device",
         "Pilot light",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DraftType
@@ -3587,13 +3853,13 @@ class DraftType(BSElement):
     """Draft mechanism used for drawing air through the boiler or furnace."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Natural",
         "Mechanical forced",
         "Mechanical induced",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DraftBoundary
@@ -3601,7 +3867,7 @@ class DraftBoundary(BSElement):
     """The boundary that encompasses the draft mechanism used for drawing air through the boiler or furnace."""
 
     element_type = "xs:string"
-    element_enumerations = ["Direct", "Direct indirect", "Indirect", "Other"]
+    element_enumerations = ("Direct", "Direct indirect", "Indirect", "Other")
 
 
 # CondensingOperation
@@ -3609,13 +3875,13 @@ class CondensingOperation(BSElement):
     """The capability of the boiler or furnace to condense water vapor in the exhaust flue gas to obtain a higher efficiency."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Condensing",
         "Near-Condensing",
         "Non-Condensing",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CombustionEfficiency
@@ -3637,7 +3903,7 @@ class ThirdPartyCertification(BSElement):
     """Independent organization has verified that product or appliance meets or exceeds the standard in question (ENERGY STAR, CEE, or other)."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "ENERGY STAR",
         "ENERGY STAR Most Efficient",
         "FEMP Designated",
@@ -3647,13 +3913,13 @@ class ThirdPartyCertification(BSElement):
         "Other",
         "None",
         "Unknown",
-    ]
+    )
 
 
 # FuelTypes
 class FuelTypes(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Electricity",
         "Electricity-Exported",
         "Electricity-Onsite generated",
@@ -3705,7 +3971,7 @@ class FuelTypes(BSElement):
         "Other metered-Onsite generated",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # HVACSystemType.HeatingAndCoolingSystems.HeatingSources.HeatingSource.HeatingSourceType.HeatPump.HeatPumpType
@@ -3713,13 +3979,13 @@ class HeatPumpType(BSElement):
     """General type of heat pump used for space heating."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Split",
         "Packaged Terminal",
         "Packaged Unitary",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # HVACSystemType.HeatingAndCoolingSystems.HeatingSources.HeatingSource.HeatingSourceType.HeatPump.HeatPumpBackupHeatingSwitchoverTemperature
@@ -3741,9 +4007,7 @@ class CoolingSourceID(BSElement):
     """ID number of the associated CoolingSource."""
 
 
-CoolingSourceID.element_attributes = [
-    "IDref",  # IDREF
-]
+CoolingSourceID.element_attributes = ("IDref",)  # IDREF
 
 
 # HVACSystemType.HeatingAndCoolingSystems.HeatingSources.HeatingSource.HeatingSourceType.HeatPump.LinkedHeatingPlantID
@@ -3751,9 +4015,7 @@ class LinkedHeatingPlantID(BSElement):
     """ID number of HeatingPlant serving as the source for this heat pump."""
 
 
-LinkedHeatingPlantID.element_attributes = [
-    "IDref",  # IDREF
-]
+LinkedHeatingPlantID.element_attributes = ("IDref",)  # IDREF
 
 
 # HVACSystemType.HeatingAndCoolingSystems.HeatingSources.HeatingSource.HeatingSourceType.SourceHeatingPlantID
@@ -3761,9 +4023,7 @@ class SourceHeatingPlantID(BSElement):
     """ID number of HeatingPlant serving as the source for this zonal system."""
 
 
-SourceHeatingPlantID.element_attributes = [
-    "IDref",  # IDREF
-]
+SourceHeatingPlantID.element_attributes = ("IDref",)  # IDREF
 
 
 # OutputCapacity
@@ -3783,7 +4043,7 @@ class HeatingMedium(BSElement):
     """Medium used to transport heat from a central heating system to individual zones."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Hot water",
         "Steam",
         "Refrigerant",
@@ -3791,7 +4051,7 @@ class HeatingMedium(BSElement):
         "Glycol",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # AnnualHeatingEfficiencyValue
@@ -3806,14 +4066,14 @@ class AnnualHeatingEfficiencyUnits(BSElement):
     """The measure used to quantify efficiency."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "COP",
         "AFUE",
         "HSPF",
         "Thermal Efficiency",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # InputCapacity
@@ -3828,7 +4088,7 @@ class CapacityUnits(BSElement):
     """Units used to measure capacity."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "cfh",
         "ft3/min",
         "kcf/h",
@@ -3851,7 +4111,7 @@ class CapacityUnits(BSElement):
         "Mlbs/h",
         "Cooling ton",
         "Other",
-    ]
+    )
 
 
 # HeatingStaging
@@ -3859,14 +4119,14 @@ class HeatingStaging(BSElement):
     """The method of heating staging used by the unit. Select "Single Stage" for units with single stage (on/off) control. Select "Multiple, Discrete Stages" for units with multiple discrete stages (low-fire / high-fire). Select "Modulating" for units which contain modulating burners."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Single stage",
         "Multiple discrete stages",
         "Variable",
         "Modulating",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # NumberOfHeatingStages
@@ -3921,7 +4181,7 @@ class DXSystemType(BSElement):
     """General type of heat pump used for space heating."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Split DX air conditioner",
         "Packaged terminal air conditioner (PTAC)",
         "Split heat pump",
@@ -3933,7 +4193,7 @@ class DXSystemType(BSElement):
         "Single package vertical heat pump",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # HVACSystemType.HeatingAndCoolingSystems.CoolingSources.CoolingSource.CoolingSourceType.DX.CompressorType
@@ -3941,14 +4201,14 @@ class CompressorType(BSElement):
     """Type of compressor in the chiller."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Reciprocating",
         "Screw",
         "Scroll",
         "Centrifugal",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CompressorStaging
@@ -3956,14 +4216,14 @@ class CompressorStaging(BSElement):
     """The compressor staging for the unit. Select "Single Stage" for units with single stage (on/off) control. Select "Multiple, Discrete Stages" for units with multiple compressors, discrete unloading stages, or compressors with stepped speed motors that are controlled to operate at discrete stages. Select "Variable" for compressors that operate at variable speeds or with modulating unloading."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Single stage",
         "Multiple discrete stages",
         "Variable",
         "Modulating",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # Refrigerant
@@ -3971,7 +4231,7 @@ class Refrigerant(BSElement):
     """The type of refrigerant used in the system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "R134a",
         "R123",
         "R22",
@@ -3991,7 +4251,7 @@ class Refrigerant(BSElement):
         "R718",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # RefrigerantChargeFactor
@@ -4013,7 +4273,7 @@ class EvaporativeCoolingType(BSElement):
     """Defines the type of evaporative cooler operation."""
 
     element_type = "xs:string"
-    element_enumerations = ["Direct", "Direct indirect", "Indirect", "Other"]
+    element_enumerations = ("Direct", "Direct indirect", "Indirect", "Other")
 
 
 # HVACSystemType.HeatingAndCoolingSystems.CoolingSources.CoolingSource.CoolingSourceType.CoolingPlantID
@@ -4021,9 +4281,7 @@ class CoolingPlantID(BSElement):
     """ID number of CoolingPlant serving as the source for this zonal system."""
 
 
-CoolingPlantID.element_attributes = [
-    "IDref",  # IDREF
-]
+CoolingPlantID.element_attributes = ("IDref",)  # IDREF
 
 # HVACSystemType.HeatingAndCoolingSystems.CoolingSources.CoolingSource.CoolingSourceCondition
 class CoolingSourceCondition(EquipmentCondition):
@@ -4035,14 +4293,14 @@ class CoolingMedium(BSElement):
     """Medium used to transport cooling energy from a central cooling system to individual zones."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Chilled water",
         "Refrigerant",
         "Air",
         "Glycol",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # AnnualCoolingEfficiencyValue
@@ -4057,7 +4315,7 @@ class AnnualCoolingEfficiencyUnits(BSElement):
     """The measure used to quantify efficiency."""
 
     element_type = "xs:string"
-    element_enumerations = ["COP", "EER", "SEER", "kW/ton", "Other"]
+    element_enumerations = ("COP", "EER", "SEER", "kW/ton", "Other")
 
 
 # Capacity
@@ -4086,7 +4344,7 @@ class ConvectionType(BSElement):
     """Type of convection equipment used for heating and cooling at the zone."""
 
     element_type = "xs:string"
-    element_enumerations = ["Perimeter baseboard", "Chilled beam", "Other", "Unknown"]
+    element_enumerations = ("Perimeter baseboard", "Chilled beam", "Other", "Unknown")
 
 
 # PipeInsulationThickness
@@ -4106,7 +4364,7 @@ class PipeLocation(BSElement):
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType.ZoneEquipment.Radiant.RadiantType
 class RadiantType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Radiator", "Radiant floor or ceiling", "Other", "Unknown"]
+    element_enumerations = ("Radiator", "Radiant floor or ceiling", "Other", "Unknown")
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType.CentralAirDistribution.AirDeliveryType
@@ -4114,14 +4372,14 @@ class AirDeliveryType(BSElement):
     """Method for delivering air for heating and cooling to the zone."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Central fan",
         "Induction units",
         "Low pressure under floor",
         "Local fan",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType.CentralAirDistribution.TerminalUnit
@@ -4129,7 +4387,7 @@ class TerminalUnit(BSElement):
     """Type of terminal unit serving each zone of a central air distribution system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "CAV terminal box no reheat",
         "CAV terminal box with reheat",
         "VAV terminal box fan powered no reheat",
@@ -4142,7 +4400,7 @@ class TerminalUnit(BSElement):
         "Uncontrolled register",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType.CentralAirDistribution.ReheatSource
@@ -4150,14 +4408,14 @@ class ReheatSource(BSElement):
     """Energy source used to provide reheat energy at a terminal unit."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Heating plant",
         "Local electric resistance",
         "Local gas",
         "None",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType.CentralAirDistribution.ReheatControlMethod
@@ -4165,7 +4423,7 @@ class ReheatControlMethod(BSElement):
     """The air/temperature control strategy for VAV systems with reheat boxes."""
 
     element_type = "xs:string"
-    element_enumerations = ["Dual Maximum", "Single Maximum", "Other", "Unknown"]
+    element_enumerations = ("Dual Maximum", "Single Maximum", "Other", "Unknown")
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType.CentralAirDistribution.ReheatPlantID
@@ -4173,9 +4431,7 @@ class ReheatPlantID(BSElement):
     pass
 
 
-ReheatPlantID.element_attributes = [
-    "IDref",  # IDREF
-]
+ReheatPlantID.element_attributes = ("IDref",)  # IDREF
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryCondition
@@ -4188,9 +4444,7 @@ class HeatingSourceID(BSElement):
     """ID number of the HeatingSource associated with this delivery mechanism."""
 
 
-HeatingSourceID.element_attributes = [
-    "IDref",  # IDREF
-]
+HeatingSourceID.element_attributes = ("IDref",)  # IDREF
 
 
 # HVACSystemType.HeatingAndCoolingSystems.ZoningSystemType
@@ -4198,7 +4452,7 @@ class ZoningSystemType(BSElement):
     """Identifies whether a system is single or multi-zone."""
 
     element_type = "xs:string"
-    element_enumerations = ["Single zone", "Multi zone", "Unknown"]
+    element_enumerations = ("Single zone", "Multi zone", "Unknown")
 
 
 # HVACSystemType.HVACControlSystemTypes.HVACControlSystemType
@@ -4206,7 +4460,7 @@ class HVACControlSystemType(BSElement):
     """HVAC equipment control strategy."""
 
     element_type = "xs:string"
-    element_enumerations = ["Analog", "Digital", "Pneumatic", "Other", "Unknown"]
+    element_enumerations = ("Analog", "Digital", "Pneumatic", "Other", "Unknown")
 
 
 # DuctSystemType.DuctConfiguration
@@ -4214,7 +4468,7 @@ class DuctConfiguration(BSElement):
     """Configuration of ducts."""
 
     element_type = "xs:string"
-    element_enumerations = ["Single", "Dual", "Three", "Ductless", "Other", "Unknown"]
+    element_enumerations = ("Single", "Dual", "Three", "Ductless", "Other", "Unknown")
 
 
 # DuctSystemType.MinimumOutsideAirPercentage
@@ -4243,14 +4497,14 @@ class DuctSealing(BSElement):
     """Condition of duct sealing."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Connections sealed with mastic",
         "No observable leaks",
         "Some observable leaks",
         "Significant leaks",
         "Catastrophic leaks",
         "Unknown",
-    ]
+    )
 
 
 # DuctSystemType.DuctInsulationRValue
@@ -4293,7 +4547,7 @@ class DuctType(BSElement):
     """Type of duct material."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Flex uncategorized",
         "Grey flex",
         "Mylar flex",
@@ -4305,7 +4559,7 @@ class DuctType(BSElement):
         "No ducting",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DuctSystemType.DuctLeakageTestMethod
@@ -4313,13 +4567,13 @@ class DuctLeakageTestMethod(BSElement):
     """Method used to estimate duct leakage."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Duct leakage tester",
         "Blower door subtract",
         "Pressure pan",
         "Visual inspection",
         "Other",
-    ]
+    )
 
 
 # DuctSystemType.DuctPressureTestLeakageRate
@@ -4341,9 +4595,7 @@ class HeatingDeliveryID(BSElement):
     """Heating delivery system supported by the air-distribution system."""
 
 
-HeatingDeliveryID.element_attributes = [
-    "IDref",  # IDREF
-]
+HeatingDeliveryID.element_attributes = ("IDref",)  # IDREF
 
 
 # DuctSystemType.CoolingDeliveryID
@@ -4351,9 +4603,7 @@ class CoolingDeliveryID(BSElement):
     """Cooling delivery system supported by the air-distribution system."""
 
 
-CoolingDeliveryID.element_attributes = [
-    "IDref",  # IDREF
-]
+CoolingDeliveryID.element_attributes = ("IDref",)  # IDREF
 
 
 # InsulationCondition
@@ -4361,7 +4611,7 @@ class InsulationCondition(BSElement):
     """Assessed condition of installed insulation."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Excellent",
         "Good",
         "Average",
@@ -4369,7 +4619,7 @@ class InsulationCondition(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # HeatingPlantType.HeatingPlantCondition
@@ -4382,7 +4632,7 @@ class BoilerType(BSElement):
     """General type of boiler used for space or water heating."""
 
     element_type = "xs:string"
-    element_enumerations = ["Steam", "Hot water", "Other", "Unknown"]
+    element_enumerations = ("Steam", "Hot water", "Other", "Unknown")
 
 
 # HeatingPlantType.Boiler.BoilerInsulationRValue
@@ -4432,7 +4682,7 @@ class HotWaterResetControl(BSElement):
     """Times when the HVAC equipment is setback. For example, when the heat is lowered during the heating season, or the cooling setpoint increased during the cooling season."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "During the day",
         "At night",
         "During sleeping and unoccupied hours",
@@ -4440,7 +4690,7 @@ class HotWaterResetControl(BSElement):
         "Never-rarely",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # SteamBoilerMinimumOperatingPressure
@@ -4469,13 +4719,13 @@ class DistrictHeatingType(BSElement):
     """General type of district heating used for space or water heating."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Hot water",
         "Direct steam",
         "Steam to hot water heat exchanger",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CoolingPlantType.CoolingPlantCondition
@@ -4488,7 +4738,7 @@ class ChillerType(BSElement):
     """Type of chiller."""
 
     element_type = "xs:string"
-    element_enumerations = ["Vapor compression", "Absorption", "Other", "Unknown"]
+    element_enumerations = ("Vapor compression", "Absorption", "Other", "Unknown")
 
 
 # CoolingPlantType.Chiller.ChillerCompressorDriver
@@ -4496,14 +4746,14 @@ class ChillerCompressorDriver(BSElement):
     """Vehicle for driving the compressor used in a chiller."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Electric Motor",
         "Steam",
         "Gas Turbine",
         "Gas Engine",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CoolingPlantType.Chiller.ChillerCompressorType
@@ -4511,14 +4761,14 @@ class ChillerCompressorType(BSElement):
     """Type of compressor in the chiller."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Reciprocating",
         "Screw",
         "Scroll",
         "Centrifugal",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CoolingPlantType.Chiller.AbsorptionHeatSource
@@ -4526,14 +4776,14 @@ class AbsorptionHeatSource(BSElement):
     """Source of heating energy for regeneration."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Steam",
         "Solar energy",
         "Combustion",
         "Waste heat",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CoolingPlantType.Chiller.AbsorptionStages
@@ -4541,7 +4791,7 @@ class AbsorptionStages(BSElement):
     """Number of stages in regeneration process."""
 
     element_type = "xs:string"
-    element_enumerations = ["Single effect", "Double effect", "Other", "Unknown"]
+    element_enumerations = ("Single effect", "Double effect", "Other", "Unknown")
 
 
 # CoolingPlantType.Chiller.ChilledWaterResetControl
@@ -4549,7 +4799,7 @@ class ChilledWaterResetControl(BSElement):
     """Times when the HVAC equipment is setback. For example, when the heat is lowered during the heating season, or the cooling setpoint increased during the cooling season."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "During the day",
         "At night",
         "During sleeping and unoccupied hours",
@@ -4558,7 +4808,7 @@ class ChilledWaterResetControl(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # ChilledWaterSupplyTemperature
@@ -4592,13 +4842,13 @@ class CondenserFanSpeedOperation(BSElement):
     """The condenser fan control option used by the unit. If the unit has several constant-speed condenser fans that stage on in conjunction with multiple compressors, this should be set to "Stepped Speed." """
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Variable Volume",
         "Stepped Speed",
         "Constant Volume",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CondensingTemperature
@@ -4634,7 +4884,7 @@ class WaterSideEconomizerType(BSElement):
     """Describes water flow control for a water-cooled condenser."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Parallel Plate and Frame Heat Exchanger",
         "Series Plate and Frame Heat Exchanger",
         "Strainer Cycle",
@@ -4642,7 +4892,7 @@ class WaterSideEconomizerType(BSElement):
         "None",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # WaterSideEconomizerTemperatureMaximum
@@ -4664,7 +4914,7 @@ class WaterCooledCondenserType(BSElement):
     """Type of water-cooled condenser."""
 
     element_type = "xs:string"
-    element_enumerations = ["Cooling tower", "Other", "Unknown"]
+    element_enumerations = ("Cooling tower", "Other", "Unknown")
 
 
 # CoolingPlant.CondenserType
@@ -4672,7 +4922,7 @@ class CondenserType(BSElement):
     """condenser associated with the cooling plant. The usage of this element is not recommended except for Audit Template use cases. User is recommended to use CondenserPlant instead."""
 
     element_type = "xs:string"
-    element_enumerations = ["Air Cooled", "Water Cooled", "Other", "Unknown"]
+    element_enumerations = ("Air Cooled", "Water Cooled", "Other", "Unknown")
 
 
 # CondenserWaterTemperature
@@ -4687,13 +4937,13 @@ class WaterCooledCondenserFlowControl(BSElement):
     """Describes water flow control for a water-cooled condenser."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Fixed Flow",
         "Two Position Flow",
         "Variable Flow",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CondenserPlantType.WaterCooled.CoolingTowerFanControl
@@ -4701,13 +4951,13 @@ class CoolingTowerFanControl(BSElement):
     """Cooling tower fan control type."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Single Speed",
         "Two Speed",
         "Variable Speed",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CondenserPlantType.WaterCooled.CoolingTowerTemperatureControl
@@ -4715,7 +4965,7 @@ class CoolingTowerTemperatureControl(BSElement):
     """Cooling tower temperature control type."""
 
     element_type = "xs:string"
-    element_enumerations = ["Wet Bulb Reset", "Other", "Unknown"]
+    element_enumerations = ("Wet Bulb Reset", "Other", "Unknown")
 
 
 # CondenserPlantType.WaterCooled.CoolingTowerCellControl
@@ -4723,7 +4973,7 @@ class CoolingTowerCellControl(BSElement):
     """Cooling tower cell control type."""
 
     element_type = "xs:string"
-    element_enumerations = ["Max Cells", "Min Cells", "Other", "Unknown"]
+    element_enumerations = ("Max Cells", "Min Cells", "Other", "Unknown")
 
 
 # CondenserPlantType.WaterCooled.CellCount
@@ -4743,12 +4993,12 @@ class WaterSideEconomizerTemperatureSetpoint(BSElement):
 # CondenserPlantType.GroundSource.GroundSourceType
 class GroundSourceType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Open loop ground water",
         "Closed loop ground source",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CondenserPlantType.GroundSource.WellCount
@@ -4766,13 +5016,13 @@ class Integration(BSElement):
     """Level of integration with primary heating and cooling sources and delivery systems."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Integrated with central air distribution",
         "Integrated with local air distribution",
         "Stand-alone",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OtherHVACSystemType.OtherHVACType.Humidifier.HumidificationType
@@ -4780,7 +5030,7 @@ class HumidificationType(BSElement):
     """Humidification type in air-distribution system."""
 
     element_type = "xs:string"
-    element_enumerations = ["Steam", "Water Spray", "Other", "Unknown"]
+    element_enumerations = ("Steam", "Water Spray", "Other", "Unknown")
 
 
 # OtherHVACSystemType.OtherHVACType.Humidifier.HumidityControlMinimum
@@ -4809,7 +5059,7 @@ class DehumidificationType(BSElement):
     """Dehumidification type in air-distribution system."""
 
     element_type = "xs:string"
-    element_enumerations = ["Desiccant wheel", "Liquid desiccant", "Other", "Unknown"]
+    element_enumerations = ("Desiccant wheel", "Liquid desiccant", "Other", "Unknown")
 
 
 # OtherHVACSystemType.OtherHVACType.Dehumidifier.HumidityControlMaximum
@@ -4824,12 +5074,12 @@ class AirCleaner(BSElement):
     pass
 
 
-AirCleaner.element_children = [
+AirCleaner.element_children = (
     ("Capacity", Capacity),
     ("CapacityUnits", CapacityUnits),
     ("DutyCycle", DutyCycle),
     ("SystemPerformanceRatio", SystemPerformanceRatio),
-]
+)
 
 
 # VentilationRate
@@ -4851,7 +5101,7 @@ class VentilationType(BSElement):
     """Type of ventilation, and use of heat recovery."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Exhaust only",
         "Supply only",
         "Dedicated outdoor air system",
@@ -4860,7 +5110,7 @@ class VentilationType(BSElement):
         "None",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OtherHVACSystemType.OtherHVACType.MechanicalVentilation.DemandControlVentilation
@@ -4875,7 +5125,7 @@ class VentilationZoneControl(BSElement):
     """Method used to determine overall ventilation rate for multiple zones."""
 
     element_type = "xs:string"
-    element_enumerations = ["Average Flow", "Critical Zone", "Other", "Unknown"]
+    element_enumerations = ("Average Flow", "Critical Zone", "Other", "Unknown")
 
 
 # MakeupAirSourceID
@@ -4890,13 +5140,13 @@ class ExhaustLocation(BSElement):
     """Location of spot exhaust ventilation system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Bathroom",
         "Kitchen hood",
         "Laboratory hood",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OtherHVACSystemType.OtherHVACType.NaturalVentilation.NaturalVentilationRate
@@ -4911,7 +5161,7 @@ class NaturalVentilationMethod(BSElement):
     """Strategy for introducing natural ventilation."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Air changes per hour",
         "Flow per area",
         "Flow per person",
@@ -4919,7 +5169,7 @@ class NaturalVentilationMethod(BSElement):
         "Wind and stack open area",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OtherHVACSystemType.LinkedDeliveryIDs.LinkedDeliveryID
@@ -4927,9 +5177,7 @@ class LinkedDeliveryID(BSElement):
     """Connect to an air distribution system"""
 
 
-LinkedDeliveryID.element_attributes = [
-    "IDref",  # IDREF
-]
+LinkedDeliveryID.element_attributes = ("IDref",)  # IDREF
 
 
 # LightingSystemType.BallastType
@@ -4937,7 +5185,7 @@ class BallastType(BSElement):
     """A ballast is a piece of equipment required to control the starting and operating voltages of electrical gas discharge lights."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Electromagnetic",
         "Standard Electronic",
         "Premium Electronic",
@@ -4946,7 +5194,7 @@ class BallastType(BSElement):
         "F-Can",
         "Other",
         "No Ballast",
-    ]
+    )
 
 
 # LightingSystemType.InputVoltage
@@ -4954,7 +5202,7 @@ class InputVoltage(BSElement):
     """Voltage rating for this LightingSystem."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "120",
         "208",
         "240",
@@ -4966,7 +5214,7 @@ class InputVoltage(BSElement):
         "347-480 (high voltage)",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # LightingSystemType.InstallationType
@@ -4974,14 +5222,14 @@ class InstallationType(BSElement):
     """Installation of lamp relative to mounting surface."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Plug-in",
         "Recessed",
         "Surface",
         "Suspended",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # LightingSystemType.LightingDirection
@@ -4989,7 +5237,7 @@ class LightingDirection(BSElement):
     """Directional characteristics of lighting fixtures."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Direct",
         "Indirect",
         "Direct-Indirect",
@@ -4998,7 +5246,7 @@ class LightingDirection(BSElement):
         "Omnidirectional",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # LightingSystemType.PercentPremisesServed
@@ -5062,13 +5310,13 @@ class ReflectorType(BSElement):
     """Type of reflector used to distribute light to the space."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Specular Reflector",
         "Prismatic Reflector",
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # LightingSystemType.LightingEfficacy
@@ -5111,7 +5359,7 @@ class LampLength(BSElement):
     """Length of fluorescent lamps."""
 
     element_type = "xs:string"
-    element_enumerations = ["2 ft", "4 ft", "Other", "Unknown"]
+    element_enumerations = ("2 ft", "4 ft", "Other", "Unknown")
 
 
 # FluorescentStartType
@@ -5119,13 +5367,13 @@ class FluorescentStartType(BSElement):
     """Start technology used with fluorescent ballasts."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Instant start",
         "Rapid start",
         "Programmed start",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # TransformerNeeded
@@ -5140,7 +5388,7 @@ class MetalHalideStartType(BSElement):
     """Start technology used with metal halide ballasts."""
 
     element_type = "xs:string"
-    element_enumerations = ["Probe start", "Pulse start", "Other", "Unknown"]
+    element_enumerations = ("Probe start", "Pulse start", "Other", "Unknown")
 
 
 # LightingSystemType.LampType.Induction
@@ -5148,9 +5396,7 @@ class Induction(BSElement):
     pass
 
 
-Induction.element_children = [
-    ("FluorescentStartType", FluorescentStartType),
-]
+Induction.element_children = (("FluorescentStartType", FluorescentStartType),)
 
 # NeonType
 class NeonType(BSElement):
@@ -5184,13 +5430,13 @@ class HotWaterDistributionType(BSElement):
     """Manner in which hot water is distributed."""
 
     element_type = "xs:string"
-    element_enumerations = ["Looped", "Distributed", "Point-of-use", "Other", "Unknown"]
+    element_enumerations = ("Looped", "Distributed", "Point-of-use", "Other", "Unknown")
 
 
 # DomesticHotWaterSystemType.WaterHeaterEfficiencyType
 class WaterHeaterEfficiencyType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Energy Factor", "Thermal Efficiency", "AFUE", "COP"]
+    element_enumerations = ("Energy Factor", "Thermal Efficiency", "AFUE", "COP")
 
 
 # DomesticHotWaterSystemType.WaterHeaterEfficiency
@@ -5231,11 +5477,11 @@ class Combustion(BSElement):
     pass
 
 
-Combustion.element_children = [
+Combustion.element_children = (
     ("DraftType", DraftType),
     ("DraftBoundary", DraftBoundary),
     ("CondensingOperation", CondensingOperation),
-]
+)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Indirect.IndirectTankHeatingSource.HeatPump.HPWHMinimumAirTemperature
@@ -5250,14 +5496,14 @@ class SolarThermalSystemType(BSElement):
     """Basic function of solar thermal system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Hot water",
         "Hot water and space heating",
         "Space heating",
         "Hybrid system",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Indirect.IndirectTankHeatingSource.Solar.SolarThermalSystemCollectorArea
@@ -5272,7 +5518,7 @@ class SolarThermalSystemCollectorLoopType(BSElement):
     """Heat transfer medium and controls used for the solar collector loop."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Air direct",
         "Air indirect",
         "Liquid direct",
@@ -5280,7 +5526,7 @@ class SolarThermalSystemCollectorLoopType(BSElement):
         "Passive thermosyphon",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Indirect.IndirectTankHeatingSource.Solar.SolarThermalSystemCollectorType
@@ -5288,7 +5534,7 @@ class SolarThermalSystemCollectorType(BSElement):
     """Type of solar energy collector used in a solar hot water or space heating system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Single glazing black",
         "Single glazing selective",
         "Double glazing black",
@@ -5297,7 +5543,7 @@ class SolarThermalSystemCollectorType(BSElement):
         "Integrated collector storage",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Indirect.IndirectTankHeatingSource.Solar.SolarThermalSystemCollectorAzimuth
@@ -5326,9 +5572,7 @@ class HeatingPlantID(BSElement):
     """ID number of HeatingPlant serving as the source for this hot water system."""
 
 
-HeatingPlantID.element_attributes = [
-    "IDref",  # IDREF
-]
+HeatingPlantID.element_attributes = ("IDref",)  # IDREF
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankVolume
@@ -5404,14 +5648,14 @@ class RecirculationControlType(BSElement):
     """Type of control for recirculation loop."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Continuous",
         "Temperature",
         "Timer",
         "Demand",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DomesticHotWaterSystemType.Recirculation.RecirculationEnergyLossRate
@@ -5426,7 +5670,7 @@ class TypeOfCookingEquipment(BSElement):
     """Short description of the type and purpose of cooking equipment."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Hot top range",
         "Open burner range",
         "Wok range",
@@ -5469,7 +5713,7 @@ class TypeOfCookingEquipment(BSElement):
         "Espresso machine",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CookingSystemType.NumberOfMeals
@@ -5505,14 +5749,14 @@ class RefrigerationCompressorType(BSElement):
     """Type of compressor in the refrigeration system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Reciprocating",
         "Screw",
         "Scroll",
         "Centrifugal",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.CentralRefrigerationSystem.RefrigerationCompressor.DesuperheatValve
@@ -5597,13 +5841,13 @@ class RefrigerationUnitType(BSElement):
     """Refrigeration equipment includes a refrigerator or freezer used for storing food products at specified temperatures, with the condensing unit and compressor built into the cabinet, and designed for use by commercial or institutional premises, other than laboratory settings. These units may be vertical or chest configurations and may contain a worktop surface."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Refrigerator",
         "Freezer",
         "Combination",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.RefrigerationUnit.DoorConfiguration
@@ -5611,13 +5855,13 @@ class DoorConfiguration(BSElement):
     """Door configuration of the refrigerator/freezer unit."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Side-by-side",
         "Top and bottom",
         "Walk-in",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.RefrigerationUnit.RefrigeratedCaseDoors
@@ -5632,7 +5876,7 @@ class CaseDoorOrientation(BSElement):
     """Orientation of refrigerated case doors used for display cases at stores, food-service establishments."""
 
     element_type = "xs:string"
-    element_enumerations = ["Horizontal", "Vertical", "Combination", "Unknown"]
+    element_enumerations = ("Horizontal", "Vertical", "Combination", "Unknown")
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.RefrigerationUnit.DefrostingType
@@ -5640,7 +5884,7 @@ class DefrostingType(BSElement):
     """Type of defrost strategy used for refrigerated cases."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Electric",
         "Off cycle",
         "Hot gas",
@@ -5650,7 +5894,7 @@ class DefrostingType(BSElement):
         "None",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.RefrigerationUnit.RefrigerationUnitSize
@@ -5672,7 +5916,7 @@ class DishwasherMachineType(BSElement):
     """They type of dishwasher machine such as being either stationary rack or conveyor."""
 
     element_type = "xs:string"
-    element_enumerations = ["Stationary Rack", "Conveyor", "Other", "Unknown"]
+    element_enumerations = ("Stationary Rack", "Conveyor", "Other", "Unknown")
 
 
 # DishwasherSystemType.DishwasherConfiguration
@@ -5680,7 +5924,7 @@ class DishwasherConfiguration(BSElement):
     """A machine designed to clean and sanitize plates, pots, pans, glasses, cups, bowls, utensils, and trays by applying sprays of detergent solution (with or without blasting media granules) and a sanitizing rinse."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Counter top",
         "Stationary Under Counter",
         "Stationary Single Tank Door Type",
@@ -5692,7 +5936,7 @@ class DishwasherConfiguration(BSElement):
         "Multiple Tank Flight Conveyor",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DishwasherSystemType.DishwasherClassification
@@ -5700,13 +5944,13 @@ class DishwasherClassification(BSElement):
     """The sector where dishwasher equipment is commonly used."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Industrial",
         "Commercial",
         "Residential",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DishwasherSystemType.DishwasherLoadsPerWeek
@@ -5749,13 +5993,13 @@ class ClothesWasherClassification(BSElement):
     """The sector where clothes washer is commonly used."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Residential",
         "Commercial",
         "Industrial",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # ClothesWasherLoaderType
@@ -5763,7 +6007,7 @@ class ClothesWasherLoaderType(BSElement):
     """The type of configuration of a laundry appliance. Such as front and top loading clothes washers."""
 
     element_type = "xs:string"
-    element_enumerations = ["Front", "Top", "Other", "Unknown"]
+    element_enumerations = ("Front", "Top", "Other", "Unknown")
 
 
 # ClothesWasherModifiedEnergyFactor
@@ -5790,13 +6034,13 @@ class ClothesWasherCapacity(BSElement):
 # DryerType
 class DryerType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Residential",
         "Commercial",
         "Industrial",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # DryerElectricEnergyUsePerLoad
@@ -5818,12 +6062,12 @@ class WasherDryerType(BSElement):
     """Type of washer/dryer combination unit."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Combination All In One Clothes Washer Dryer",
         "Unitized Stacked Washer Dryer Pair",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # PumpSystemType.PumpEfficiency
@@ -5866,14 +6110,14 @@ class PumpControlType(BSElement):
     """Type of pump speed control."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Constant Volume",
         "Variable Volume",
         "VFD",
         "Multi-Speed",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # PumpSystemType.PumpOperation
@@ -5881,7 +6125,7 @@ class PumpOperation(BSElement):
     """Defines how pump operation is controlled."""
 
     element_type = "xs:string"
-    element_enumerations = ["On Demand", "Standby", "Schedule", "Other", "Unknown"]
+    element_enumerations = ("On Demand", "Standby", "Schedule", "Other", "Unknown")
 
 
 # PumpSystemType.PumpingConfiguration
@@ -5889,14 +6133,14 @@ class PumpingConfiguration(BSElement):
     """Primary, secondary, or tertiary pump."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Primary",
         "Secondary",
         "Tertiary",
         "Backup",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # PumpSystemType.PumpApplication
@@ -5904,7 +6148,7 @@ class PumpApplication(BSElement):
     """Type of system served by the pump."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Boiler",
         "Chilled Water",
         "Domestic Hot Water",
@@ -5921,7 +6165,7 @@ class PumpApplication(BSElement):
         "Air",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FanSystemType.FanEfficiency
@@ -5971,7 +6215,7 @@ class FanType(BSElement):
     """Method of generating air flow."""
 
     element_type = "xs:string"
-    element_enumerations = ["Axial", "Centrifugal", "Other", "Unknown"]
+    element_enumerations = ("Axial", "Centrifugal", "Other", "Unknown")
 
 
 # FanSystemType.BeltType
@@ -5979,14 +6223,14 @@ class BeltType(BSElement):
     """Type of belt drive in fan unit."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Direct drive",
         "Standard belt",
         "Cogged belt",
         "Synchronous belts",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FanSystemType.FanApplication
@@ -5994,7 +6238,7 @@ class FanApplication(BSElement):
     """Application of fan (supply, return, or exhaust)."""
 
     element_type = "xs:string"
-    element_enumerations = ["Supply", "Return", "Exhaust", "Other", "Unknown"]
+    element_enumerations = ("Supply", "Return", "Exhaust", "Other", "Unknown")
 
 
 # FanSystemType.FanControlType
@@ -6002,13 +6246,13 @@ class FanControlType(BSElement):
     """Type of air flow control."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Variable Volume",
         "Stepped",
         "Constant Volume",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FanSystemType.FanPlacement
@@ -6016,14 +6260,14 @@ class FanPlacement(BSElement):
     """Placement of fan relative to the air stream."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Series",
         "Parallel",
         "Draw Through",
         "Blow Through",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FanSystemType.MotorLocationRelativeToAirStream
@@ -6108,7 +6352,7 @@ class MotorEnclosureType(BSElement):
     """Defines if the motor is open or enclosed."""
 
     element_type = "xs:string"
-    element_enumerations = ["Open", "Enclosed", "Other", "Unknown"]
+    element_enumerations = ("Open", "Enclosed", "Other", "Unknown")
 
 
 # MotorSystemType.MotorApplication
@@ -6116,7 +6360,7 @@ class MotorApplication(BSElement):
     """Type of system served by the motor."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Fan",
         "Pump",
         "Conveyance",
@@ -6125,7 +6369,7 @@ class MotorApplication(BSElement):
         "Compressor",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # HeatRecoverySystemType.HeatRecoveryEfficiency
@@ -6147,7 +6391,7 @@ class HeatRecoveryType(BSElement):
     """Type of heat recovery between two systems."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Run around coil",
         "Thermal wheel",
         "Heat pipe",
@@ -6158,7 +6402,7 @@ class HeatRecoveryType(BSElement):
         "Earth to water heat exchanger",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # HeatRecoverySystemType.SystemIDReceivingHeat
@@ -6166,9 +6410,7 @@ class SystemIDReceivingHeat(BSElement):
     """ID number of the system that usually receives heat from another system."""
 
 
-SystemIDReceivingHeat.element_attributes = [
-    "IDref",  # IDREF
-]
+SystemIDReceivingHeat.element_attributes = ("IDref",)  # IDREF
 
 
 # HeatRecoverySystemType.SystemIDProvidingHeat
@@ -6176,9 +6418,7 @@ class SystemIDProvidingHeat(BSElement):
     """ID number of the system that usually provides heat to another system."""
 
 
-SystemIDProvidingHeat.element_attributes = [
-    "IDref",  # IDREF
-]
+SystemIDProvidingHeat.element_attributes = ("IDref",)  # IDREF
 
 
 # WallSystemType.WallRValue
@@ -6224,7 +6464,7 @@ class CMUFill(BSElement):
     """
 
     element_type = "xs:string"
-    element_enumerations = ["Empty", "Insulated", "Solid", "Unknown", "Not Applicable"]
+    element_enumerations = ("Empty", "Insulated", "Solid", "Unknown", "Not Applicable")
 
 
 # WallSystemType.WallExteriorSolarAbsorptance
@@ -6251,7 +6491,7 @@ class InteriorVisibleAbsorptance(BSElement):
 # EnvelopeConstructionType
 class EnvelopeConstructionType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Masonry",
         "Structural brick",
         "Stone",
@@ -6272,13 +6512,13 @@ class EnvelopeConstructionType(BSElement):
         "Built up",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # Finish
 class Finish(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Wood",
         "Masonite",
         "Stone",
@@ -6304,13 +6544,13 @@ class Finish(BSElement):
         "Plastic rubber synthetic sheeting",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # Color
 class Color(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "White",
         "Light",
         "Medium",
@@ -6319,13 +6559,13 @@ class Color(BSElement):
         "Reflective",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # InsulationMaterialType
 class InsulationMaterialType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Fiberglass",
         "Cellulose",
         "EPS",
@@ -6340,7 +6580,7 @@ class InsulationMaterialType(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # WallSystemType.WallInsulations.WallInsulation.WallInsulationCondition
@@ -6353,7 +6593,7 @@ class WallInsulationApplication(BSElement):
     """A description of the type of insulation and how it is applied."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Loose fill",
         "Batt",
         "Spray on",
@@ -6361,7 +6601,7 @@ class WallInsulationApplication(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # WallSystemType.WallInsulations.WallInsulation.WallInsulationThickness
@@ -6376,7 +6616,7 @@ class WallInsulationContinuity(BSElement):
     """Insulation installation type."""
 
     element_type = "xs:string"
-    element_enumerations = ["Cavity", "Continuous", "Other", "Unknown", "None"]
+    element_enumerations = ("Cavity", "Continuous", "Other", "Unknown", "None")
 
 
 # WallSystemType.WallInsulations.WallInsulation.WallInsulationLocation
@@ -6384,7 +6624,7 @@ class WallInsulationLocation(BSElement):
     """Whether wall insulation is on the inside or outside of the wall."""
 
     element_type = "xs:string"
-    element_enumerations = ["Interior", "Exterior", "Unknown", "None"]
+    element_enumerations = ("Interior", "Exterior", "Unknown", "None")
 
 
 # WallSystemType.WallInsulations.WallInsulation.WallInsulationRValue
@@ -6397,7 +6637,7 @@ class WallInsulationRValue(BSElement):
 # FramingMaterial
 class FramingMaterial(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Wood",
         "Steel",
         "Concrete",
@@ -6406,7 +6646,7 @@ class FramingMaterial(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # CeilingSystemType.CeilingConstruction
@@ -6489,7 +6729,7 @@ class CeilingInsulationApplication(BSElement):
     """A description of the type of insulation and how it is applied."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Loose fill",
         "Batt",
         "Spray on",
@@ -6497,7 +6737,7 @@ class CeilingInsulationApplication(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # CeilingSystemType.CeilingInsulations.CeilingInsulation.CeilingInsulationThickness
@@ -6512,7 +6752,7 @@ class CeilingInsulationContinuity(BSElement):
     """Insulation installation type."""
 
     element_type = "xs:string"
-    element_enumerations = ["Cavity", "Continuous", "Other", "Unknown", "None"]
+    element_enumerations = ("Cavity", "Continuous", "Other", "Unknown", "None")
 
 
 # RoofSystemType.RoofConstruction
@@ -6556,7 +6796,7 @@ class DeckType(BSElement):
     """The material used to create the structural integrity in an opaque surface. In many cases the framing material is not continuous across the construction."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Wood",
         "Steel",
         "Concrete",
@@ -6565,7 +6805,7 @@ class DeckType(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # RoofSystemType.RoofRValue
@@ -6613,14 +6853,14 @@ class RoofSlope(BSElement):
     """A descriptive value for tilt, when an exact numeric angle is not known."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Flat",
         "Sloped",
         "Greater than 2 to 12",
         "Less than 2 to 12",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # RoofSystemType.RadiantBarrier
@@ -6666,7 +6906,7 @@ class RoofInsulationApplication(BSElement):
     """A description of the type of insulation and how it is applied."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Loose fill",
         "Batt",
         "Spray on",
@@ -6674,7 +6914,7 @@ class RoofInsulationApplication(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # RoofSystemType.RoofInsulations.RoofInsulation.RoofInsulationThickness
@@ -6689,7 +6929,7 @@ class RoofInsulationContinuity(BSElement):
     """Insulation installation type."""
 
     element_type = "xs:string"
-    element_enumerations = ["Cavity", "Continuous", "Other", "Unknown", "None"]
+    element_enumerations = ("Cavity", "Continuous", "Other", "Unknown", "None")
 
 
 # RoofSystemType.RoofInsulations.RoofInsulation.RoofInsulationRValue
@@ -6704,7 +6944,7 @@ class FenestrationFrameMaterial(BSElement):
     """The construction and material used in the frame of the fenestration product. Some frames are made of combinations of materials. This characterization also include whether an aluminum frame has a thermal break as part of the construction."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Aluminum uncategorized",
         "Aluminum no thermal break",
         "Aluminum thermal break",
@@ -6716,7 +6956,7 @@ class FenestrationFrameMaterial(BSElement):
         "Wood",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FenestrationSystemType.FenestrationOperation
@@ -6743,7 +6983,7 @@ class GlassType(BSElement):
     """Type of glass used in this fenestration group."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Clear uncoated",
         "Low e",
         "Tinted",
@@ -6756,7 +6996,7 @@ class GlassType(BSElement):
         "Plastic",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FenestrationSystemType.FenestrationGasFill
@@ -6764,14 +7004,14 @@ class FenestrationGasFill(BSElement):
     """For a sealed glazing system (commonly called an Insulated Glass Unit (IGU)), the gas that is found between the panes of glass."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Argon",
         "Krypton",
         "Other Insulating Gas",
         "Air",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FenestrationSystemType.FenestrationGlassLayers
@@ -6779,13 +7019,13 @@ class FenestrationGlassLayers(BSElement):
     """A description of the number of layers of glass in a fenestration glazing system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Single pane",
         "Double pane",
         "Triple pane",
         "Single paned with storm panel",
         "Unknown",
-    ]
+    )
 
 
 # FenestrationSystemType.FenestrationRValue
@@ -6842,7 +7082,7 @@ class WindowLayout(BSElement):
     """The pattern of distribution of the fenestration system on the wall."""
 
     element_type = "xs:string"
-    element_enumerations = ["Continuous", "Discrete", "Unknown"]
+    element_enumerations = ("Continuous", "Discrete", "Unknown")
 
 
 # FenestrationSystemType.FenestrationType.Window.WindowOrientation
@@ -6850,7 +7090,7 @@ class WindowOrientation(BSElement):
     """Orientation of a surface or premises in terms of the attributes of North, South, East and West. Can be applied to the orientation of the front of the building, of a specific surface (wall, roof), window or skylight, or onsite generation technology, such as photovoltaic panels."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "North",
         "Northeast",
         "East",
@@ -6860,7 +7100,7 @@ class WindowOrientation(BSElement):
         "West",
         "Northwest",
         "Unknown",
-    ]
+    )
 
 
 # FenestrationSystemType.FenestrationType.Window.WindowSillHeight
@@ -6896,7 +7136,7 @@ class ExteriorShadingType(BSElement):
     """Any type of overhang or awning on the outside of the building designed to limit solar penetration."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Overhang",
         "Fin",
         "Awning",
@@ -6910,7 +7150,7 @@ class ExteriorShadingType(BSElement):
         "None",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FenestrationSystemType.FenestrationType.Window.OverhangHeightAboveWindow
@@ -6953,7 +7193,7 @@ class InteriorShadingType(BSElement):
     """Type of interior shading."""
 
     element_type = "xs:string"
-    element_enumerations = ["Blind", "Curtain", "Shade", "None", "Other", "Unknown"]
+    element_enumerations = ("Blind", "Curtain", "Shade", "None", "Other", "Unknown")
 
 
 # FenestrationSystemType.FenestrationType.Skylight.SkylightLayout
@@ -6961,7 +7201,7 @@ class SkylightLayout(BSElement):
     """Zones daylit by skylights."""
 
     element_type = "xs:string"
-    element_enumerations = ["All Zones", "Core Only", "Other", "Unknown"]
+    element_enumerations = ("All Zones", "Core Only", "Other", "Unknown")
 
 
 # FenestrationSystemType.FenestrationType.Skylight.SkylightPitch
@@ -6976,7 +7216,7 @@ class SkylightWindowTreatments(BSElement):
     """Type of film or shading applied to skylight."""
 
     element_type = "xs:string"
-    element_enumerations = ["Solar film", "Solar screen", "Shade", "None", "Unknown"]
+    element_enumerations = ("Solar film", "Solar screen", "Shade", "None", "Unknown")
 
 
 # FenestrationSystemType.FenestrationType.Skylight.SkylightSolarTube
@@ -6991,7 +7231,7 @@ class ExteriorDoorType(BSElement):
     """Type of door construction."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Solid wood",
         "Hollow wood",
         "Uninsulated metal",
@@ -6999,7 +7239,7 @@ class ExteriorDoorType(BSElement):
         "Glass",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FenestrationSystemType.FenestrationType.Door.Vestibule
@@ -7014,7 +7254,7 @@ class DoorOperation(BSElement):
     """Non-swinging includes sliding doors and roll-up doors."""
 
     element_type = "xs:string"
-    element_enumerations = ["NonSwinging", "Swinging", "Unknown"]
+    element_enumerations = ("NonSwinging", "Swinging", "Unknown")
 
 
 # ExteriorFloorSystemType.ExteriorFloorConstruction
@@ -7091,7 +7331,7 @@ class FloorCovering(BSElement):
     """Material covering the slab or floor over unconditioned space."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Carpet",
         "Tile",
         "Hardwood",
@@ -7099,7 +7339,7 @@ class FloorCovering(BSElement):
         "Linoleum",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FoundationSystemType.FloorConstructionType
@@ -7112,7 +7352,7 @@ class PlumbingPenetrationSealing(BSElement):
     """Type of plumbing penetration sealing."""
 
     element_type = "xs:string"
-    element_enumerations = ["Flashing", "Fitting", "Other", "Unknown"]
+    element_enumerations = ("Flashing", "Fitting", "Other", "Unknown")
 
 
 # SlabInsulationOrientation
@@ -7120,7 +7360,7 @@ class SlabInsulationOrientation(BSElement):
     """The location and extent of slab-on-grade floor insulation."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "12 in Horizontal",
         "12 in Vertical",
         "24 in Horizontal",
@@ -7132,7 +7372,7 @@ class SlabInsulationOrientation(BSElement):
         "Fully Insulated Slab",
         "None",
         "Unknown",
-    ]
+    )
 
 
 # SlabArea
@@ -7187,7 +7427,7 @@ class SlabHeating(BSElement):
     """The classifications for floors in contact with the ground."""
 
     element_type = "xs:string"
-    element_enumerations = ["Heated", "Unheated", "Other", "Unknown"]
+    element_enumerations = ("Heated", "Unheated", "Other", "Unknown")
 
 
 # FoundationSystemType.GroundCouplings.GroundCoupling.Crawlspace.CrawlspaceVenting.Ventilated.FloorInsulationCondition
@@ -7275,7 +7515,7 @@ class FoundationWallInsulationContinuity(BSElement):
     """Insulation installation type."""
 
     element_type = "xs:string"
-    element_enumerations = ["Cavity", "Continuous", "Other", "Unknown", "None"]
+    element_enumerations = ("Cavity", "Continuous", "Other", "Unknown", "None")
 
 
 # FoundationWallInsulationCondition
@@ -7288,13 +7528,13 @@ class BasementConditioning(BSElement):
     """Extent of space conditioning in basement."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Conditioned",
         "Unconditioned",
         "Semi conditioned",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CriticalITSystemType.ITSystemType
@@ -7302,7 +7542,7 @@ class ITSystemType(BSElement):
     """Type of critical information technology (IT) system, including data centers, network, and security systems."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Building Automation System",
         "Server",
         "Networking",
@@ -7311,7 +7551,7 @@ class ITSystemType(BSElement):
         "UPS",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CriticalITSystemType.ITPeakPower
@@ -7340,7 +7580,7 @@ class PlugLoadType(BSElement):
     """General category of plug load, including non-critical IT systems, task lighting, and other small electronic loads."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Personal Computer",
         "Task Lighting",
         "Printing",
@@ -7355,7 +7595,7 @@ class PlugLoadType(BSElement):
         "Miscellaneous Electric Load",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # PlugElectricLoadType.PlugLoadPeakPower
@@ -7391,7 +7631,7 @@ class ProcessLoadType(BSElement):
     """Type of gas or electric equipment not categorized elsewhere."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Medical Equipment",
         "Laboratory Equipment",
         "Machinery",
@@ -7404,7 +7644,7 @@ class ProcessLoadType(BSElement):
         "Miscellaneous Gas Load",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # ProcessGasElectricLoadType.ProcessLoadPeakPower
@@ -7426,7 +7666,7 @@ class ConveyanceLoadType(BSElement):
     """Type of load that the conveyance system usually transports."""
 
     element_type = "xs:string"
-    element_enumerations = ["People", "Freight", "Goods", "Other", "Unknown"]
+    element_enumerations = ("People", "Freight", "Goods", "Other", "Unknown")
 
 
 # ConveyanceSystemType.ConveyancePeakPower
@@ -7474,14 +7714,14 @@ class EnergyStorageTechnology(BSElement):
     """A few different forms of energy storage systems exist including: potential, kinetic, chemical and thermal. The critical factors of any storage device are application (type and size), costs, cycle efficiency and longevity."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Battery",
         "Thermal Energy Storage",
         "Pumped-Storage Hydroelectricity",
         "Flywheel",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OnsiteStorageTransmissionGenerationSystemType.EnergyConversionType.Storage.ThermalMedium
@@ -7489,7 +7729,7 @@ class ThermalMedium(BSElement):
     """Type of material used in thermal energy storage technology."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Air",
         "Ice",
         "Pool water",
@@ -7500,7 +7740,7 @@ class ThermalMedium(BSElement):
         "Chemical oxides",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OnsiteStorageTransmissionGenerationSystemType.EnergyConversionType.Generation.OnsiteGenerationType.PV.PhotovoltaicSystemNumberOfModulesPerArray
@@ -7557,13 +7797,13 @@ class PhotovoltaicSystemLocation(BSElement):
     """Location where PV system is mounted."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Roof",
         "On grade",
         "Building integrated",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OnsiteStorageTransmissionGenerationSystemType.EnergyConversionType.Generation.OnsiteGenerationType.PV.PhotovoltaicModuleRatedPower
@@ -7597,7 +7837,7 @@ class OtherEnergyGenerationTechnology(BSElement):
     """Technology utilized on the premises to generate non-purchased energy, including renewable energy that is passively collected. This includes energy collected from the environment such as air, water, or ground-source heat pump systems. Technology equipment may exist as facade systems and roofing systems. Technology equipment may also exist on a premises off of a building envelope including on the ground, awnings, or carports as well as underground."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Standby generator",
         "Turbine",
         "Microturbine",
@@ -7612,7 +7852,7 @@ class OtherEnergyGenerationTechnology(BSElement):
         "Wind",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # OnsiteStorageTransmissionGenerationSystemType.EnergyConversionType.Generation.ExternalPowerSupply
@@ -7620,14 +7860,14 @@ class ExternalPowerSupply(BSElement):
     """Designed to convert line voltage ac input into lower voltage ac or dc output, convert to only one output voltage at a time, contained in a separate physical enclosure from the end-use product, and does not have batteries or battery packs that physically attach directly (including those that are removable) to the power supply unit."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "AC to AC",
         "AC to DC",
         "Low Voltage",
         "No Load",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # PoolType.PoolSizeCategory
@@ -7635,13 +7875,13 @@ class PoolSizeCategory(BSElement):
     """Classification of the pool size."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Olympic",
         "Recreational",
         "Short Course",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # PoolType.PoolArea
@@ -7726,7 +7966,7 @@ class WeatherDataType(BSElement):
     """Type of weather data used for the simulation."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "CWEC",
         "CZRV2",
         "IWEC",
@@ -7737,7 +7977,7 @@ class WeatherDataType(BSElement):
         "Weather Station",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # CalculationMethodType.Modeled.SimulationCompletionStatus
@@ -7745,7 +7985,7 @@ class SimulationCompletionStatus(BSElement):
     """Status of the simulation."""
 
     element_type = "xs:string"
-    element_enumerations = ["Not Started", "Started", "Finished", "Failed", "Unknown"]
+    element_enumerations = ("Not Started", "Started", "Finished", "Failed", "Unknown")
 
 
 # CalculationMethodType.Measured.MeasuredEnergySource.UtilityBills
@@ -7753,11 +7993,11 @@ class UtilityBills(BSElement):
     pass
 
 
-UtilityBills.element_children = [
+UtilityBills.element_children = (
     ("UtilityMeterNumber", UtilityMeterNumber),
     ("UtilityAccountNumber", UtilityAccountNumber),
     ("UtilityBillpayer", UtilityBillpayer),
-]
+)
 
 # CalculationMethodType.Measured.MeasuredEnergySource.DirectMeasurement
 class DirectMeasurement(BSElement):
@@ -7779,7 +8019,7 @@ class SpatialUnitType(BSElement):
     """Unit type within the premises."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Lots",
         "Parking spaces",
         "Apartment units",
@@ -7794,7 +8034,7 @@ class SpatialUnitType(BSElement):
         "Bedrooms",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # SpatialUnitTypeType.NumberOfUnits
@@ -7823,9 +8063,7 @@ class LinkedSystemID(BSElement):
     """ID number of associated system(s)."""
 
 
-LinkedSystemID.element_attributes = [
-    "IDref",  # IDREF
-]
+LinkedSystemID.element_attributes = ("IDref",)  # IDREF
 
 # Address.StreetAddressDetail.Simplified.StreetAddress
 class StreetAddress(BSElement):
@@ -7867,7 +8105,7 @@ class StreetDirPrefix(BSElement):
     """The direction indicator that precedes the street name."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "North",
         "Northeast",
         "East",
@@ -7876,7 +8114,7 @@ class StreetDirPrefix(BSElement):
         "Southwest",
         "West",
         "Northwest",
-    ]
+    )
 
 
 # Address.StreetAddressDetail.Complex.StreetName
@@ -7891,7 +8129,7 @@ class StreetSuffix(BSElement):
     """The suffix portion of a street address."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Alley",
         "Annex",
         "Arcade",
@@ -8097,7 +8335,7 @@ class StreetSuffix(BSElement):
         "Ways",
         "Well",
         "Wells",
-    ]
+    )
 
 
 # Address.StreetAddressDetail.Complex.StreetSuffixModifier
@@ -8112,7 +8350,7 @@ class StreetDirSuffix(BSElement):
     """The direction indicator that follows a street address."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "North",
         "Northeast",
         "East",
@@ -8121,7 +8359,7 @@ class StreetDirSuffix(BSElement):
         "Southwest",
         "West",
         "Northwest",
-    ]
+    )
 
 
 # Address.StreetAddressDetail.Complex.SubaddressType
@@ -8129,7 +8367,7 @@ class SubaddressType(BSElement):
     """The type of subaddress to which the associated Subaddress Identifier applies."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Apartment",
         "Basement",
         "Berth",
@@ -8163,7 +8401,7 @@ class SubaddressType(BSElement):
         "Unit",
         "Upper",
         "Wing",
-    ]
+    )
 
 
 # Address.StreetAddressDetail.Complex.SubaddressIdentifier
@@ -8213,7 +8451,7 @@ class IdentifierLabel(BSElement):
     """Identifier used in a specific program or dataset. There can be multiple instances of Identifier Types within a dataset, such as a Listing ID, a Tax Map Number ID, and a Custom ID."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Premises",
         "Listing",
         "Name",
@@ -8227,7 +8465,7 @@ class IdentifierLabel(BSElement):
         "UBID",
         "Custom",
         "Other",
-    ]
+    )
 
 
 # IdentifierCustomName
@@ -8247,7 +8485,7 @@ class IdentifierValue(BSElement):
 # OccupancyClassificationType
 class OccupancyClassificationType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Manufactured home",
         "Single family",
         "Multifamily",
@@ -8403,7 +8641,7 @@ class OccupancyClassificationType(BSElement):
         "Science park",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # TypicalOccupantUsages.TypicalOccupantUsage.TypicalOccupantUsageValue
@@ -8414,7 +8652,7 @@ class TypicalOccupantUsageValue(BSElement):
 # TypicalOccupantUsages.TypicalOccupantUsage.TypicalOccupantUsageUnits
 class TypicalOccupantUsageUnits(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Hours per day",
         "Hours per week",
         "Hours per month",
@@ -8425,7 +8663,7 @@ class TypicalOccupantUsageUnits(BSElement):
         "Weeks per month",
         "Weeks per year",
         "Months per year",
-    ]
+    )
 
 
 # UserDefinedFields.UserDefinedField.FieldName
@@ -8443,25 +8681,21 @@ class TenantID(BSElement):
     """Tenant ID number for the premises."""
 
 
-TenantID.element_attributes = [
-    "IDref",  # IDREF
-]
+TenantID.element_attributes = ("IDref",)  # IDREF
 
 # FloorAreas.FloorArea.ExcludedSectionIDs.ExcludedSectionID
 class ExcludedSectionID(BSElement):
     pass
 
 
-ExcludedSectionID.element_attributes = [
-    "IDref",  # IDREF
-]
+ExcludedSectionID.element_attributes = ("IDref",)  # IDREF
 
 # FloorAreas.FloorArea.FloorAreaType
 class FloorAreaType(BSElement):
     """Floor area can be defined and described in many different ways for different purposes. This type field allows multiple types of floor area definitions to exist in the same dataset."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Tenant",
         "Common",
         "Gross",
@@ -8486,7 +8720,7 @@ class FloorAreaType(BSElement):
         "Open",
         "Lot",
         "Custom",
-    ]
+    )
 
 
 # FloorAreas.FloorArea.FloorAreaCustomName
@@ -8515,7 +8749,7 @@ class OccupantType(BSElement):
     """Type of occupants who are permanently resident in a premises."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Family household",
         "Married couple, no children",
         "Male householder, no spouse",
@@ -8543,7 +8777,7 @@ class OccupantType(BSElement):
         "Other",
         "Vacant",
         "Unknown",
-    ]
+    )
 
 
 # OccupancyLevels.OccupancyLevel.OccupantQuantityType
@@ -8551,7 +8785,7 @@ class OccupantQuantityType(BSElement):
     """Type of quantitative measure for capturing occupant information about the premises. The value is captured by the Occupant Quantity term."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Peak total occupants",
         "Adults",
         "Children",
@@ -8565,7 +8799,7 @@ class OccupantQuantityType(BSElement):
         "Capacity",
         "Capacity percentage",
         "Normal occupancy",
-    ]
+    )
 
 
 # OccupancyLevels.OccupancyLevel.OccupantQuantity
@@ -8590,38 +8824,38 @@ class Score(BSElement):
 # AssetScore.WholeBuilding.Rankings.Ranking.Type.SystemsType
 class SystemsType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Cooling",
         "Heating",
         "Hot Water",
         "Interior Lighting",
         "Overall HVAC Systems",
-    ]
+    )
 
 
 # AssetScore.WholeBuilding.Rankings.Ranking.Type.EnvelopeType
 class EnvelopeType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Floor U-Value, Mass",
         "Roof U-Value, Non-Attic",
         "Walls U-Value, Framed",
         "Walls + Windows U-Value",
         "Window Solar Heat Gain Coefficient",
         "Windows U-Value",
-    ]
+    )
 
 
 # RankType
 class RankType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Fair", "Good", "Superior"]
+    element_enumerations = ("Fair", "Good", "Superior")
 
 
 # AssetScore.UseTypes.UseType.AssetScoreUseType
 class AssetScoreUseType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Assisted Living Facility",
         "City Hall",
         "Community Center",
@@ -8640,7 +8874,7 @@ class AssetScoreUseType(BSElement):
         "Retail",
         "Senior Center",
         "Warehouse non-refrigerated",
-    ]
+    )
 
 
 # PortfolioManagerType.PMBenchmarkDate
@@ -8655,14 +8889,14 @@ class BuildingProfileStatus(BSElement):
     """The status of the building profile submission process for ENERGY STAR Portfolio Manager."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Draft",
         "Received",
         "Under Review",
         "On Hold",
         "Reviewed and Approved",
         "Reviewed and Not Approved",
-    ]
+    )
 
 
 # PortfolioManagerType.FederalSustainabilityChecklistCompletionPercentage
@@ -8675,7 +8909,7 @@ class FederalSustainabilityChecklistCompletionPercentage(BSElement):
 # FanBasedDistributionTypeType.FanCoil.FanCoilType
 class FanCoilType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Mini-split",
         "Multi-split",
         "Terminal reheat",
@@ -8684,7 +8918,7 @@ class FanCoilType(BSElement):
         "VRF terminal units",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FanBasedDistributionTypeType.FanCoil.HVACPipeConfiguration
@@ -8692,7 +8926,7 @@ class HVACPipeConfiguration(BSElement):
     """Number of pipes for distributing steam, refrigerant, or water to individual zones."""
 
     element_type = "xs:string"
-    element_enumerations = ["1 pipe", "2 pipe", "3 pipe", "4 pipe", "Other", "Unknown"]
+    element_enumerations = ("1 pipe", "2 pipe", "3 pipe", "4 pipe", "Other", "Unknown")
 
 
 # FanBasedType.HeatingSupplyAirTemperatureControl
@@ -8700,7 +8934,7 @@ class HeatingSupplyAirTemperatureControl(BSElement):
     """Defines the control method for heating supply air temperature."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Coldest Reset",
         "Fixed",
         "Outside Air Reset",
@@ -8708,7 +8942,7 @@ class HeatingSupplyAirTemperatureControl(BSElement):
         "Staged Setpoint",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FanBasedType.CoolingSupplyAirTemperature
@@ -8723,14 +8957,14 @@ class CoolingSupplyAirTemperatureControlType(BSElement):
     """Defines the control method for controlling cooling supply air temperature."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Fixed",
         "Outside Air Reset",
         "Scheduled",
         "Warmest Reset",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FanBasedType.OutsideAirResetMaximumHeatingSupplyTemperature
@@ -8815,7 +9049,7 @@ class AirSideEconomizerType(BSElement):
     """Type of air economizer system associated with a cooling system."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Dry bulb temperature",
         "Enthalpy",
         "Demand controlled ventilation",
@@ -8823,7 +9057,7 @@ class AirSideEconomizerType(BSElement):
         "None",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # FanBasedType.AirSideEconomizer.EconomizerControl
@@ -8831,7 +9065,7 @@ class EconomizerControl(BSElement):
     """Logic used for economizer control."""
 
     element_type = "xs:string"
-    element_enumerations = ["Fixed", "Differential", "Other", "Unknown"]
+    element_enumerations = ("Fixed", "Differential", "Other", "Unknown")
 
 
 # FanBasedType.AirSideEconomizer.EconomizerDryBulbControlPoint
@@ -8860,7 +9094,7 @@ class ControlStrategyGeneralType(BSElement):
     """Enumerations for general control strategies."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Always On",
         "Aquastat",
         "Astronomical",
@@ -8873,7 +9107,7 @@ class ControlStrategyGeneralType(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # OtherControlStrategyName
@@ -8895,7 +9129,7 @@ class ControlStrategyLightingType(BSElement):
     """Enumerations for lighting control strategies."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Advanced",
         "Always On",
         "Astronomical",
@@ -8908,19 +9142,19 @@ class ControlStrategyLightingType(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # ControlSensorDaylightingType
 class ControlSensorDaylightingType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Camera", "Photocell", "Other", "Unknown"]
+    element_enumerations = ("Camera", "Photocell", "Other", "Unknown")
 
 
 # ControlStrategyDaylightingType
 class ControlStrategyDaylightingType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Continuous",
         "Continuous Plus Off",
         "Stepped Dimming",
@@ -8928,7 +9162,7 @@ class ControlStrategyDaylightingType(BSElement):
         "Other",
         "None",
         "Unknown",
-    ]
+    )
 
 
 # ControlLightingType.Daylighting.ControlSteps
@@ -8941,7 +9175,7 @@ class ControlSteps(BSElement):
 # CommunicationProtocolAnalogType
 class CommunicationProtocolAnalogType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "AMX192",
         "Current",
         "D54",
@@ -8949,13 +9183,13 @@ class CommunicationProtocolAnalogType(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # CommunicationProtocolDigitalType
 class CommunicationProtocolDigitalType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "BACnet",
         "DALI",
         "DMX512",
@@ -8971,7 +9205,7 @@ class CommunicationProtocolDigitalType(BSElement):
         "Other",
         "Unknown",
         "None",
-    ]
+    )
 
 
 # ControlSystemType.Other.OtherCommunicationProtocolName
@@ -8989,7 +9223,7 @@ class Pneumatic(BSElement):
 # eGRIDSubregionCodes.eGRIDSubregionCode
 class eGRIDSubregionCode(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "AKGD",
         "AKMS",
         "AZNM",
@@ -9018,7 +9252,7 @@ class eGRIDSubregionCode(BSElement):
         "SRTV",
         "SRVC",
         "Other",
-    ]
+    )
 
 
 # BoundedDecimalZeroToOne
@@ -9057,9 +9291,7 @@ class MeasuredScenarioID(BSElement):
     pass
 
 
-MeasuredScenarioID.element_attributes = [
-    "IDref",  # IDREF
-]
+MeasuredScenarioID.element_attributes = ("IDref",)  # IDREF
 
 # DerivedModelType.Models.Model.DerivedModelInputs.ResponseVariable.ResponseVariableName
 class ResponseVariableName(FuelTypes):
@@ -9069,7 +9301,7 @@ class ResponseVariableName(FuelTypes):
 # EndUseType
 class EndUseType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "All end uses",
         "Total lighting",
         "Interior lighting",
@@ -9090,13 +9322,13 @@ class EndUseType(BSElement):
         "Laundry",
         "Pool heating",
         "On site generation",
-    ]
+    )
 
 
 # DerivedModelType.Models.Model.DerivedModelInputs.ExplanatoryVariables.ExplanatoryVariable.ExplanatoryVariableName
 class ExplanatoryVariableName(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Drybulb Temperature",
         "Wetbulb Temperature",
         "Relative Humidity",
@@ -9116,19 +9348,19 @@ class ExplanatoryVariableName(BSElement):
         "Weekday / Weekend",
         "Holiday",
         "Other",
-    ]
+    )
 
 
 # DerivedModelType.Models.Model.DerivedModelCoefficients.Guideline14Model.ModelType
 class ModelType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "2 parameter simple linear regression",
         "3 parameter heating change point model",
         "3 parameter cooling change point model",
         "4 parameter change point model",
         "5 parameter change point model",
-    ]
+    )
 
 
 # DerivedModelType.Models.Model.DerivedModelCoefficients.Guideline14Model.Intercept
@@ -9265,25 +9497,21 @@ class BaselinePeriodModelID(BSElement):
     """Applicable when the NormalizationMethod is Forecast or Standard Conditions. Define a link to the ID of the Model considered as the baseline period Model. In the event it is Forecast, the reporting period and comparison period are considered synonymous."""
 
 
-BaselinePeriodModelID.element_attributes = [
-    "IDref",  # IDREF
-]
+BaselinePeriodModelID.element_attributes = ("IDref",)  # IDREF
 
 # DerivedModelType.SavingsSummaries.SavingsSummary.ReportingPeriodModelID
 class ReportingPeriodModelID(BSElement):
     """Applicable when the NormalizationMethod is Backcast or Standard Conditions. Define a link to the ID of the Model considered as the reporting period Model. In the event it is Backcast, the baseline period and comparison period are considered synonymous."""
 
 
-ReportingPeriodModelID.element_attributes = [
-    "IDref",  # IDREF
-]
+ReportingPeriodModelID.element_attributes = ("IDref",)  # IDREF
 
 # DerivedModelType.SavingsSummaries.SavingsSummary.NormalizationMethod
 class NormalizationMethod(BSElement):
     """'Forecast' is the most common normalization method. It implies creation of a single Model using data from a baseline period (i.e. preconditions). 'Standard Conditions' is used to compare building performance of, say, two particular years to a 'typical' year. In this event, two models are created, one for the baseline and one for the reporting period, and input data is fed into each for a 'typical year' (TMY3, etc.) and performance compared.  'Backcast' is not used often, but makes sense in the event that finer temporal data is available in the reporting period to train the Model. A single Model is also created in this case."""
 
     element_type = "xs:string"
-    element_enumerations = ["Forecast", "Backcast", "Standard Conditions"]
+    element_enumerations = ("Forecast", "Backcast", "Standard Conditions")
 
 
 # DerivedModelType.SavingsSummaries.SavingsSummary.ComparisonPeriodStartTimestamp
@@ -9352,31 +9580,31 @@ class StandardConditionsAvoidedEnergyUse(BSElement):
 # OtherUnitsType
 class OtherUnitsType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Other", "Unknown", "None"]
+    element_enumerations = ("Other", "Unknown", "None")
 
 
 # DimensionlessUnitsBaseType
 class DimensionlessUnitsBaseType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Percent, %", "Percent Relative Humidity, %RH"]
+    element_enumerations = ("Percent, %", "Percent Relative Humidity, %RH")
 
 
 # PeakResourceUnitsBaseType
 class PeakResourceUnitsBaseType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["kW", "MMBtu/day"]
+    element_enumerations = ("kW", "MMBtu/day")
 
 
 # PressureUnitsBaseType
 class PressureUnitsBaseType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Bar", "Atmosphere, atm", "Pounds per Square Inch, psi"]
+    element_enumerations = ("Bar", "Atmosphere, atm", "Pounds per Square Inch, psi")
 
 
 # ResourceUnitsBaseType
 class ResourceUnitsBaseType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Cubic Meters",
         "kcf",
         "MCF",
@@ -9393,13 +9621,13 @@ class ResourceUnitsBaseType(BSElement):
         "Mlbs",
         "Mass ton",
         "Ton-hour",
-    ]
+    )
 
 
 # TemperatureUnitsBaseType
 class TemperatureUnitsBaseType(BSElement):
     element_type = "xs:string"
-    element_enumerations = ["Fahrenheit, F"]
+    element_enumerations = ("Fahrenheit, F",)
 
 
 # WeatherStations.WeatherStation
@@ -9407,14 +9635,12 @@ class WeatherStation(BSElement):
     pass
 
 
-WeatherStation.element_attributes = [
-    "ID",  # ID
-]
-WeatherStation.element_children = [
+WeatherStation.element_attributes = _ID_ATTRS
+WeatherStation.element_children = (
     ("WeatherDataStationID", WeatherDataStationID),
     ("WeatherStationName", WeatherStationName),
     ("WeatherStationCategory", WeatherStationCategory),
-]
+)
 
 # AnnualSavingsByFuels.AnnualSavingsByFuel.AnnualSavingsNativeUnits
 class AnnualSavingsNativeUnits(BSElement):
@@ -9428,9 +9654,7 @@ class CondenserPlantID(BSElement):
     """ID number of the CondenserPlant serving as the source for this cooling system."""
 
 
-CondenserPlantID.element_attributes = [
-    "IDref",  # IDREF
-]
+CondenserPlantID.element_attributes = ("IDref",)  # IDREF
 
 # ElectricResistanceType
 class ElectricResistanceType(BSElement):
@@ -9440,7 +9664,7 @@ class ElectricResistanceType(BSElement):
 # ExteriorRoughnessType
 class ExteriorRoughnessType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Very rough",
         "Rough",
         "Medium rough",
@@ -9448,7 +9672,7 @@ class ExteriorRoughnessType(BSElement):
         "Smooth",
         "Very smooth",
         "Unknown",
-    ]
+    )
 
 
 # LinkedScheduleIDs.LinkedScheduleID
@@ -9456,9 +9680,7 @@ class LinkedScheduleID(BSElement):
     """ID numbers of one or more schedules that apply in the context of the linked premise."""
 
 
-LinkedScheduleID.element_attributes = [
-    "IDref",  # IDREF
-]
+LinkedScheduleID.element_attributes = ("IDref",)  # IDREF
 
 # NoCoolingType
 class NoCoolingType(BSElement):
@@ -9473,7 +9695,7 @@ class NoHeatingType(BSElement):
 # ControlSensorOccupancyType
 class ControlSensorOccupancyType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Passive infrared",
         "Ultrasonic",
         "Passive infrared and ultrasonic",
@@ -9481,19 +9703,19 @@ class ControlSensorOccupancyType(BSElement):
         "Camera",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # ControlStrategyOccupancyType
 class ControlStrategyOccupancyType(BSElement):
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Occupancy Sensors",
         "Vacancy Sensors",
         "Other",
         "None",
         "Unknown",
-    ]
+    )
 
 
 # OtherCombinationType
@@ -9506,18 +9728,14 @@ class SpaceID(BSElement):
     """ID number of the space type associated with this side of the section."""
 
 
-SpaceID.element_attributes = [
-    "IDref",  # IDREF
-]
+SpaceID.element_attributes = ("IDref",)  # IDREF
 
 # ThermalZoneIDs.ThermalZoneID
 class ThermalZoneID(BSElement):
     """ID number of the zone type associated with this space or side of the section."""
 
 
-ThermalZoneID.element_attributes = [
-    "IDref",  # IDREF
-]
+ThermalZoneID.element_attributes = ("IDref",)  # IDREF
 
 # UnknownType
 class UnknownType(BSElement):
@@ -9529,14 +9747,14 @@ class VentilationControlMethod(BSElement):
     """The method used to control the rate of outside air ventilation."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "CO2 Sensors",
         "Fixed",
         "Occupancy Sensors",
         "Scheduled",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # BuildingSync.Programs.Program
@@ -9544,44 +9762,42 @@ class Program(BSElement):
     """Authorized or supported program such as rebate or audit."""
 
 
-Program.element_children = [
+Program.element_children = (
     ("ProgramDate", ProgramDate),
     ("ProgramFundingSource", ProgramFundingSource),
     ("ProgramClassification", ProgramClassification),
-]
+)
 
 # BuildingSync.Programs
 class Programs(BSElement):
     pass
 
 
-Programs.element_children = [
-    ("Program", Program),
-]
+Programs.element_children = (("Program", Program),)
 
 # BuildingSync.Facilities.Facility.Systems.WaterInfiltrationSystems.WaterInfiltrationSystem.LocationsOfExteriorWaterIntrusionDamages
 class LocationsOfExteriorWaterIntrusionDamages(BSElement):
     pass
 
 
-LocationsOfExteriorWaterIntrusionDamages.element_children = [
+LocationsOfExteriorWaterIntrusionDamages.element_children = (
     (
         "LocationsOfExteriorWaterIntrusionDamage",
         LocationsOfExteriorWaterIntrusionDamage,
     ),
-]
+)
 
 # BuildingSync.Facilities.Facility.Systems.WaterInfiltrationSystems.WaterInfiltrationSystem.LocationsOfInteriorWaterIntrusionDamages
 class LocationsOfInteriorWaterIntrusionDamages(BSElement):
     pass
 
 
-LocationsOfInteriorWaterIntrusionDamages.element_children = [
+LocationsOfInteriorWaterIntrusionDamages.element_children = (
     (
         "LocationsOfInteriorWaterIntrusionDamage",
         LocationsOfInteriorWaterIntrusionDamage,
     ),
-]
+)
 
 # OccupancyClassification
 class OccupancyClassification(OccupancyClassificationType):
@@ -9593,37 +9809,31 @@ class eGRIDSubregionCodes(BSElement):
     """The eGRID (Emissions and Generation Resource Database) subregion codes associated with the data being described."""
 
 
-eGRIDSubregionCodes.element_children = [
-    ("eGRIDSubregionCode", eGRIDSubregionCode),
-]
+eGRIDSubregionCodes.element_children = (("eGRIDSubregionCode", eGRIDSubregionCode),)
 
 # WeatherStations
 class WeatherStations(BSElement):
     pass
 
 
-WeatherStations.element_children = [
-    ("WeatherStation", WeatherStation),
-]
+WeatherStations.element_children = (("WeatherStation", WeatherStation),)
 
 # TenantIDs
 class TenantIDs(BSElement):
     pass
 
 
-TenantIDs.element_children = [
-    ("TenantID", TenantID),
-]
+TenantIDs.element_children = (("TenantID", TenantID),)
 
 # BuildingType.FederalBuilding
 class FederalBuilding(BSElement):
     """If exists then the building is owned by the federal government."""
 
 
-FederalBuilding.element_children = [
+FederalBuilding.element_children = (
     ("Agency", Agency),
     ("DepartmentRegion", DepartmentRegion),
-]
+)
 
 # BuildingType.TotalCommonConditionedAboveGradeWallArea
 class TotalCommonConditionedAboveGradeWallArea(nonNegativeDecimal):
@@ -9640,64 +9850,50 @@ class Assessment(BSElement):
     pass
 
 
-Assessment.element_children = [
+Assessment.element_children = (
     ("AssessmentProgram", AssessmentProgram),
     ("AssessmentLevel", AssessmentLevel),
     ("AssessmentValue", AssessmentValue),
     ("AssessmentYear", AssessmentYear),
     ("AssessmentVersion", AssessmentVersion),
-]
+)
 
 # WallID
 class WallID(BSElement):
     """ID number of the wall type associated with this side of the section."""
 
 
-WallID.element_attributes = [
-    "IDref",  # IDREF
-]
-WallID.element_children = [
-    ("WallArea", WallArea),
-]
+WallID.element_attributes = ("IDref",)  # IDREF
+WallID.element_children = (("WallArea", WallArea),)
 
 # BuildingType.Sections.Section.Sides.Side.WallIDs
 class WallIDs(BSElement):
     pass
 
 
-WallIDs.element_children = [
-    ("WallID", WallID),
-]
+WallIDs.element_children = (("WallID", WallID),)
 
 # DoorID
 class DoorID(BSElement):
     """ID number of the door type associated with this side of the section."""
 
 
-DoorID.element_attributes = [
-    "IDref",  # IDREF
-]
-DoorID.element_children = [
-    ("FenestrationArea", FenestrationArea),
-]
+DoorID.element_attributes = ("IDref",)  # IDREF
+DoorID.element_children = (("FenestrationArea", FenestrationArea),)
 
 # BuildingType.Sections.Section.Sides.Side.DoorIDs
 class DoorIDs(BSElement):
     pass
 
 
-DoorIDs.element_children = [
-    ("DoorID", DoorID),
-]
+DoorIDs.element_children = (("DoorID", DoorID),)
 
 # ThermalZoneIDs
 class ThermalZoneIDs(BSElement):
     pass
 
 
-ThermalZoneIDs.element_children = [
-    ("ThermalZoneID", ThermalZoneID),
-]
+ThermalZoneIDs.element_children = (("ThermalZoneID", ThermalZoneID),)
 
 # BuildingType.Sections.Section.Roofs.Roof.RoofID.RoofCondition
 class RoofCondition(EquipmentCondition):
@@ -9709,127 +9905,101 @@ class SkylightID(BSElement):
     """ID number of the skylight type associated with this side of the section."""
 
 
-SkylightID.element_attributes = [
-    "IDref",  # IDREF
-]
-SkylightID.element_children = [
-    ("PercentSkylightArea", PercentSkylightArea),
-]
+SkylightID.element_attributes = ("IDref",)  # IDREF
+SkylightID.element_children = (("PercentSkylightArea", PercentSkylightArea),)
 
 # BuildingType.Sections.Section.Roofs.Roof.RoofID.SkylightIDs
 class SkylightIDs(BSElement):
     """List of Skylight IDs."""
 
 
-SkylightIDs.element_children = [
-    ("SkylightID", SkylightID),
-]
+SkylightIDs.element_children = (("SkylightID", SkylightID),)
 
 # BuildingType.Sections.Section.Roofs.Roof.RoofID
 class RoofID(BSElement):
     """ID number of the roof type associated with this section."""
 
 
-RoofID.element_attributes = [
-    "IDref",  # IDREF
-]
-RoofID.element_children = [
+RoofID.element_attributes = ("IDref",)  # IDREF
+RoofID.element_children = (
     ("RoofArea", RoofArea),
     ("RoofInsulatedArea", RoofInsulatedArea),
     ("RoofCondition", RoofCondition),
     ("SkylightIDs", SkylightIDs),
-]
+)
 
 # BuildingType.Sections.Section.Roofs.Roof
 class Roof(BSElement):
     """A roof structure that forms the exterior upper covering of a premises."""
 
 
-Roof.element_children = [
-    ("RoofID", RoofID),
-]
+Roof.element_children = (("RoofID", RoofID),)
 
 # BuildingType.Sections.Section.Roofs
 class Roofs(BSElement):
     """List of roofs."""
 
 
-Roofs.element_children = [
-    ("Roof", Roof),
-]
+Roofs.element_children = (("Roof", Roof),)
 
 # SpaceIDs
 class SpaceIDs(BSElement):
     pass
 
 
-SpaceIDs.element_children = [
-    ("SpaceID", SpaceID),
-]
+SpaceIDs.element_children = (("SpaceID", SpaceID),)
 
 # BuildingType.Sections.Section.ExteriorFloors.ExteriorFloor.ExteriorFloorID
 class ExteriorFloorID(BSElement):
     """ID number of the exterior floor type associated with this section."""
 
 
-ExteriorFloorID.element_attributes = [
-    "IDref",  # IDREF
-]
-ExteriorFloorID.element_children = [
+ExteriorFloorID.element_attributes = ("IDref",)  # IDREF
+ExteriorFloorID.element_children = (
     ("ExteriorFloorArea", ExteriorFloorArea),
     ("ThermalZoneIDs", ThermalZoneIDs),
     ("SpaceIDs", SpaceIDs),
-]
+)
 
 # BuildingType.Sections.Section.ExteriorFloors.ExteriorFloor
 class ExteriorFloor(BSElement):
     """A raised floor exposed to air. For example, the top floor of a multistory parking structure."""
 
 
-ExteriorFloor.element_children = [
-    ("ExteriorFloorID", ExteriorFloorID),
-]
+ExteriorFloor.element_children = (("ExteriorFloorID", ExteriorFloorID),)
 
 # BuildingType.Sections.Section.ExteriorFloors
 class ExteriorFloors(BSElement):
     """List of exterior floors."""
 
 
-ExteriorFloors.element_children = [
-    ("ExteriorFloor", ExteriorFloor),
-]
+ExteriorFloors.element_children = (("ExteriorFloor", ExteriorFloor),)
 
 # BuildingType.Sections.Section.Foundations.Foundation.FoundationID
 class FoundationID(BSElement):
     """ID number of the foundation type associated with this section."""
 
 
-FoundationID.element_attributes = [
-    "IDref",  # IDREF
-]
-FoundationID.element_children = [
+FoundationID.element_attributes = ("IDref",)  # IDREF
+FoundationID.element_children = (
     ("FoundationArea", FoundationArea),
     ("ThermalZoneIDs", ThermalZoneIDs),
     ("SpaceIDs", SpaceIDs),
-]
+)
 
 # BuildingType.Sections.Section.Foundations.Foundation
 class Foundation(BSElement):
     """A construction element that supports the structure of the premises. In general it is made of masonry or concrete."""
 
 
-Foundation.element_children = [
-    ("FoundationID", FoundationID),
-]
+Foundation.element_children = (("FoundationID", FoundationID),)
 
 # BuildingType.Sections.Section.Foundations
 class Foundations(BSElement):
     """List of foundations."""
 
 
-Foundations.element_children = [
-    ("Foundation", Foundation),
-]
+Foundations.element_children = (("Foundation", Foundation),)
 
 # OriginalOccupancyClassification
 class OriginalOccupancyClassification(OccupancyClassificationType):
@@ -9841,98 +10011,88 @@ class DeliveryIDs(BSElement):
     pass
 
 
-DeliveryIDs.element_children = [
-    ("DeliveryID", DeliveryID),
-]
+DeliveryIDs.element_children = (("DeliveryID", DeliveryID),)
 
 # ThermalZoneType.HVACScheduleIDs
 class HVACScheduleIDs(BSElement):
     pass
 
 
-HVACScheduleIDs.element_children = [
-    ("HVACScheduleID", HVACScheduleID),
-]
+HVACScheduleIDs.element_children = (("HVACScheduleID", HVACScheduleID),)
 
 # SpaceType.OccupancyScheduleIDs
 class OccupancyScheduleIDs(BSElement):
     pass
 
 
-OccupancyScheduleIDs.element_children = [
-    ("OccupancyScheduleID", OccupancyScheduleID),
-]
+OccupancyScheduleIDs.element_children = (("OccupancyScheduleID", OccupancyScheduleID),)
 
 # ScheduleType.ScheduleDetails.ScheduleDetail
 class ScheduleDetail(BSElement):
     """Type of day for which the schedule will be specified."""
 
 
-ScheduleDetail.element_children = [
+ScheduleDetail.element_children = (
     ("DayType", DayType),
     ("ScheduleCategory", ScheduleCategory),
     ("DayStartTime", DayStartTime),
     ("DayEndTime", DayEndTime),
     ("PartialOperationPercentage", PartialOperationPercentage),
-]
+)
 
 # ContactType.ContactRoles
 class ContactRoles(BSElement):
     """Container for the a list of roles that a contact can have."""
 
 
-ContactRoles.element_children = [
-    ("ContactRole", ContactRole),
-]
+ContactRoles.element_children = (("ContactRole", ContactRole),)
 
 # ContactType.ContactTelephoneNumbers.ContactTelephoneNumber
 class ContactTelephoneNumber(BSElement):
     pass
 
 
-ContactTelephoneNumber.element_children = [
+ContactTelephoneNumber.element_children = (
     ("ContactTelephoneNumberLabel", ContactTelephoneNumberLabel),
     ("TelephoneNumber", TelephoneNumber),
-]
+)
 
 # ContactType.ContactEmailAddresses.ContactEmailAddress
 class ContactEmailAddress(BSElement):
     pass
 
 
-ContactEmailAddress.element_children = [
+ContactEmailAddress.element_children = (
     ("ContactEmailAddressLabel", ContactEmailAddressLabel),
     ("EmailAddress", EmailAddress),
-]
+)
 
 # TenantType.ContactIDs
 class ContactIDs(BSElement):
     pass
 
 
-ContactIDs.element_children = [
-    ("ContactID", ContactID),
-]
+ContactIDs.element_children = (("ContactID", ContactID),)
 
 # TenantType.TenantTelephoneNumbers.TenantTelephoneNumber
 class TenantTelephoneNumber(BSElement):
     pass
 
 
-TenantTelephoneNumber.element_children = [
+TenantTelephoneNumber.element_children = (
     ("TenantTelephoneNumberLabel", TenantTelephoneNumberLabel),
     ("TelephoneNumber", TelephoneNumber),
-]
+)
 
 # TenantType.TenantEmailAddresses.TenantEmailAddress
 class TenantEmailAddress(BSElement):
     pass
 
 
-TenantEmailAddress.element_children = [
+TenantEmailAddress.element_children = (
     ("TenantEmailAddressLabel", TenantEmailAddressLabel),
     ("EmailAddress", EmailAddress),
-]
+)
 
 # CBECSType
 class CBECSType(BSElement):
@@ -9940,12 +10100,10 @@ class CBECSType(BSElement):
         """Based on the Climate Zone Type term, this is the climate zone designation."""
 
         element_type = "xs:string"
-        element_enumerations = ["1", "2", "3", "4", "5"]
+        element_enumerations = ("1", "2", "3", "4", "5")
 
 
-CBECSType.element_children = [
-    ("ClimateZone", CBECSType.ClimateZone),
-]
+CBECSType.element_children = (("ClimateZone", CBECSType.ClimateZone),)
 
 
 # ScenarioType.ScenarioType.PackageOfMeasures.SimpleImpactAnalysis.EstimatedCost
@@ -9959,43 +10117,41 @@ class SimpleImpactAnalysis(BSElement):
         """See SPC 211 Standard for Commercial Building Energy Audits section 6.1.5(g)"""
 
 
-SimpleImpactAnalysis.element_children = [
+SimpleImpactAnalysis.element_children = (
     ("ImpactOnOccupantComfort", ImpactOnOccupantComfort),
     ("EstimatedCost", EstimatedCost),
     ("EstimatedAnnualSavings", EstimatedAnnualSavings),
     ("EstimatedROI", EstimatedROI),
     ("Priority", SimpleImpactAnalysis.Priority),
-]
+)
 
 # ScenarioType.WeatherType.Normalized
 class Normalized(BSElement):
     pass
 
 
-Normalized.element_children = [
+Normalized.element_children = (
     ("NormalizationYears", NormalizationYears),
     ("NormalizationStartYear", NormalizationStartYear),
     ("WeatherDataSource", WeatherDataSource),
-]
+)
 
 # ScenarioType.WeatherType.AdjustedToYear
 class AdjustedToYear(BSElement):
     pass
 
 
-AdjustedToYear.element_children = [
+AdjustedToYear.element_children = (
     ("WeatherYear", WeatherYear),
     ("WeatherDataSource", WeatherDataSource),
-]
+)
 
 # UtilityType.UtilityMeterNumbers
 class UtilityMeterNumbers(BSElement):
     pass
 
 
-UtilityMeterNumbers.element_children = [
-    ("UtilityMeterNumber", UtilityMeterNumber),
-]
+UtilityMeterNumbers.element_children = (("UtilityMeterNumber", UtilityMeterNumber),)
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.FlatRate
 class FlatRate(BSElement):
@@ -10006,13 +10162,11 @@ class FlatRate(BSElement):
             pass
 
 
-FlatRate.element_children = [
-    ("RatePeriods", FlatRate.RatePeriods),
-]
-FlatRate.RatePeriods.element_children = [
+FlatRate.element_children = (("RatePeriods", FlatRate.RatePeriods),)
+FlatRate.RatePeriods.element_children = (
     ("RatePeriod", FlatRate.RatePeriods.RatePeriod),
-]
-FlatRate.RatePeriods.RatePeriod.element_children = [
+)
+FlatRate.RatePeriods.RatePeriod.element_children = (
     ("RatePeriodName", RatePeriodName),
     ("ApplicableStartDateForEnergyRate", ApplicableStartDateForEnergyRate),
     ("ApplicableEndDateForEnergyRate", ApplicableEndDateForEnergyRate),
@@ -10025,14 +10179,14 @@ FlatRate.RatePeriods.RatePeriod.element_children = [
     ("ElectricDemandRate", ElectricDemandRate),
     ("DemandRateAdjustment", DemandRateAdjustment),
     ("EnergySellRate", EnergySellRate),
-]
+)
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.TimeOfUseRate.RatePeriods.RatePeriod.TimeOfUsePeriods.TimeOfUsePeriod
 class TimeOfUsePeriod(BSElement):
     pass
 
 
-TimeOfUsePeriod.element_children = [
+TimeOfUsePeriod.element_children = (
     ("TOUNumberForRateStructure", TOUNumberForRateStructure),
     ("ApplicableStartTimeForEnergyRate", ApplicableStartTimeForEnergyRate),
     ("ApplicableEndTimeForEnergyRate", ApplicableEndTimeForEnergyRate),
@@ -10044,16 +10198,14 @@ TimeOfUsePeriod.element_children = [
     ("DemandRateAdjustment", DemandRateAdjustment),
     ("DemandWindow", DemandWindow),
     ("DemandRatchetPercentage", DemandRatchetPercentage),
-]
+)
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.TimeOfUseRate.RatePeriods.RatePeriod.TimeOfUsePeriods
 class TimeOfUsePeriods(BSElement):
     pass
 
 
-TimeOfUsePeriods.element_children = [
-    ("TimeOfUsePeriod", TimeOfUsePeriod),
-]
+TimeOfUsePeriods.element_children = (("TimeOfUsePeriod", TimeOfUsePeriod),)
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.TimeOfUseRate
 class TimeOfUseRate(BSElement):
@@ -10064,13 +10216,11 @@ class TimeOfUseRate(BSElement):
             pass
 
 
-TimeOfUseRate.element_children = [
-    ("RatePeriods", TimeOfUseRate.RatePeriods),
-]
-TimeOfUseRate.RatePeriods.element_children = [
+TimeOfUseRate.element_children = (("RatePeriods", TimeOfUseRate.RatePeriods),)
+TimeOfUseRate.RatePeriods.element_children = (
     ("RatePeriod", TimeOfUseRate.RatePeriods.RatePeriod),
-]
-TimeOfUseRate.RatePeriods.RatePeriod.element_children = [
+)
+TimeOfUseRate.RatePeriods.RatePeriod.element_children = (
     ("RatePeriodName", RatePeriodName),
     ("ApplicableStartDateForEnergyRate", ApplicableStartDateForEnergyRate),
     ("ApplicableEndDateForEnergyRate", ApplicableEndDateForEnergyRate),
@@ -10078,14 +10228,14 @@ TimeOfUseRate.RatePeriods.RatePeriod.element_children = [
     ("ApplicableEndDateForDemandRate", ApplicableEndDateForDemandRate),
     ("TimeOfUsePeriods", TimeOfUsePeriods),
     ("EnergySellRate", EnergySellRate),
-]
+)
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.TieredRates.TieredRate.RatePeriods.RatePeriod.RateTiers.RateTier
 class RateTier(BSElement):
     pass
 
 
-RateTier.element_children = [
+RateTier.element_children = (
     ("ConsumptionEnergyTierDesignation", ConsumptionEnergyTierDesignation),
     ("MaxkWhUsage", MaxkWhUsage),
     ("MaxkWUsage", MaxkWUsage),
@@ -10095,16 +10245,14 @@ RateTier.element_children = [
     ("DemandRateAdjustment", DemandRateAdjustment),
     ("DemandWindow", DemandWindow),
     ("DemandRatchetPercentage", DemandRatchetPercentage),
-]
+)
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.TieredRates.TieredRate.RatePeriods.RatePeriod.RateTiers
 class RateTiers(BSElement):
     pass
 
 
-RateTiers.element_children = [
-    ("RateTier", RateTier),
-]
+RateTiers.element_children = (("RateTier", RateTier),)
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.TieredRates.TieredRate
 class TieredRate(BSElement):
@@ -10115,14 +10263,14 @@ class TieredRate(BSElement):
             pass
 
 
-TieredRate.element_children = [
+TieredRate.element_children = (
     ("RatePeriods", TieredRate.RatePeriods),
     ("TierDirection", TierDirection),
-]
-TieredRate.RatePeriods.element_children = [
+)
+TieredRate.RatePeriods.element_children = (
     ("RatePeriod", TieredRate.RatePeriods.RatePeriod),
-]
-TieredRate.RatePeriods.RatePeriod.element_children = [
+)
+TieredRate.RatePeriods.RatePeriod.element_children = (
     ("RatePeriodName", RatePeriodName),
     ("ApplicableStartDateForEnergyRate", ApplicableStartDateForEnergyRate),
     ("ApplicableEndDateForEnergyRate", ApplicableEndDateForEnergyRate),
@@ -10130,16 +10278,14 @@ TieredRate.RatePeriods.RatePeriod.element_children = [
     ("ApplicableEndDateForDemandRate", ApplicableEndDateForDemandRate),
     ("RateTiers", RateTiers),
     ("EnergySellRate", EnergySellRate),
-]
+)
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure.TieredRates
 class TieredRates(BSElement):
     pass
 
 
-TieredRates.element_children = [
-    ("TieredRate", TieredRate),
-]
+TieredRates.element_children = (("TieredRate", TieredRate),)
 
 # Unknown
 class Unknown(UnknownType):
@@ -10151,9 +10297,7 @@ class NetMetering(BSElement):
     """Present if a billing mechanism is employed by utilities to credit onsite energy generation for this rate structure."""
 
 
-NetMetering.element_children = [
-    ("AverageMarginalSellRate", AverageMarginalSellRate),
-]
+NetMetering.element_children = (("AverageMarginalSellRate", AverageMarginalSellRate),)
 
 # EnergyResource
 class EnergyResource(FuelTypes):
@@ -10170,34 +10314,32 @@ class AnnualFuelUseLinkedTimeSeriesIDs(BSElement):
     """Links to all time series data used to calculate the AnnualFuelUse values."""
 
 
-AnnualFuelUseLinkedTimeSeriesIDs.element_children = [
+AnnualFuelUseLinkedTimeSeriesIDs.element_children = (
     ("LinkedTimeSeriesID", LinkedTimeSeriesID),
-]
+)
 
 # ResourceUseType.UtilityIDs
 class UtilityIDs(BSElement):
     pass
 
 
-UtilityIDs.element_children = [
-    ("UtilityID", UtilityID),
-]
+UtilityIDs.element_children = (("UtilityID", UtilityID),)
 
 # ResourceUseType.Emissions.Emission.EmissionsLinkedTimeSeriesIDs
 class EmissionsLinkedTimeSeriesIDs(BSElement):
     """Links to all time series data used to calculate the total GHG Emissions"""
 
 
-EmissionsLinkedTimeSeriesIDs.element_children = [
+EmissionsLinkedTimeSeriesIDs.element_children = (
     ("EmissionsLinkedTimeSeriesID", EmissionsLinkedTimeSeriesID),
-]
+)
 
 # ResourceUseType.Emissions.Emission
 class Emission(BSElement):
     pass
 
 
-Emission.element_children = [
+Emission.element_children = (
     ("EmissionBoundary", EmissionBoundary),
     ("EmissionsType", EmissionsType),
     ("EmissionsFactor", EmissionsFactor),
@@ -10206,7 +10348,7 @@ Emission.element_children = [
     ("GHGEmissionIntensity", GHGEmissionIntensity),
     ("AvoidedEmissions", AvoidedEmissions),
     ("EmissionsLinkedTimeSeriesIDs", EmissionsLinkedTimeSeriesIDs),
-]
+)
 
 # TimeSeriesType.IntervalDurationUnits
 class IntervalDurationUnits(IntervalFrequencyType):
@@ -10223,82 +10365,76 @@ class Replacement(BSElement):
     pass
 
 
-Replacement.element_children = [
+Replacement.element_children = (
     ("ExistingSystemReplaced", ExistingSystemReplaced),
     ("AlternativeSystemReplacement", AlternativeSystemReplacement),
     ("ExistingScheduleAffected", ExistingScheduleAffected),
     ("ModifiedSchedule", ModifiedSchedule),
-]
+)
 
 # MeasureType.TypeOfMeasure.Replacements
 class Replacements(BSElement):
     pass
 
 
-Replacements.element_children = [
-    ("Replacement", Replacement),
-]
+Replacements.element_children = (("Replacement", Replacement),)
 
 # MeasureType.TypeOfMeasure.ModificationRetrocommissions.ModificationRetrocommissioning
 class ModificationRetrocommissioning(BSElement):
     pass
 
 
-ModificationRetrocommissioning.element_children = [
+ModificationRetrocommissioning.element_children = (
     ("ExistingSystemAffected", ExistingSystemAffected),
     ("ModifiedSystem", ModifiedSystem),
     ("ExistingScheduleAffected", ExistingScheduleAffected),
     ("ModifiedSchedule", ModifiedSchedule),
-]
+)
 
 # MeasureType.TypeOfMeasure.ModificationRetrocommissions
 class ModificationRetrocommissions(BSElement):
     pass
 
 
-ModificationRetrocommissions.element_children = [
+ModificationRetrocommissions.element_children = (
     ("ModificationRetrocommissioning", ModificationRetrocommissioning),
-]
+)
 
 # MeasureType.TypeOfMeasure.Additions.Addition
 class Addition(BSElement):
     pass
 
 
-Addition.element_children = [
+Addition.element_children = (
     ("AlternativeSystemAdded", AlternativeSystemAdded),
     ("ExistingScheduleAffected", ExistingScheduleAffected),
     ("ModifiedSchedule", ModifiedSchedule),
-]
+)
 
 # MeasureType.TypeOfMeasure.Additions
 class Additions(BSElement):
     pass
 
 
-Additions.element_children = [
-    ("Addition", Addition),
-]
+Additions.element_children = (("Addition", Addition),)
 
 # MeasureType.TypeOfMeasure.Removals.Removal
 class Removal(BSElement):
     pass
 
 
-Removal.element_children = [
+Removal.element_children = (
     ("ExistingSystemRemoved", ExistingSystemRemoved),
     ("ExistingScheduleAffected", ExistingScheduleAffected),
     ("ModifiedSchedule", ModifiedSchedule),
-]
+)
 
 # MeasureType.TypeOfMeasure.Removals
 class Removals(BSElement):
     pass
 
 
-Removals.element_children = [
-    ("Removal", Removal),
-]
+Removals.element_children = (("Removal", Removal),)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.BoilerPlantImprovements
 class BoilerPlantImprovements(BSElement):
@@ -10308,7 +10444,7 @@ class BoilerPlantImprovements(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Replace boiler",
             "Replace burner",
             "Decentralize boiler",
@@ -10328,12 +10464,12 @@ class BoilerPlantImprovements(BSElement):
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Convert to Cleaner Fuels",
             "Other",
-        ]
+        )
 
 
-BoilerPlantImprovements.element_children = [
+BoilerPlantImprovements.element_children = (
     ("MeasureName", BoilerPlantImprovements.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.ChillerPlantImprovements
 class ChillerPlantImprovements(BSElement):
@@ -10343,7 +10479,7 @@ class ChillerPlantImprovements(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Add energy recovery",
             "Install VSD on electric centrifugal chillers",
             "Replace chiller",
@@ -10361,12 +10497,12 @@ class ChillerPlantImprovements(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-ChillerPlantImprovements.element_children = [
+ChillerPlantImprovements.element_children = (
     ("MeasureName", ChillerPlantImprovements.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.BuildingAutomationSystems
 class BuildingAutomationSystems(BSElement):
@@ -10376,19 +10512,19 @@ class BuildingAutomationSystems(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Add heat recovery",
             "Add or upgrade BAS/EMS/EMCS",
             "Add or upgrade controls",
             "Convert pneumatic controls to DDC",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-BuildingAutomationSystems.element_children = [
+BuildingAutomationSystems.element_children = (
     ("MeasureName", BuildingAutomationSystems.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.OtherHVAC
 class OtherHVAC(BSElement):
@@ -10398,7 +10534,7 @@ class OtherHVAC(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Replace or modify AHU",
             "Improve distribution fans",
             "Improve ventilation fans",
@@ -10436,12 +10572,10 @@ class OtherHVAC(BSElement):
             "Other ventilation",
             "Other distribution",
             "Other",
-        ]
+        )
 
 
-OtherHVAC.element_children = [
-    ("MeasureName", OtherHVAC.MeasureName),
-]
+OtherHVAC.element_children = (("MeasureName", OtherHVAC.MeasureName),)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.LightingImprovements
 class LightingImprovements(BSElement):
@@ -10451,7 +10585,7 @@ class LightingImprovements(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Retrofit with CFLs",
             "Retrofit with T-5",
             "Retrofit with T-8",
@@ -10469,12 +10603,12 @@ class LightingImprovements(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-LightingImprovements.element_children = [
+LightingImprovements.element_children = (
     ("MeasureName", LightingImprovements.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.BuildingEnvelopeModifications
 class BuildingEnvelopeModifications(BSElement):
@@ -10484,7 +10618,7 @@ class BuildingEnvelopeModifications(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Air seal envelope",
             "Increase wall insulation",
             "Insulate thermal bypasses",
@@ -10503,12 +10637,12 @@ class BuildingEnvelopeModifications(BSElement):
             "Clean and/or repair",
             "Close elevator and/or stairwell shaft vents",
             "Other",
-        ]
+        )
 
 
-BuildingEnvelopeModifications.element_children = [
+BuildingEnvelopeModifications.element_children = (
     ("MeasureName", BuildingEnvelopeModifications.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.ChilledWaterHotWaterAndSteamDistributionSystems
 class ChilledWaterHotWaterAndSteamDistributionSystems(BSElement):
@@ -10518,7 +10652,7 @@ class ChilledWaterHotWaterAndSteamDistributionSystems(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Add pipe insulation",
             "Repair and/or replace steam traps",
             "Retrofit and replace chiller plant pumping, piping, and controls",
@@ -10538,12 +10672,12 @@ class ChilledWaterHotWaterAndSteamDistributionSystems(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-ChilledWaterHotWaterAndSteamDistributionSystems.element_children = [
+ChilledWaterHotWaterAndSteamDistributionSystems.element_children = (
     ("MeasureName", ChilledWaterHotWaterAndSteamDistributionSystems.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.OtherElectricMotorsAndDrives
 class OtherElectricMotorsAndDrives(BSElement):
@@ -10553,7 +10687,7 @@ class OtherElectricMotorsAndDrives(BSElement):
         """Short description of measure"""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Add drive controls",
             "Replace with higher efficiency",
             "Add VSD motor controller",
@@ -10561,12 +10695,12 @@ class OtherElectricMotorsAndDrives(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-OtherElectricMotorsAndDrives.element_children = [
+OtherElectricMotorsAndDrives.element_children = (
     ("MeasureName", OtherElectricMotorsAndDrives.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.Refrigeration
 class Refrigeration(BSElement):
@@ -10576,7 +10710,7 @@ class Refrigeration(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Replace ice/refrigeration equipment with high efficiency units",
             "Replace air-cooled ice/refrigeration equipment",
             "Replace refrigerators",
@@ -10584,12 +10718,10 @@ class Refrigeration(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-Refrigeration.element_children = [
-    ("MeasureName", Refrigeration.MeasureName),
-]
+Refrigeration.element_children = (("MeasureName", Refrigeration.MeasureName),)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.DistributedGeneration
 class DistributedGeneration(BSElement):
@@ -10599,7 +10731,7 @@ class DistributedGeneration(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install CHP/cogeneration systems",
             "Install fuel cells",
             "Install microturbines",
@@ -10608,12 +10740,12 @@ class DistributedGeneration(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-DistributedGeneration.element_children = [
+DistributedGeneration.element_children = (
     ("MeasureName", DistributedGeneration.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.RenewableEnergySystems
 class RenewableEnergySystems(BSElement):
@@ -10623,7 +10755,7 @@ class RenewableEnergySystems(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install landfill gas, wastewater treatment plant digester gas, or coal bed methane power plant",
             "Install photovoltaic system",
             "Install wind energy system",
@@ -10633,12 +10765,12 @@ class RenewableEnergySystems(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-RenewableEnergySystems.element_children = [
+RenewableEnergySystems.element_children = (
     ("MeasureName", RenewableEnergySystems.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.EnergyDistributionSystems
 class EnergyDistributionSystems(BSElement):
@@ -10648,7 +10780,7 @@ class EnergyDistributionSystems(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Implement power factor corrections",
             "Implement power quality upgrades",
             "Upgrade transformers",
@@ -10657,12 +10789,12 @@ class EnergyDistributionSystems(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-EnergyDistributionSystems.element_children = [
+EnergyDistributionSystems.element_children = (
     ("MeasureName", EnergyDistributionSystems.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.ServiceHotWaterSystems
 class ServiceHotWaterSystems(BSElement):
@@ -10672,7 +10804,7 @@ class ServiceHotWaterSystems(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Decrease SHW temperature",
             "Install SHW controls",
             "Install solar thermal SHW",
@@ -10689,12 +10821,12 @@ class ServiceHotWaterSystems(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-ServiceHotWaterSystems.element_children = [
+ServiceHotWaterSystems.element_children = (
     ("MeasureName", ServiceHotWaterSystems.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.WaterAndSewerConservationSystems
 class WaterAndSewerConservationSystems(BSElement):
@@ -10704,7 +10836,7 @@ class WaterAndSewerConservationSystems(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install low-flow faucets and showerheads",
             "Install low-flow plumbing equipment",
             "Install onsite sewer treatment systems",
@@ -10722,12 +10854,12 @@ class WaterAndSewerConservationSystems(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-WaterAndSewerConservationSystems.element_children = [
+WaterAndSewerConservationSystems.element_children = (
     ("MeasureName", WaterAndSewerConservationSystems.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.ElectricalPeakShavingLoadShifting
 class ElectricalPeakShavingLoadShifting(BSElement):
@@ -10737,17 +10869,17 @@ class ElectricalPeakShavingLoadShifting(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install thermal energy storage",
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-ElectricalPeakShavingLoadShifting.element_children = [
+ElectricalPeakShavingLoadShifting.element_children = (
     ("MeasureName", ElectricalPeakShavingLoadShifting.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.EnergyCostReductionThroughRateAdjustments
 class EnergyCostReductionThroughRateAdjustments(BSElement):
@@ -10757,18 +10889,18 @@ class EnergyCostReductionThroughRateAdjustments(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Change to more favorable rate schedule",
             "Energy cost reduction through rate adjustments - uncategorized",
             "Energy service billing and meter auditing recommendations",
             "Change to lower energy cost supplier(s)",
             "Other",
-        ]
+        )
 
 
-EnergyCostReductionThroughRateAdjustments.element_children = [
+EnergyCostReductionThroughRateAdjustments.element_children = (
     ("MeasureName", EnergyCostReductionThroughRateAdjustments.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.EnergyRelatedProcessImprovements
 class EnergyRelatedProcessImprovements(BSElement):
@@ -10778,19 +10910,19 @@ class EnergyRelatedProcessImprovements(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Implement industrial process improvements",
             "Implement production and/or manufacturing improvements",
             "Clean and/or repair",
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-EnergyRelatedProcessImprovements.element_children = [
+EnergyRelatedProcessImprovements.element_children = (
     ("MeasureName", EnergyRelatedProcessImprovements.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.AdvancedMeteringSystems
 class AdvancedMeteringSystems(BSElement):
@@ -10800,18 +10932,18 @@ class AdvancedMeteringSystems(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install advanced metering systems",
             "Clean and/or repair",
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-AdvancedMeteringSystems.element_children = [
+AdvancedMeteringSystems.element_children = (
     ("MeasureName", AdvancedMeteringSystems.MeasureName),
-]
+)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.PlugLoadReductions
 class PlugLoadReductions(BSElement):
@@ -10821,7 +10953,7 @@ class PlugLoadReductions(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Replace with ENERGY STAR rated",
             "Install plug load controls",
             "Automatic shutdown or sleep mode for computers",
@@ -10832,12 +10964,10 @@ class PlugLoadReductions(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-PlugLoadReductions.element_children = [
-    ("MeasureName", PlugLoadReductions.MeasureName),
-]
+PlugLoadReductions.element_children = (("MeasureName", PlugLoadReductions.MeasureName),)
 
 # MeasureType.TechnologyCategories.TechnologyCategory.DataCenterImprovements
 class DataCenterImprovements(BSElement):
@@ -10847,7 +10977,7 @@ class DataCenterImprovements(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Improve data center efficiency",
             "Implement hot aisle hold aisle design",
             "Implement hot aisle cold aisle design",
@@ -10860,12 +10990,12 @@ class DataCenterImprovements(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-DataCenterImprovements.element_children = [
+DataCenterImprovements.element_children = (
     ("MeasureName", DataCenterImprovements.MeasureName),
-]
+)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory.AlternativeWaterSources
@@ -10876,7 +11006,7 @@ class AlternativeWaterSources(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install condensate capture equipment",
             "Install atmospheric water generator",
             "Install wastewater treatment plant",
@@ -10890,12 +11020,12 @@ class AlternativeWaterSources(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-AlternativeWaterSources.element_children = [
+AlternativeWaterSources.element_children = (
     ("MeasureName", AlternativeWaterSources.MeasureName),
-]
+)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory.KitchenImprovements
@@ -10906,7 +11036,7 @@ class KitchenImprovements(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Retrofit single-pass cooling ice machine to closed loop",
             "Install food disposal load sensing device",
             "Replace with ENERGY STAR-qualified commercial dishwashers",
@@ -10920,12 +11050,12 @@ class KitchenImprovements(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-KitchenImprovements.element_children = [
+KitchenImprovements.element_children = (
     ("MeasureName", KitchenImprovements.MeasureName),
-]
+)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory.LaboratoryAndMedicalEquipments
@@ -10936,7 +11066,7 @@ class LaboratoryAndMedicalEquipments(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install dry vacuum or air-cooled vacuum pump",
             "Retrofit liquid-ring vacuum pump with a water recovery system",
             "Install digital photographic or X-ray equipment",
@@ -10954,12 +11084,12 @@ class LaboratoryAndMedicalEquipments(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-LaboratoryAndMedicalEquipments.element_children = [
+LaboratoryAndMedicalEquipments.element_children = (
     ("MeasureName", LaboratoryAndMedicalEquipments.MeasureName),
-]
+)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory.IrrigationSystemsAndLandscapingImprovements
@@ -10970,7 +11100,7 @@ class IrrigationSystemsAndLandscapingImprovements(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install advanced weather-based irrigation controller",
             "Install advanced soil-moisture based irrigation controller",
             "Install water-efficient irrigation sprinkler heads",
@@ -10985,12 +11115,12 @@ class IrrigationSystemsAndLandscapingImprovements(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-IrrigationSystemsAndLandscapingImprovements.element_children = [
+IrrigationSystemsAndLandscapingImprovements.element_children = (
     ("MeasureName", IrrigationSystemsAndLandscapingImprovements.MeasureName),
-]
+)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory.WashingEquipmentsAndTechiques
@@ -11001,7 +11131,7 @@ class WashingEquipmentsAndTechiques(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Install automatic shutoff nozzle for self-service vehicle wash",
             "Implement water-efficient optimization for vehicle washing equipment",
             "Retrofit vehicle washing equipment with water recycling system",
@@ -11016,12 +11146,12 @@ class WashingEquipmentsAndTechiques(BSElement):
             "Implement training and/or documentation",
             "Upgrade operating protocols, calibration, and/or sequencing",
             "Other",
-        ]
+        )
 
 
-WashingEquipmentsAndTechiques.element_children = [
+WashingEquipmentsAndTechiques.element_children = (
     ("MeasureName", WashingEquipmentsAndTechiques.MeasureName),
-]
+)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory.FutureOtherECMs
@@ -11032,12 +11162,10 @@ class FutureOtherECMs(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = ["Other"]
+        element_enumerations = ("Other",)
 
 
-FutureOtherECMs.element_children = [
-    ("MeasureName", FutureOtherECMs.MeasureName),
-]
+FutureOtherECMs.element_children = (("MeasureName", FutureOtherECMs.MeasureName),)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory.HealthAndSafety
@@ -11050,9 +11178,7 @@ class HealthAndSafety(BSElement):
         element_type = "xs:string"
 
 
-HealthAndSafety.element_children = [
-    ("MeasureName", HealthAndSafety.MeasureName),
-]
+HealthAndSafety.element_children = (("MeasureName", HealthAndSafety.MeasureName),)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory.Uncategorized
@@ -11063,12 +11189,10 @@ class Uncategorized(BSElement):
         """Short description of measure."""
 
         element_type = "xs:string"
-        element_enumerations = ["Other"]
+        element_enumerations = ("Other",)
 
 
-Uncategorized.element_children = [
-    ("MeasureName", Uncategorized.MeasureName),
-]
+Uncategorized.element_children = (("MeasureName", Uncategorized.MeasureName),)
 
 
 # MeasureType.TechnologyCategories.TechnologyCategory
@@ -11082,7 +11206,7 @@ class TechnologyCategory(BSElement):
             """Short description of measure."""
 
             element_type = "xs:string"
-            element_enumerations = [
+            element_enumerations = (
                 "Add elevator regenerative drives",
                 "Upgrade controls",
                 "Upgrade motors",
@@ -11090,10 +11214,10 @@ class TechnologyCategory(BSElement):
                 "Implement training and/or documentation",
                 "Upgrade operating protocols, calibration, and/or sequencing",
                 "Other",
-            ]
+            )
 
 
-TechnologyCategory.element_children = [
+TechnologyCategory.element_children = (
     ("BoilerPlantImprovements", BoilerPlantImprovements),
     ("ChillerPlantImprovements", ChillerPlantImprovements),
     ("BuildingAutomationSystems", BuildingAutomationSystems),
@@ -11132,10 +11256,10 @@ TechnologyCategory.element_children = [
     ("FutureOtherECMs", FutureOtherECMs),
     ("HealthAndSafety", HealthAndSafety),
     ("Uncategorized", Uncategorized),
-]
-TechnologyCategory.ConveyanceSystems.element_children = [
+)
+TechnologyCategory.ConveyanceSystems.element_children = (
     ("MeasureName", TechnologyCategory.ConveyanceSystems.MeasureName),
-]
+)
 
 
 # ReportType.AuditDates.AuditDate
@@ -11143,11 +11267,11 @@ class AuditDate(BSElement):
     pass
 
 
-AuditDate.element_children = [
+AuditDate.element_children = (
     ("Date", Date),
     ("DateType", DateType),
     ("CustomDateType", CustomDateType),
-]
+)
 
 
 # ReportType.OtherEscalationRates.OtherEscalationRate
@@ -11155,13 +11279,11 @@ class OtherEscalationRate(BSElement):
     pass
 
 
-OtherEscalationRate.element_attributes = [
-    "Source",  # Source
-]
-OtherEscalationRate.element_children = [
+OtherEscalationRate.element_attributes = ("Source",)  # Source
+OtherEscalationRate.element_children = (
     ("EnergyResource", EnergyResource),
     ("EscalationRate", EscalationRate),
-]
+)
 
 
 # ReportType.Qualifications.Qualification.AuditorQualification
@@ -11179,10 +11301,8 @@ class Qualification(BSElement):
     """Qualifications of audit team."""
 
 
-Qualification.element_attributes = [
-    "ID",  # ID
-]
-Qualification.element_children = [
+Qualification.element_attributes = _ID_ATTRS
+Qualification.element_children = (
     ("AuditorQualification", AuditorQualification),
     ("AuditorQualificationNumber", AuditorQualificationNumber),
     ("AuditorQualificationState", AuditorQualificationState),
@@ -11190,7 +11310,7 @@ Qualification.element_children = [
     ("CertifiedAuditTeamMemberContactID", CertifiedAuditTeamMemberContactID),
     ("AuditTeamMemberCertificationType", AuditTeamMemberCertificationType),
     ("AuditorYearsOfExperience", AuditorYearsOfExperience),
-]
+)
 
 
 # HVACSystemType.HVACControlSystemTypes
@@ -11198,9 +11318,9 @@ class HVACControlSystemTypes(BSElement):
     """HVAC equipment control strategies."""
 
 
-HVACControlSystemTypes.element_children = [
+HVACControlSystemTypes.element_children = (
     ("HVACControlSystemType", HVACControlSystemType),
-]
+)
 
 
 # ElectricResistance
@@ -11213,7 +11333,7 @@ class Furnace(BSElement):
     pass
 
 
-Furnace.element_children = [
+Furnace.element_children = (
     ("FurnaceType", FurnaceType),
     ("BurnerType", BurnerType),
     ("BurnerControlType", BurnerControlType),
@@ -11227,7 +11347,7 @@ Furnace.element_children = [
     ("CombustionEfficiency", CombustionEfficiency),
     ("ThermalEfficiency", ThermalEfficiency),
     ("ThirdPartyCertification", ThirdPartyCertification),
-]
+)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.HeatingSources.HeatingSource.HeatingSourceType.HeatPump.HeatPumpBackupSystemFuel
@@ -11255,9 +11375,7 @@ class CondenserPlantIDs(BSElement):
     pass
 
 
-CondenserPlantIDs.element_children = [
-    ("CondenserPlantID", CondenserPlantID),
-]
+CondenserPlantIDs.element_children = (("CondenserPlantID", CondenserPlantID),)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.CoolingSources.CoolingSource.CoolingSourceType.EvaporativeCooler
@@ -11265,9 +11383,9 @@ class EvaporativeCooler(BSElement):
     pass
 
 
-EvaporativeCooler.element_children = [
+EvaporativeCooler.element_children = (
     ("EvaporativeCoolingType", EvaporativeCoolingType),
-]
+)
 
 
 # NoCooling
@@ -11290,11 +11408,11 @@ class Convection(BSElement):
     pass
 
 
-Convection.element_children = [
+Convection.element_children = (
     ("ConvectionType", ConvectionType),
     ("PipeInsulationThickness", PipeInsulationThickness),
     ("PipeLocation", PipeLocation),
-]
+)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType.ZoneEquipment.Radiant
@@ -11302,11 +11420,11 @@ class Radiant(BSElement):
     pass
 
 
-Radiant.element_children = [
+Radiant.element_children = (
     ("RadiantType", RadiantType),
     ("PipeInsulationThickness", PipeInsulationThickness),
     ("PipeLocation", PipeLocation),
-]
+)
 
 
 # DuctSystemType.DuctInsulationCondition
@@ -11321,16 +11439,14 @@ class SupplyFractionOfDuctLeakage(BoundedDecimalZeroToOneWithSourceAttribute):
 
 # HeatingPlantType.DistrictHeating
 class DistrictHeating(BSElement):
-    class OutputCapacity(OutputCapacity):
-        pass
-
     class Capacity(BSElement):
         """Output capacity of equipment."""
 
         element_type = "xs:decimal"
 
 
-DistrictHeating.element_children = [
+DistrictHeating.OutputCapacity = OutputCapacity
+DistrictHeating.element_children = (
     ("DistrictHeatingType", DistrictHeatingType),
     ("OutputCapacity", OutputCapacity),
     ("Capacity", DistrictHeating.Capacity),
@@ -11342,28 +11458,26 @@ DistrictHeating.element_children = [
     ("SteamBoilerMinimumOperatingPressure", SteamBoilerMinimumOperatingPressure),
     ("SteamBoilerMaximumOperatingPressure", SteamBoilerMaximumOperatingPressure),
     ("Quantity", Quantity),
-]
+)
 
 
 # HeatingPlantType.SolarThermal
 class SolarThermal(BSElement):
-    class OutputCapacity(OutputCapacity):
-        pass
-
     class Capacity(BSElement):
         """Output capacity of equipment."""
 
         element_type = "xs:decimal"
 
 
-SolarThermal.element_children = [
+SolarThermal.OutputCapacity = OutputCapacity
+SolarThermal.element_children = (
     ("OutputCapacity", OutputCapacity),
     ("Capacity", SolarThermal.Capacity),
     ("CapacityUnits", CapacityUnits),
     ("AnnualHeatingEfficiencyValue", AnnualHeatingEfficiencyValue),
     ("AnnualHeatingEfficiencyUnits", AnnualHeatingEfficiencyUnits),
     ("Quantity", Quantity),
-]
+)
 
 
 # CoolingPlantType.DistrictChilledWater
@@ -11371,7 +11485,7 @@ class DistrictChilledWater(BSElement):
     pass
 
 
-DistrictChilledWater.element_children = [
+DistrictChilledWater.element_children = (
     ("AnnualCoolingEfficiencyValue", AnnualCoolingEfficiencyValue),
     ("AnnualCoolingEfficiencyUnits", AnnualCoolingEfficiencyUnits),
     ("Capacity", Capacity),
@@ -11379,7 +11493,7 @@ DistrictChilledWater.element_children = [
     ("RatedCoolingSensibleHeatRatio", RatedCoolingSensibleHeatRatio),
     ("ChilledWaterSupplyTemperature", ChilledWaterSupplyTemperature),
     ("ActiveDehumidification", ActiveDehumidification),
-]
+)
 
 
 # CoolingPlantType.Chiller.PartLoadRatioBelowWhichHotGasBypassOperates
@@ -11394,11 +11508,11 @@ class GlycolCooledDryCooler(BSElement):
     pass
 
 
-GlycolCooledDryCooler.element_children = [
+GlycolCooledDryCooler.element_children = (
     ("CondensingTemperature", CondensingTemperature),
     ("Capacity", Capacity),
     ("CapacityUnits", CapacityUnits),
-]
+)
 
 
 # CondenserPlantType.AirCooled.EvaporativelyCooledCondenser
@@ -11406,10 +11520,8 @@ class EvaporativelyCooledCondenser(BSElement):
     """If exists then the unit uses evaporative cooling to enhance heat rejection from the condenser coils."""
 
 
-EvaporativelyCooledCondenser.element_attributes = [
-    "ID",  # ID
-]
-EvaporativelyCooledCondenser.element_children = [
+EvaporativelyCooledCondenser.element_attributes = _ID_ATTRS
+EvaporativelyCooledCondenser.element_children = (
     (
         "EvaporativelyCooledCondenserMinimumTemperature",
         EvaporativelyCooledCondenserMinimumTemperature,
@@ -11418,7 +11530,7 @@ EvaporativelyCooledCondenser.element_children = [
         "EvaporativelyCooledCondenserMaximumTemperature",
         EvaporativelyCooledCondenserMaximumTemperature,
     ),
-]
+)
 
 
 # OtherHVACSystemType.LinkedDeliveryIDs
@@ -11426,9 +11538,7 @@ class LinkedDeliveryIDs(BSElement):
     """List of connections to air distribution systems."""
 
 
-LinkedDeliveryIDs.element_children = [
-    ("LinkedDeliveryID", LinkedDeliveryID),
-]
+LinkedDeliveryIDs.element_children = (("LinkedDeliveryID", LinkedDeliveryID),)
 
 
 # OtherHVACSystemType.OtherHVACType.Humidifier
@@ -11436,14 +11546,14 @@ class Humidifier(BSElement):
     pass
 
 
-Humidifier.element_children = [
+Humidifier.element_children = (
     ("HumidificationType", HumidificationType),
     ("HumidityControlMinimum", HumidityControlMinimum),
     ("Capacity", Capacity),
     ("CapacityUnits", CapacityUnits),
     ("DutyCycle", DutyCycle),
     ("SystemPerformanceRatio", SystemPerformanceRatio),
-]
+)
 
 
 # OtherHVACSystemType.OtherHVACType.Dehumidifier
@@ -11451,7 +11561,7 @@ class Dehumidifier(BSElement):
     pass
 
 
-Dehumidifier.element_children = [
+Dehumidifier.element_children = (
     ("DehumidificationType", DehumidificationType),
     ("HumidityControlMaximum", HumidityControlMaximum),
     ("Capacity", Capacity),
@@ -11459,7 +11569,7 @@ Dehumidifier.element_children = [
     ("DutyCycle", DutyCycle),
     ("SystemPerformanceRatio", SystemPerformanceRatio),
     ("ThirdPartyCertification", ThirdPartyCertification),
-]
+)
 
 
 # VentilationControlMethods
@@ -11467,9 +11577,9 @@ class VentilationControlMethods(BSElement):
     """List of ventilation control methods."""
 
 
-VentilationControlMethods.element_children = [
+VentilationControlMethods.element_children = (
     ("VentilationControlMethod", VentilationControlMethod),
-]
+)
 
 
 # OtherHVACSystemType.OtherHVACType.SpotExhaust
@@ -11477,7 +11587,7 @@ class SpotExhaust(BSElement):
     pass
 
 
-SpotExhaust.element_children = [
+SpotExhaust.element_children = (
     ("ExhaustLocation", ExhaustLocation),
     ("VentilationRate", VentilationRate),
     ("RequiredVentilationRate", RequiredVentilationRate),
@@ -11488,7 +11598,7 @@ SpotExhaust.element_children = [
     ("DutyCycle", DutyCycle),
     ("SystemPerformanceRatio", SystemPerformanceRatio),
     ("ThirdPartyCertification", ThirdPartyCertification),
-]
+)
 
 
 # OtherHVACSystemType.OtherHVACType.NaturalVentilation
@@ -11496,14 +11606,14 @@ class NaturalVentilation(BSElement):
     pass
 
 
-NaturalVentilation.element_children = [
+NaturalVentilation.element_children = (
     ("NaturalVentilationRate", NaturalVentilationRate),
     ("NaturalVentilationMethod", NaturalVentilationMethod),
     ("VentilationControlMethods", VentilationControlMethods),
     ("Capacity", Capacity),
     ("CapacityUnits", CapacityUnits),
     ("DutyCycle", DutyCycle),
-]
+)
 
 
 # LightingSystemType.LampType.Incandescent
@@ -11512,7 +11622,7 @@ class Incandescent(BSElement):
         """Specific lamp subtype used in the luminaire."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "A19",
             "A21",
             "G16C",
@@ -11531,12 +11641,10 @@ class Incandescent(BSElement):
             "TM",
             "Other",
             "Unknown",
-        ]
+        )
 
 
-Incandescent.element_children = [
-    ("LampLabel", Incandescent.LampLabel),
-]
+Incandescent.element_children = (("LampLabel", Incandescent.LampLabel),)
 
 
 # LightingSystemType.LampType.LinearFluorescent
@@ -11545,7 +11653,7 @@ class LinearFluorescent(BSElement):
         """Specific lamp subtype used in the luminaire."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Super T8",
             "T12",
             "T12HO",
@@ -11556,13 +11664,13 @@ class LinearFluorescent(BSElement):
             "T8U",
             "Other",
             "Unknown",
-        ]
+        )
 
 
-LinearFluorescent.element_children = [
+LinearFluorescent.element_children = (
     ("LampLabel", LinearFluorescent.LampLabel),
     ("LampLength", LampLength),
-]
+)
 
 
 # LightingSystemType.LampType.CompactFluorescent
@@ -11571,20 +11679,20 @@ class CompactFluorescent(BSElement):
         """Specific lamp subtype used in the luminaire."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "2D",
             "A-series",
             "Circline",
             "Spiral",
             "Other",
             "Unknown",
-        ]
+        )
 
 
-CompactFluorescent.element_children = [
+CompactFluorescent.element_children = (
     ("LampLabel", CompactFluorescent.LampLabel),
     ("FluorescentStartType", FluorescentStartType),
-]
+)
 
 
 # LightingSystemType.LampType.Halogen
@@ -11593,7 +11701,7 @@ class Halogen(BSElement):
         """Specific lamp subtype used in the luminaire."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "A-shape",
             "BR30",
             "BR40",
@@ -11607,13 +11715,13 @@ class Halogen(BSElement):
             "R20",
             "Other",
             "Unknown",
-        ]
+        )
 
 
-Halogen.element_children = [
+Halogen.element_children = (
     ("LampLabel", Halogen.LampLabel),
     ("TransformerNeeded", TransformerNeeded),
-]
+)
 
 
 # LightingSystemType.LampType.HighIntensityDischarge
@@ -11622,20 +11730,20 @@ class HighIntensityDischarge(BSElement):
         """Specific lamp subtype used in the luminaire."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Sodium Vapor High Pressure",
             "Sodium Vapor Low Pressure",
             "Metal Halide",
             "Mercury Vapor",
             "Other",
             "Unknown",
-        ]
+        )
 
 
-HighIntensityDischarge.element_children = [
+HighIntensityDischarge.element_children = (
     ("LampLabel", HighIntensityDischarge.LampLabel),
     ("MetalHalideStartType", MetalHalideStartType),
-]
+)
 
 
 # LightingSystemType.LampType.SolidStateLighting
@@ -11644,13 +11752,13 @@ class SolidStateLighting(BSElement):
         """Specific lamp subtype used in the luminaire."""
 
         element_type = "xs:string"
-        element_enumerations = ["LED", "Other"]
+        element_enumerations = ("LED", "Other")
 
 
-SolidStateLighting.element_children = [
+SolidStateLighting.element_children = (
     ("LampLabel", SolidStateLighting.LampLabel),
     ("TransformerNeeded", TransformerNeeded),
-]
+)
 
 
 # LightingSystemType.LampType.Neon
@@ -11688,39 +11796,33 @@ class Recirculation(BSElement):
     """If exists then recirculation loops are used to minimize wait times for hot water."""
 
 
-Recirculation.element_children = [
+Recirculation.element_children = (
     ("RecirculationLoopCount", RecirculationLoopCount),
     ("RecirculationFlowRate", RecirculationFlowRate),
     ("RecirculationControlType", RecirculationControlType),
     ("PipeInsulationThickness", PipeInsulationThickness),
     ("PipeLocation", PipeLocation),
     ("RecirculationEnergyLossRate", RecirculationEnergyLossRate),
-]
+)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Direct.DirectTankHeatingSource
 class DirectTankHeatingSource(BSElement):
     """Direct source of heat for hot water tank."""
 
-    class ElectricResistance(ElectricResistance):
-        pass
-
-    class Combustion(Combustion):
-        pass
-
     class Other(OtherType):
         pass
 
-    class Unknown(Unknown):
-        pass
 
-
-DirectTankHeatingSource.element_children = [
+DirectTankHeatingSource.ElectricResistance = ElectricResistance
+DirectTankHeatingSource.Combustion = Combustion
+DirectTankHeatingSource.Unknown = Unknown
+DirectTankHeatingSource.element_children = (
     ("ElectricResistance", DirectTankHeatingSource.ElectricResistance),
     ("Combustion", DirectTankHeatingSource.Combustion),
     ("Other", DirectTankHeatingSource.Other),
     ("Unknown", DirectTankHeatingSource.Unknown),
-]
+)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Direct
@@ -11728,9 +11830,7 @@ class Direct(BSElement):
     pass
 
 
-Direct.element_children = [
-    ("DirectTankHeatingSource", DirectTankHeatingSource),
-]
+Direct.element_children = (("DirectTankHeatingSource", DirectTankHeatingSource),)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Indirect.IndirectTankHeatingSource.HeatPump.RatedHeatPumpSensibleHeatRatio
@@ -11743,34 +11843,26 @@ class SpaceHeatingSystem(BSElement):
     pass
 
 
-SpaceHeatingSystem.element_children = [
-    ("HeatingPlantID", HeatingPlantID),
-]
+SpaceHeatingSystem.element_children = (("HeatingPlantID", HeatingPlantID),)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.Instantaneous.InstantaneousWaterHeatingSource
 class InstantaneousWaterHeatingSource(BSElement):
     """Source of heat for instantaneous water heater."""
 
-    class ElectricResistance(ElectricResistance):
-        pass
-
-    class Combustion(Combustion):
-        pass
-
     class Other(OtherType):
         pass
 
-    class Unknown(Unknown):
-        pass
-
 
-InstantaneousWaterHeatingSource.element_children = [
+InstantaneousWaterHeatingSource.ElectricResistance = ElectricResistance
+InstantaneousWaterHeatingSource.Combustion = Combustion
+InstantaneousWaterHeatingSource.Unknown = Unknown
+InstantaneousWaterHeatingSource.element_children = (
     ("ElectricResistance", InstantaneousWaterHeatingSource.ElectricResistance),
     ("Combustion", InstantaneousWaterHeatingSource.Combustion),
     ("Other", InstantaneousWaterHeatingSource.Other),
     ("Unknown", InstantaneousWaterHeatingSource.Unknown),
-]
+)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.Instantaneous
@@ -11778,9 +11870,9 @@ class Instantaneous(BSElement):
     pass
 
 
-Instantaneous.element_children = [
+Instantaneous.element_children = (
     ("InstantaneousWaterHeatingSource", InstantaneousWaterHeatingSource),
-]
+)
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.CentralRefrigerationSystem.RefrigerationCompressor.CompressorUnloader
@@ -11788,9 +11880,9 @@ class CompressorUnloader(BSElement):
     """If exists then a device is used for controlling compressor capacity by rendering one or more cylinders ineffective."""
 
 
-CompressorUnloader.element_children = [
+CompressorUnloader.element_children = (
     ("CompressorUnloaderStages", CompressorUnloaderStages),
-]
+)
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.CentralRefrigerationSystem.RefrigerationCompressor
@@ -11798,15 +11890,13 @@ class RefrigerationCompressor(BSElement):
     pass
 
 
-RefrigerationCompressor.element_attributes = [
-    "ID",  # ID
-]
-RefrigerationCompressor.element_children = [
+RefrigerationCompressor.element_attributes = _ID_ATTRS
+RefrigerationCompressor.element_children = (
     ("RefrigerationCompressorType", RefrigerationCompressorType),
     ("CompressorUnloader", CompressorUnloader),
     ("DesuperheatValve", DesuperheatValve),
     ("CrankcaseHeater", CrankcaseHeater),
-]
+)
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.CentralRefrigerationSystem
@@ -11814,7 +11904,7 @@ class CentralRefrigerationSystem(BSElement):
     pass
 
 
-CentralRefrigerationSystem.element_children = [
+CentralRefrigerationSystem.element_children = (
     ("NetRefrigerationCapacity", NetRefrigerationCapacity),
     ("TotalHeatRejection", TotalHeatRejection),
     ("Refrigerant", Refrigerant),
@@ -11825,7 +11915,7 @@ CentralRefrigerationSystem.element_children = [
     ("CaseReturnLineDiameter", CaseReturnLineDiameter),
     ("RefrigerationCompressor", RefrigerationCompressor),
     ("CondenserPlantIDs", CondenserPlantIDs),
-]
+)
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.RefrigerationUnit.AntiSweatHeaters
@@ -11833,13 +11923,13 @@ class AntiSweatHeaters(BSElement):
     """If exists then refrigerated cases include anti-sweat heaters."""
 
 
-AntiSweatHeaters.element_children = [
+AntiSweatHeaters.element_children = (
     ("AntiSweatHeaterPower", AntiSweatHeaterPower),
     ("AntiSweatHeaterControls", AntiSweatHeaterControls),
     ("Manufacturer", Manufacturer),
     ("ModelNumber", ModelNumber),
     ("EquipmentID", EquipmentID),
-]
+)
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory.RefrigerationUnit
@@ -11847,7 +11937,7 @@ class RefrigerationUnit(BSElement):
     pass
 
 
-RefrigerationUnit.element_children = [
+RefrigerationUnit.element_children = (
     ("RefrigerationUnitType", RefrigerationUnitType),
     ("DoorConfiguration", DoorConfiguration),
     ("RefrigeratedCaseDoors", RefrigeratedCaseDoors),
@@ -11857,7 +11947,7 @@ RefrigerationUnit.element_children = [
     ("RefrigerationUnitSize", RefrigerationUnitSize),
     ("AntiSweatHeaters", AntiSweatHeaters),
     ("RefrigerationEnergy", RefrigerationEnergy),
-]
+)
 
 
 # LaundrySystemType.LaundryType.Washer
@@ -11865,13 +11955,13 @@ class Washer(BSElement):
     pass
 
 
-Washer.element_children = [
+Washer.element_children = (
     ("ClothesWasherClassification", ClothesWasherClassification),
     ("ClothesWasherLoaderType", ClothesWasherLoaderType),
     ("ClothesWasherModifiedEnergyFactor", ClothesWasherModifiedEnergyFactor),
     ("ClothesWasherWaterFactor", ClothesWasherWaterFactor),
     ("ClothesWasherCapacity", ClothesWasherCapacity),
-]
+)
 
 
 # LaundrySystemType.LaundryType.Dryer
@@ -11879,11 +11969,11 @@ class Dryer(BSElement):
     pass
 
 
-Dryer.element_children = [
+Dryer.element_children = (
     ("DryerType", DryerType),
     ("DryerElectricEnergyUsePerLoad", DryerElectricEnergyUsePerLoad),
     ("DryerGasEnergyUsePerLoad", DryerGasEnergyUsePerLoad),
-]
+)
 
 
 # LaundrySystemType.LaundryType.Combination
@@ -11891,7 +11981,7 @@ class Combination(BSElement):
     pass
 
 
-Combination.element_children = [
+Combination.element_children = (
     ("WasherDryerType", WasherDryerType),
     ("ClothesWasherClassification", ClothesWasherClassification),
     ("ClothesWasherLoaderType", ClothesWasherLoaderType),
@@ -11901,7 +11991,7 @@ Combination.element_children = [
     ("DryerType", DryerType),
     ("DryerElectricEnergyUsePerLoad", DryerElectricEnergyUsePerLoad),
     ("DryerGasEnergyUsePerLoad", DryerGasEnergyUsePerLoad),
-]
+)
 
 
 # LinkedSystemIDs
@@ -11909,9 +11999,7 @@ class LinkedSystemIDs(BSElement):
     pass
 
 
-LinkedSystemIDs.element_children = [
-    ("LinkedSystemID", LinkedSystemID),
-]
+LinkedSystemIDs.element_children = (("LinkedSystemID", LinkedSystemID),)
 
 # FanSystemType.FanPowerMinimumRatio
 class FanPowerMinimumRatio(BoundedDecimalZeroToOneWithSourceAttribute):
@@ -11953,7 +12041,7 @@ class WallInsulation(BSElement):
     pass
 
 
-WallInsulation.element_children = [
+WallInsulation.element_children = (
     ("WallInsulationApplication", WallInsulationApplication),
     ("WallInsulationMaterial", WallInsulationMaterial),
     ("WallInsulationThickness", WallInsulationThickness),
@@ -11961,7 +12049,7 @@ WallInsulation.element_children = [
     ("WallInsulationCondition", WallInsulationCondition),
     ("WallInsulationLocation", WallInsulationLocation),
     ("WallInsulationRValue", WallInsulationRValue),
-]
+)
 
 
 # CeilingSystemType.CeilingInsulations.CeilingInsulation
@@ -11969,13 +12057,13 @@ class CeilingInsulation(BSElement):
     pass
 
 
-CeilingInsulation.element_children = [
+CeilingInsulation.element_children = (
     ("CeilingInsulationApplication", CeilingInsulationApplication),
     ("CeilingInsulationMaterial", CeilingInsulationMaterial),
     ("CeilingInsulationThickness", CeilingInsulationThickness),
     ("CeilingInsulationContinuity", CeilingInsulationContinuity),
     ("CeilingInsulationCondition", CeilingInsulationCondition),
-]
+)
 
 
 # RoofSystemType.RoofInsulations.RoofInsulation
@@ -11983,14 +12071,14 @@ class RoofInsulation(BSElement):
     pass
 
 
-RoofInsulation.element_children = [
+RoofInsulation.element_children = (
     ("RoofInsulationApplication", RoofInsulationApplication),
     ("RoofInsulationMaterial", RoofInsulationMaterial),
     ("RoofInsulationThickness", RoofInsulationThickness),
     ("RoofInsulationContinuity", RoofInsulationContinuity),
     ("RoofInsulationCondition", RoofInsulationCondition),
     ("RoofInsulationRValue", RoofInsulationRValue),
-]
+)
 
 
 # FenestrationSystemType.FenestrationType.Window.LightShelves
@@ -11998,11 +12086,11 @@ class LightShelves(BSElement):
     """If exists then light shelves are used with this window group, otherwise false."""
 
 
-LightShelves.element_children = [
+LightShelves.element_children = (
     ("LightShelfDistanceFromTop", LightShelfDistanceFromTop),
     ("LightShelfExteriorProtrusion", LightShelfExteriorProtrusion),
     ("LightShelfInteriorProtrusion", LightShelfInteriorProtrusion),
-]
+)
 
 
 # FenestrationSystemType.FenestrationType.Window
@@ -12011,10 +12099,10 @@ class Window(BSElement):
         """Window assembly type."""
 
         element_type = "xs:string"
-        element_enumerations = ["Double Hung"]
+        element_enumerations = ("Double Hung",)
 
 
-Window.element_children = [
+Window.element_children = (
     ("WindowLayout", WindowLayout),
     ("WindowOrientation", WindowOrientation),
     ("WindowSillHeight", WindowSillHeight),
@@ -12030,7 +12118,7 @@ Window.element_children = [
     ("VerticalEdgeFinOnly", VerticalEdgeFinOnly),
     ("LightShelves", LightShelves),
     ("InteriorShadingType", InteriorShadingType),
-]
+)
 
 
 # FenestrationSystemType.FenestrationType.Skylight
@@ -12039,16 +12127,16 @@ class Skylight(BSElement):
         """Skylight assembly type."""
 
         element_type = "xs:string"
-        element_enumerations = ["Curbed Mounted"]
+        element_enumerations = ("Curbed Mounted",)
 
 
-Skylight.element_children = [
+Skylight.element_children = (
     ("SkylightLayout", SkylightLayout),
     ("AssemblyType", Skylight.AssemblyType),
     ("SkylightPitch", SkylightPitch),
     ("SkylightWindowTreatments", SkylightWindowTreatments),
     ("SkylightSolarTube", SkylightSolarTube),
-]
+)
 
 
 # FenestrationSystemType.FenestrationType.Door.DoorGlazedAreaFraction
@@ -12061,12 +12149,12 @@ class Door(BSElement):
     pass
 
 
-Door.element_children = [
+Door.element_children = (
     ("ExteriorDoorType", ExteriorDoorType),
     ("Vestibule", Vestibule),
     ("DoorOperation", DoorOperation),
     ("DoorGlazedAreaFraction", DoorGlazedAreaFraction),
-]
+)
 
 
 # FoundationSystemType.GroundCouplings.GroundCoupling.SlabOnGrade
@@ -12074,7 +12162,7 @@ class SlabOnGrade(BSElement):
     pass
 
 
-SlabOnGrade.element_children = [
+SlabOnGrade.element_children = (
     ("SlabInsulationOrientation", SlabInsulationOrientation),
     ("SlabArea", SlabArea),
     ("SlabPerimeter", SlabPerimeter),
@@ -12084,7 +12172,7 @@ SlabOnGrade.element_children = [
     ("SlabUFactor", SlabUFactor),
     ("SlabInsulationCondition", SlabInsulationCondition),
     ("SlabHeating", SlabHeating),
-]
+)
 
 
 # FoundationSystemType.GroundCouplings.GroundCoupling.Crawlspace.CrawlspaceVenting.Ventilated
@@ -12092,7 +12180,7 @@ class Ventilated(BSElement):
     pass
 
 
-Ventilated.element_children = [
+Ventilated.element_children = (
     ("FloorInsulationThickness", FloorInsulationThickness),
     ("FloorInsulationCondition", FloorInsulationCondition),
     ("FloorRValue", FloorRValue),
@@ -12100,7 +12188,7 @@ Ventilated.element_children = [
     ("FloorFramingSpacing", FloorFramingSpacing),
     ("FloorFramingDepth", FloorFramingDepth),
     ("FloorFramingFactor", FloorFramingFactor),
-]
+)
 
 
 # FoundationSystemType.GroundCouplings.GroundCoupling.Crawlspace.CrawlspaceVenting.Unventilated
@@ -12108,7 +12196,7 @@ class Unventilated(BSElement):
     pass
 
 
-Unventilated.element_children = [
+Unventilated.element_children = (
     ("FoundationWallConstruction", FoundationWallConstruction),
     ("FoundationHeightAboveGrade", FoundationHeightAboveGrade),
     ("FoundationWallInsulationThickness", FoundationWallInsulationThickness),
@@ -12116,7 +12204,7 @@ Unventilated.element_children = [
     ("FoundationWallUFactor", FoundationWallUFactor),
     ("FoundationWallInsulationContinuity", FoundationWallInsulationContinuity),
     ("FoundationWallInsulationCondition", FoundationWallInsulationCondition),
-]
+)
 
 
 # FoundationSystemType.GroundCouplings.GroundCoupling.Crawlspace.CrawlspaceVenting
@@ -12125,12 +12213,12 @@ class CrawlspaceVenting(BSElement):
         pass
 
 
-CrawlspaceVenting.element_children = [
+CrawlspaceVenting.element_children = (
     ("Ventilated", Ventilated),
     ("Unventilated", Unventilated),
     ("Other", CrawlspaceVenting.Other),
     ("Unknown", Unknown),
-]
+)
 
 
 # FoundationSystemType.GroundCouplings.GroundCoupling.Crawlspace
@@ -12138,9 +12226,7 @@ class Crawlspace(BSElement):
     pass
 
 
-Crawlspace.element_children = [
-    ("CrawlspaceVenting", CrawlspaceVenting),
-]
+Crawlspace.element_children = (("CrawlspaceVenting", CrawlspaceVenting),)
 
 
 # FoundationSystemType.GroundCouplings.GroundCoupling.Basement
@@ -12148,7 +12234,7 @@ class Basement(BSElement):
     pass
 
 
-Basement.element_children = [
+Basement.element_children = (
     ("BasementConditioning", BasementConditioning),
     ("FoundationWallConstruction", FoundationWallConstruction),
     ("FoundationHeightAboveGrade", FoundationHeightAboveGrade),
@@ -12164,7 +12250,7 @@ Basement.element_children = [
     ("SlabInsulationThickness", SlabInsulationThickness),
     ("SlabInsulationCondition", SlabInsulationCondition),
     ("SlabHeating", SlabHeating),
-]
+)
 
 
 # FoundationSystemType.GroundCouplings.GroundCoupling
@@ -12174,17 +12260,15 @@ class GroundCoupling(BSElement):
     class Other(OtherType):
         pass
 
-    class Unknown(Unknown):
-        pass
-
 
-GroundCoupling.element_children = [
+GroundCoupling.Unknown = Unknown
+GroundCoupling.element_children = (
     ("SlabOnGrade", SlabOnGrade),
     ("Crawlspace", Crawlspace),
     ("Basement", Basement),
     ("Other", GroundCoupling.Other),
     ("Unknown", GroundCoupling.Unknown),
-]
+)
 
 
 # ProcessGasElectricLoadType.HeatGainFraction
@@ -12197,10 +12281,10 @@ class Storage(BSElement):
     pass
 
 
-Storage.element_children = [
+Storage.element_children = (
     ("EnergyStorageTechnology", EnergyStorageTechnology),
     ("ThermalMedium", ThermalMedium),
-]
+)
 
 
 # OnsiteStorageTransmissionGenerationSystemType.EnergyConversionType.Generation.OnsiteGenerationType.PV
@@ -12208,7 +12292,7 @@ class PV(BSElement):
     pass
 
 
-PV.element_children = [
+PV.element_children = (
     (
         "PhotovoltaicSystemNumberOfModulesPerArray",
         PhotovoltaicSystemNumberOfModulesPerArray,
@@ -12229,7 +12313,7 @@ PV.element_children = [
     ("PhotovoltaicModuleRatedPower", PhotovoltaicModuleRatedPower),
     ("PhotovoltaicModuleLength", PhotovoltaicModuleLength),
     ("PhotovoltaicModuleWidth", PhotovoltaicModuleWidth),
-]
+)
 
 
 # OnsiteStorageTransmissionGenerationSystemType.EnergyConversionType.Generation.OnsiteGenerationType
@@ -12240,14 +12324,14 @@ class OnsiteGenerationType(BSElement):
         pass
 
 
-OnsiteGenerationType.element_children = [
+OnsiteGenerationType.element_children = (
     ("PV", PV),
     ("Other", OnsiteGenerationType.Other),
-]
-OnsiteGenerationType.Other.element_children = [
+)
+OnsiteGenerationType.Other.element_children = (
     ("OtherEnergyGenerationTechnology", OtherEnergyGenerationTechnology),
     ("OutputResourceType", OutputResourceType),
-]
+)
 
 
 # OnsiteStorageTransmissionGenerationSystemType.EnergyConversionType.Generation
@@ -12255,10 +12339,10 @@ class Generation(BSElement):
     pass
 
 
-Generation.element_children = [
+Generation.element_children = (
     ("OnsiteGenerationType", OnsiteGenerationType),
     ("ExternalPowerSupply", ExternalPowerSupply),
-]
+)
 
 
 # WaterUseType.WaterFixtureFractionHotWater
@@ -12271,12 +12355,12 @@ class Modeled(BSElement):
     """The 'Modeled' calculation method is used to represent a scenario in which a building energy modeling software was used to derive data represented by this scenario type."""
 
 
-Modeled.element_children = [
+Modeled.element_children = (
     ("SoftwareProgramUsed", SoftwareProgramUsed),
     ("SoftwareProgramVersion", SoftwareProgramVersion),
     ("WeatherDataType", WeatherDataType),
     ("SimulationCompletionStatus", SimulationCompletionStatus),
-]
+)
 
 
 # CalculationMethodType.Estimated
@@ -12295,11 +12379,11 @@ class MeasuredEnergySource(BSElement):
         pass
 
 
-MeasuredEnergySource.element_children = [
+MeasuredEnergySource.element_children = (
     ("UtilityBills", UtilityBills),
     ("DirectMeasurement", DirectMeasurement),
     ("Other", MeasuredEnergySource.Other),
-]
+)
 
 
 # SpatialUnitTypeType
@@ -12307,12 +12391,12 @@ class SpatialUnitTypeType(BSElement):
     pass
 
 
-SpatialUnitTypeType.element_children = [
+SpatialUnitTypeType.element_children = (
     ("SpatialUnitType", SpatialUnitType),
     ("NumberOfUnits", NumberOfUnits),
     ("UnitDensity", UnitDensity),
     ("SpatialUnitOccupiedPercentage", SpatialUnitOccupiedPercentage),
-]
+)
 
 
 # LinkedPremisesOrSystem.System
@@ -12320,9 +12404,7 @@ class System(BSElement):
     pass
 
 
-System.element_children = [
-    ("LinkedSystemID", LinkedSystemID),
-]
+System.element_children = (("LinkedSystemID", LinkedSystemID),)
 
 
 # Address.StreetAddressDetail.Simplified
@@ -12330,10 +12412,10 @@ class Simplified(BSElement):
     pass
 
 
-Simplified.element_children = [
+Simplified.element_children = (
     ("StreetAddress", StreetAddress),
     ("StreetAdditionalInfo", StreetAdditionalInfo),
-]
+)
 
 
 # Address.StreetAddressDetail.Complex
@@ -12341,7 +12423,7 @@ class Complex(BSElement):
     pass
 
 
-Complex.element_children = [
+Complex.element_children = (
     ("StreetNumberPrefix", StreetNumberPrefix),
     ("StreetNumberNumeric", StreetNumberNumeric),
     ("StreetNumberSuffix", StreetNumberSuffix),
@@ -12353,7 +12435,7 @@ Complex.element_children = [
     ("StreetDirSuffix", StreetDirSuffix),
     ("SubaddressType", SubaddressType),
     ("SubaddressIdentifier", SubaddressIdentifier),
-]
+)
 
 
 # Address.StreetAddressDetail
@@ -12361,10 +12443,10 @@ class StreetAddressDetail(BSElement):
     """Choice of simplified or more complex address format."""
 
 
-StreetAddressDetail.element_children = [
+StreetAddressDetail.element_children = (
     ("Simplified", Simplified),
     ("Complex", Complex),
-]
+)
 
 
 # PremisesIdentifiers.PremisesIdentifier
@@ -12372,11 +12454,11 @@ class PremisesIdentifier(BSElement):
     pass
 
 
-PremisesIdentifier.element_children = [
+PremisesIdentifier.element_children = (
     ("IdentifierLabel", IdentifierLabel),
     ("IdentifierCustomName", IdentifierCustomName),
     ("IdentifierValue", IdentifierValue),
-]
+)
 
 
 # TypicalOccupantUsages.TypicalOccupantUsage
@@ -12384,10 +12466,10 @@ class TypicalOccupantUsage(BSElement):
     pass
 
 
-TypicalOccupantUsage.element_children = [
+TypicalOccupantUsage.element_children = (
     ("TypicalOccupantUsageValue", TypicalOccupantUsageValue),
     ("TypicalOccupantUsageUnits", TypicalOccupantUsageUnits),
-]
+)
 
 
 # UserDefinedFields.UserDefinedField
@@ -12395,10 +12477,10 @@ class UserDefinedField(BSElement):
     pass
 
 
-UserDefinedField.element_children = [
+UserDefinedField.element_children = (
     ("FieldName", FieldName),
     ("FieldValue", FieldValue),
-]
+)
 
 
 # FloorAreas.FloorArea.ExcludedSectionIDs
@@ -12406,9 +12488,7 @@ class ExcludedSectionIDs(BSElement):
     """Links to Sections not included in the floor area calculation."""
 
 
-ExcludedSectionIDs.element_children = [
-    ("ExcludedSectionID", ExcludedSectionID),
-]
+ExcludedSectionIDs.element_children = (("ExcludedSectionID", ExcludedSectionID),)
 
 
 # FloorAreas.FloorArea
@@ -12416,14 +12496,14 @@ class FloorArea(BSElement):
     pass
 
 
-FloorArea.element_children = [
+FloorArea.element_children = (
     ("FloorAreaType", FloorAreaType),
     ("FloorAreaCustomName", FloorAreaCustomName),
     ("FloorAreaValue", FloorAreaValue),
     ("FloorAreaPercentage", FloorAreaPercentage),
     ("Story", Story),
     ("ExcludedSectionIDs", ExcludedSectionIDs),
-]
+)
 
 
 # OccupancyLevels.OccupancyLevel
@@ -12431,11 +12511,11 @@ class OccupancyLevel(BSElement):
     pass
 
 
-OccupancyLevel.element_children = [
+OccupancyLevel.element_children = (
     ("OccupantType", OccupantType),
     ("OccupantQuantityType", OccupantQuantityType),
     ("OccupantQuantity", OccupantQuantity),
-]
+)
 
 
 # EnergyUseByFuelTypes.EnergyUseByFuelType
@@ -12443,10 +12523,10 @@ class EnergyUseByFuelType(BSElement):
     pass
 
 
-EnergyUseByFuelType.element_children = [
+EnergyUseByFuelType.element_children = (
     ("PrimaryFuel", PrimaryFuel),
     ("EnergyUse", EnergyUse),
-]
+)
 
 
 # EnergyUseByFuelTypes
@@ -12454,9 +12534,7 @@ class EnergyUseByFuelTypes(BSElement):
     pass
 
 
-EnergyUseByFuelTypes.element_children = [
-    ("EnergyUseByFuelType", EnergyUseByFuelType),
-]
+EnergyUseByFuelTypes.element_children = (("EnergyUseByFuelType", EnergyUseByFuelType),)
 
 
 # AssetScoreData
@@ -12470,18 +12548,18 @@ class AssetScoreData(BSElement):
         pass
 
 
-AssetScoreData.element_children = [
+AssetScoreData.element_children = (
     ("Score", Score),
     ("SiteEnergyUse", AssetScoreData.SiteEnergyUse),
     ("SourceEnergyUse", AssetScoreData.SourceEnergyUse),
-]
-AssetScoreData.SiteEnergyUse.element_children = [
+)
+AssetScoreData.SiteEnergyUse.element_children = (
     ("EnergyUseByFuelTypes", EnergyUseByFuelTypes),
-]
-AssetScoreData.SourceEnergyUse.element_children = [
+)
+AssetScoreData.SourceEnergyUse.element_children = (
     ("EnergyUseByFuelTypes", EnergyUseByFuelTypes),
     ("SourceEnergyUseIntensity", SourceEnergyUseIntensity),
-]
+)
 
 
 # AssetScore.WholeBuilding.EnergyUseByEndUses.EnergyUseByEndUse
@@ -12489,10 +12567,10 @@ class EnergyUseByEndUse(BSElement):
     pass
 
 
-EnergyUseByEndUse.element_children = [
+EnergyUseByEndUse.element_children = (
     ("EnergyUse", EnergyUse),
     ("EndUse", EndUse),
-]
+)
 
 
 # AssetScore.WholeBuilding.EnergyUseByEndUses
@@ -12500,9 +12578,7 @@ class EnergyUseByEndUses(BSElement):
     pass
 
 
-EnergyUseByEndUses.element_children = [
-    ("EnergyUseByEndUse", EnergyUseByEndUse),
-]
+EnergyUseByEndUses.element_children = (("EnergyUseByEndUse", EnergyUseByEndUse),)
 
 
 # AssetScore.WholeBuilding.Rankings.Ranking.Type
@@ -12510,10 +12586,10 @@ class Type(BSElement):
     pass
 
 
-Type.element_children = [
+Type.element_children = (
     ("SystemsType", SystemsType),
     ("EnvelopeType", EnvelopeType),
-]
+)
 
 
 # AssetScore.WholeBuilding.Rankings.Ranking.Rank
@@ -12526,10 +12602,10 @@ class Ranking(BSElement):
     pass
 
 
-Ranking.element_children = [
+Ranking.element_children = (
     ("Type", Type),
     ("Rank", Rank),
-]
+)
 
 
 # AssetScore.WholeBuilding.Rankings
@@ -12537,9 +12613,7 @@ class Rankings(BSElement):
     pass
 
 
-Rankings.element_children = [
-    ("Ranking", Ranking),
-]
+Rankings.element_children = (("Ranking", Ranking),)
 
 
 # AssetScore.WholeBuilding
@@ -12547,11 +12621,11 @@ class WholeBuilding(BSElement):
     pass
 
 
-WholeBuilding.element_children = [
+WholeBuilding.element_children = (
     ("AssetScoreData", AssetScoreData),
     ("EnergyUseByEndUses", EnergyUseByEndUses),
     ("Rankings", Rankings),
-]
+)
 
 
 # AssetScore.UseTypes.UseType
@@ -12559,10 +12633,10 @@ class UseType(BSElement):
     pass
 
 
-UseType.element_children = [
+UseType.element_children = (
     ("AssetScoreData", AssetScoreData),
     ("AssetScoreUseType", AssetScoreUseType),
-]
+)
 
 
 # AssetScore.UseTypes
@@ -12570,9 +12644,7 @@ class UseTypes(BSElement):
     pass
 
 
-UseTypes.element_children = [
-    ("UseType", UseType),
-]
+UseTypes.element_children = (("UseType", UseType),)
 
 
 # PortfolioManagerType
@@ -12580,14 +12652,14 @@ class PortfolioManagerType(BSElement):
     pass
 
 
-PortfolioManagerType.element_children = [
+PortfolioManagerType.element_children = (
     ("PMBenchmarkDate", PMBenchmarkDate),
     ("BuildingProfileStatus", BuildingProfileStatus),
     (
         "FederalSustainabilityChecklistCompletionPercentage",
         FederalSustainabilityChecklistCompletionPercentage,
     ),
-]
+)
 
 
 # FanBasedDistributionTypeType.FanCoil
@@ -12595,12 +12667,12 @@ class FanCoil(BSElement):
     pass
 
 
-FanCoil.element_children = [
+FanCoil.element_children = (
     ("FanCoilType", FanCoilType),
     ("HVACPipeConfiguration", HVACPipeConfiguration),
     ("PipeInsulationThickness", PipeInsulationThickness),
     ("PipeLocation", PipeLocation),
-]
+)
 
 
 # FanBasedType.AirSideEconomizer
@@ -12608,17 +12680,17 @@ class AirSideEconomizer(BSElement):
     pass
 
 
-AirSideEconomizer.element_attributes = [
+AirSideEconomizer.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-AirSideEconomizer.element_children = [
+)
+AirSideEconomizer.element_children = (
     ("AirSideEconomizerType", AirSideEconomizerType),
     ("EconomizerControl", EconomizerControl),
     ("EconomizerDryBulbControlPoint", EconomizerDryBulbControlPoint),
     ("EconomizerEnthalpyControlPoint", EconomizerEnthalpyControlPoint),
     ("EconomizerLowTemperatureLockout", EconomizerLowTemperatureLockout),
-]
+)
 
 
 # ControlSystemType.Analog
@@ -12629,9 +12701,7 @@ class Analog(BSElement):
         """Method of communicating data over an analog network."""
 
 
-Analog.element_children = [
-    ("CommunicationProtocol", Analog.CommunicationProtocol),
-]
+Analog.element_children = (("CommunicationProtocol", Analog.CommunicationProtocol),)
 
 
 # ControlSystemType.Digital
@@ -12642,9 +12712,7 @@ class Digital(BSElement):
         """Method of communicating data over a digital computer network."""
 
 
-Digital.element_children = [
-    ("CommunicationProtocol", Digital.CommunicationProtocol),
-]
+Digital.element_children = (("CommunicationProtocol", Digital.CommunicationProtocol),)
 
 
 # ClimateZoneType.ASHRAE
@@ -12653,7 +12721,7 @@ class ASHRAE(BSElement):
         """Based on the ClimateZoneType term, this is the climate zone designation."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "1A",
             "1B",
             "2A",
@@ -12671,12 +12739,10 @@ class ASHRAE(BSElement):
             "6B",
             "7",
             "8",
-        ]
+        )
 
 
-ASHRAE.element_children = [
-    ("ClimateZone", ASHRAE.ClimateZone),
-]
+ASHRAE.element_children = (("ClimateZone", ASHRAE.ClimateZone),)
 
 # ClimateZoneType.EnergyStar
 class EnergyStar(BSElement):
@@ -12684,17 +12750,15 @@ class EnergyStar(BSElement):
         """Based on the ClimateZoneType term, this is the climate zone designation."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Northern",
             "North-Central",
             "South-Central",
             "Southern",
-        ]
+        )
 
 
-EnergyStar.element_children = [
-    ("ClimateZone", EnergyStar.ClimateZone),
-]
+EnergyStar.element_children = (("ClimateZone", EnergyStar.ClimateZone),)
 
 
 # ClimateZoneType.CaliforniaTitle24
@@ -12703,7 +12767,7 @@ class CaliforniaTitle24(BSElement):
         """Based on the ClimateZoneType term, this is the climate zone designation."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Climate Zone 1",
             "Climate Zone 2",
             "Climate Zone 3",
@@ -12720,12 +12784,10 @@ class CaliforniaTitle24(BSElement):
             "Climate Zone 14",
             "Climate Zone 15",
             "Climate Zone 16",
-        ]
+        )
 
 
-CaliforniaTitle24.element_children = [
-    ("ClimateZone", CaliforniaTitle24.ClimateZone),
-]
+CaliforniaTitle24.element_children = (("ClimateZone", CaliforniaTitle24.ClimateZone),)
 
 
 # ClimateZoneType.IECC
@@ -12734,7 +12796,7 @@ class IECC(BSElement):
         """Based on the ClimateZoneType term, this is the climate zone designation."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "1",
             "2",
             "3",
@@ -12744,12 +12806,10 @@ class IECC(BSElement):
             "6",
             "7",
             "8",
-        ]
+        )
 
 
-IECC.element_children = [
-    ("ClimateZone", IECC.ClimateZone),
-]
+IECC.element_children = (("ClimateZone", IECC.ClimateZone),)
 
 
 # ClimateZoneType.BuildingAmerica
@@ -12758,7 +12818,7 @@ class BuildingAmerica(BSElement):
         """Based on the ClimateZoneType term, this is the climate zone designation."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Subarctic",
             "Marine",
             "Hot-dry",
@@ -12767,12 +12827,10 @@ class BuildingAmerica(BSElement):
             "Mixed-humid",
             "Cold",
             "Very cold",
-        ]
+        )
 
 
-BuildingAmerica.element_children = [
-    ("ClimateZone", BuildingAmerica.ClimateZone),
-]
+BuildingAmerica.element_children = (("ClimateZone", BuildingAmerica.ClimateZone),)
 
 
 # ClimateZoneType.DOE
@@ -12781,7 +12839,7 @@ class DOE(BSElement):
         """Based on the ClimateZoneType term, this is the climate zone designation."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Subarctic",
             "Marine",
             "Hot-dry",
@@ -12790,12 +12848,10 @@ class DOE(BSElement):
             "Mixed-humid",
             "Cold",
             "Very cold",
-        ]
+        )
 
 
-DOE.element_children = [
-    ("ClimateZone", DOE.ClimateZone),
-]
+DOE.element_children = (("ClimateZone", DOE.ClimateZone),)
 
 
 # WindowID.WindowToWallRatio
@@ -12808,10 +12864,10 @@ class ResourceUnitsType(BSElement):
     pass
 
 
-ResourceUnitsType.element_union = [
+ResourceUnitsType.element_union = (
     OtherUnitsType,
     ResourceUnitsBaseType,
-]
+)
 
 
 # DerivedModelType.Models.Model.DerivedModelInputs.ResponseVariable.ResponseVariableEndUse
@@ -12824,14 +12880,14 @@ class Guideline14Model(BSElement):
     """Defined parameters are based on those available in ASHRAE Guideline 14-2014 Table D-1 and Figure D-1.  Concepts and nomenclature is also adopted from the CalTRACK methodology.  Attempts to generalize these parameters are made."""
 
 
-Guideline14Model.element_children = [
+Guideline14Model.element_children = (
     ("ModelType", ModelType),
     ("Intercept", Intercept),
     ("Beta1", Beta1),
     ("Beta2", Beta2),
     ("Beta3", Beta3),
     ("Beta4", Beta4),
-]
+)
 
 
 # DerivedModelType.Models.Model.DerivedModelCoefficients
@@ -12839,10 +12895,10 @@ class DerivedModelCoefficients(BSElement):
     pass
 
 
-DerivedModelCoefficients.element_children = [
+DerivedModelCoefficients.element_children = (
     ("Guideline14Model", Guideline14Model),
     ("TimeOfWeekTemperatureModel", TimeOfWeekTemperatureModel),
-]
+)
 
 
 # DerivedModelType.Models.Model.DerivedModelPerformance
@@ -12850,7 +12906,7 @@ class DerivedModelPerformance(BSElement):
     """Characterization of the performance of the model."""
 
 
-DerivedModelPerformance.element_children = [
+DerivedModelPerformance.element_children = (
     ("RSquared", RSquared),
     ("AdjustedRSquared", AdjustedRSquared),
     ("RMSE", RMSE),
@@ -12858,7 +12914,7 @@ DerivedModelPerformance.element_children = [
     ("NDBE", NDBE),
     ("MBE", MBE),
     ("NMBE", NMBE),
-]
+)
 
 
 # DerivedModelType.Models.Model.SummaryInformation
@@ -12866,13 +12922,13 @@ class SummaryInformation(BSElement):
     pass
 
 
-SummaryInformation.element_children = [
+SummaryInformation.element_children = (
     ("NumberOfDataPoints", NumberOfDataPoints),
     ("NumberOfParameters", NumberOfParameters),
     ("DegreesOfFreedom", DegreesOfFreedom),
     ("AggregateActualEnergyUse", AggregateActualEnergyUse),
     ("AggregateModeledEnergyUse", AggregateModeledEnergyUse),
-]
+)
 
 
 # PressureUnitsType
@@ -12880,10 +12936,10 @@ class PressureUnitsType(BSElement):
     pass
 
 
-PressureUnitsType.element_union = [
+PressureUnitsType.element_union = (
     OtherUnitsType,
     PressureUnitsBaseType,
-]
+)
 
 
 # PeakResourceUnitsType
@@ -12891,10 +12947,10 @@ class PeakResourceUnitsType(BSElement):
     pass
 
 
-PeakResourceUnitsType.element_union = [
+PeakResourceUnitsType.element_union = (
     OtherUnitsType,
     PeakResourceUnitsBaseType,
-]
+)
 
 
 # TemperatureUnitsType
@@ -12902,10 +12958,10 @@ class TemperatureUnitsType(BSElement):
     pass
 
 
-TemperatureUnitsType.element_union = [
+TemperatureUnitsType.element_union = (
     OtherUnitsType,
     TemperatureUnitsBaseType,
-]
+)
 
 
 # DimensionlessUnitsType
@@ -12913,10 +12969,10 @@ class DimensionlessUnitsType(BSElement):
     pass
 
 
-DimensionlessUnitsType.element_union = [
+DimensionlessUnitsType.element_union = (
     OtherUnitsType,
     DimensionlessUnitsBaseType,
-]
+)
 
 
 # AnnualSavingsByFuels.AnnualSavingsByFuel
@@ -12924,14 +12980,14 @@ class AnnualSavingsByFuel(BSElement):
     pass
 
 
-AnnualSavingsByFuel.element_children = [
+AnnualSavingsByFuel.element_children = (
     ("EnergyResource", EnergyResource),
     ("ResourceUnits", ResourceUnits),
     ("AnnualSavingsNativeUnits", AnnualSavingsNativeUnits),
     ("AnnualSavingsAverageGHGEmissions", AnnualSavingsAverageGHGEmissions),
     ("AnnualSavingsMarginalGHGEmissions", AnnualSavingsMarginalGHGEmissions),
     ("AnnualSavingsGHGEmissionIntensity", AnnualSavingsGHGEmissionIntensity),
-]
+)
 
 
 # LinkedScheduleIDs
@@ -12939,9 +12995,7 @@ class LinkedScheduleIDs(BSElement):
     pass
 
 
-LinkedScheduleIDs.element_children = [
-    ("LinkedScheduleID", LinkedScheduleID),
-]
+LinkedScheduleIDs.element_children = (("LinkedScheduleID", LinkedScheduleID),)
 
 
 # SpatialUnits.SpatialUnit
@@ -12954,9 +13008,7 @@ class UserDefinedFields(BSElement):
     pass
 
 
-UserDefinedFields.element_children = [
-    ("UserDefinedField", UserDefinedField),
-]
+UserDefinedFields.element_children = (("UserDefinedField", UserDefinedField),)
 
 
 # PremisesIdentifiers
@@ -12964,9 +13016,7 @@ class PremisesIdentifiers(BSElement):
     """Identifier used in a specific program or dataset. There can be multiple instances of Identifier Types within a dataset."""
 
 
-PremisesIdentifiers.element_children = [
-    ("PremisesIdentifier", PremisesIdentifier),
-]
+PremisesIdentifiers.element_children = (("PremisesIdentifier", PremisesIdentifier),)
 
 
 # Address
@@ -12975,7 +13025,7 @@ class Address(BSElement):
         """The state for the address type, following the ISO 3166-2 Region code for US states."""
 
 
-Address.element_children = [
+Address.element_children = (
     ("StreetAddressDetail", StreetAddressDetail),
     ("City", City),
     ("State", Address.State),
@@ -12983,7 +13033,7 @@ Address.element_children = [
     ("PostalCodePlus4", PostalCodePlus4),
     ("County", County),
     ("Country", Country),
-]
+)
 
 
 # ClimateZoneType
@@ -13000,7 +13050,7 @@ class ClimateZoneType(BSElement):
             element_type = "xs:string"
 
 
-ClimateZoneType.element_children = [
+ClimateZoneType.element_children = (
     ("ASHRAE", ASHRAE),
     ("EnergyStar", EnergyStar),
     ("CaliforniaTitle24", CaliforniaTitle24),
@@ -13009,10 +13059,10 @@ ClimateZoneType.element_children = [
     ("CBECS", ClimateZoneType.CBECS),
     ("DOE", DOE),
     ("Other", ClimateZoneType.Other),
-]
-ClimateZoneType.Other.element_children = [
+)
+ClimateZoneType.Other.element_children = (
     ("ClimateZone", ClimateZoneType.Other.ClimateZone),
-]
+)
 
 
 # FloorAreas
@@ -13020,9 +13070,7 @@ class FloorAreas(BSElement):
     pass
 
 
-FloorAreas.element_children = [
-    ("FloorArea", FloorArea),
-]
+FloorAreas.element_children = (("FloorArea", FloorArea),)
 
 
 # OccupancyLevels
@@ -13030,9 +13078,7 @@ class OccupancyLevels(BSElement):
     pass
 
 
-OccupancyLevels.element_children = [
-    ("OccupancyLevel", OccupancyLevel),
-]
+OccupancyLevels.element_children = (("OccupancyLevel", OccupancyLevel),)
 
 
 # TypicalOccupantUsages
@@ -13040,18 +13086,16 @@ class TypicalOccupantUsages(BSElement):
     """Characterization of the usage of the space (complex, whole building, or section) by building occupants."""
 
 
-TypicalOccupantUsages.element_children = [
+TypicalOccupantUsages.element_children = (
     ("TypicalOccupantUsage", TypicalOccupantUsage),
-]
+)
 
 # SpatialUnits
 class SpatialUnits(BSElement):
     pass
 
 
-SpatialUnits.element_children = [
-    ("SpatialUnit", SpatialUnit),
-]
+SpatialUnits.element_children = (("SpatialUnit", SpatialUnit),)
 
 
 # PortfolioManager
@@ -13074,9 +13118,7 @@ class Assessments(BSElement):
     pass
 
 
-Assessments.element_children = [
-    ("Assessment", Assessment),
-]
+Assessments.element_children = (("Assessment", Assessment),)
 
 
 # WindowID
@@ -13084,14 +13126,12 @@ class WindowID(BSElement):
     """ID number of the window type associated with this side of the section."""
 
 
-WindowID.element_attributes = [
-    "IDref",  # IDREF
-]
-WindowID.element_children = [
+WindowID.element_attributes = ("IDref",)  # IDREF
+WindowID.element_children = (
     ("FenestrationArea", FenestrationArea),
     ("WindowToWallRatio", WindowToWallRatio),
     ("PercentOfWindowAreaShaded", PercentOfWindowAreaShaded),
-]
+)
 
 
 # BuildingType.Sections.Section.Sides.Side.WindowIDs
@@ -13099,24 +13139,18 @@ class WindowIDs(BSElement):
     pass
 
 
-WindowIDs.element_children = [
-    ("WindowID", WindowID),
-]
+WindowIDs.element_children = (("WindowID", WindowID),)
 
 
 # BuildingType.Sections.Section.Sides.Side
 class Side(BSElement):
-    class WallID(WallID):
-        pass
-
-    class WindowID(WindowID):
-        pass
-
-    class DoorID(DoorID):
-        pass
+    pass
 
 
-Side.element_children = [
+Side.WallID = WallID
+Side.WindowID = WindowID
+Side.DoorID = DoorID
+Side.element_children = (
     ("SideNumber", SideNumber),
     ("SideLength", SideLength),
     ("WallID", WallID),
@@ -13126,7 +13160,7 @@ Side.element_children = [
     ("DoorID", DoorID),
     ("DoorIDs", DoorIDs),
     ("ThermalZoneIDs", ThermalZoneIDs),
-]
+)
 
 
 # BuildingType.Sections.Section.Sides
@@ -13134,9 +13168,7 @@ class Sides(BSElement):
     """List of sides."""
 
 
-Sides.element_children = [
-    ("Side", Side),
-]
+Sides.element_children = (("Side", Side),)
 
 
 # BuildingType.Sections.Section.Ceilings.Ceiling.CeilingID
@@ -13144,15 +13176,13 @@ class CeilingID(BSElement):
     """ID number of the roof/ceiling type associated with this section."""
 
 
-CeilingID.element_attributes = [
-    "IDref",  # IDREF
-]
-CeilingID.element_children = [
+CeilingID.element_attributes = ("IDref",)  # IDREF
+CeilingID.element_children = (
     ("CeilingArea", CeilingArea),
     ("CeilingInsulatedArea", CeilingInsulatedArea),
     ("ThermalZoneIDs", ThermalZoneIDs),
     ("SpaceIDs", SpaceIDs),
-]
+)
 
 
 # BuildingType.Sections.Section.Ceilings.Ceiling
@@ -13160,9 +13190,7 @@ class Ceiling(BSElement):
     """A finished construction under the roof or adjacent floor."""
 
 
-Ceiling.element_children = [
-    ("CeilingID", CeilingID),
-]
+Ceiling.element_children = (("CeilingID", CeilingID),)
 
 
 # BuildingType.Sections.Section.Ceilings
@@ -13170,9 +13198,7 @@ class Ceilings(BSElement):
     """List of ceilings."""
 
 
-Ceilings.element_children = [
-    ("Ceiling", Ceiling),
-]
+Ceilings.element_children = (("Ceiling", Ceiling),)
 
 
 # SpaceType
@@ -13180,10 +13206,8 @@ class SpaceType(BSElement):
     pass
 
 
-SpaceType.element_attributes = [
-    "ID",  # ID
-]
-SpaceType.element_children = [
+SpaceType.element_attributes = _ID_ATTRS
+SpaceType.element_children = (
     ("PremisesName", PremisesName),
     ("PremisesNotes", PremisesNotes),
     ("PremisesIdentifiers", PremisesIdentifiers),
@@ -13200,7 +13224,7 @@ SpaceType.element_children = [
     ("PercentageOfCommonSpace", PercentageOfCommonSpace),
     ("ConditionedVolume", ConditionedVolume),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # ScheduleType.ScheduleDetails
@@ -13208,9 +13232,7 @@ class ScheduleDetails(BSElement):
     pass
 
 
-ScheduleDetails.element_children = [
-    ("ScheduleDetail", ScheduleDetail),
-]
+ScheduleDetails.element_children = (("ScheduleDetail", ScheduleDetail),)
 
 
 # ContactType.ContactTelephoneNumbers
@@ -13218,9 +13240,9 @@ class ContactTelephoneNumbers(BSElement):
     pass
 
 
-ContactTelephoneNumbers.element_children = [
+ContactTelephoneNumbers.element_children = (
     ("ContactTelephoneNumber", ContactTelephoneNumber),
-]
+)
 
 
 # ContactType.ContactEmailAddresses
@@ -13228,9 +13250,7 @@ class ContactEmailAddresses(BSElement):
     pass
 
 
-ContactEmailAddresses.element_children = [
-    ("ContactEmailAddress", ContactEmailAddress),
-]
+ContactEmailAddresses.element_children = (("ContactEmailAddress", ContactEmailAddress),)
 
 
 # TenantType.TenantTelephoneNumbers
@@ -13238,9 +13258,9 @@ class TenantTelephoneNumbers(BSElement):
     pass
 
 
-TenantTelephoneNumbers.element_children = [
+TenantTelephoneNumbers.element_children = (
     ("TenantTelephoneNumber", TenantTelephoneNumber),
-]
+)
 
 
 # TenantType.TenantEmailAddresses
@@ -13248,9 +13268,7 @@ class TenantEmailAddresses(BSElement):
     pass
 
 
-TenantEmailAddresses.element_children = [
-    ("TenantEmailAddress", TenantEmailAddress),
-]
+TenantEmailAddresses.element_children = (("TenantEmailAddress", TenantEmailAddress),)
 
 
 # ScenarioType.WeatherType
@@ -13261,12 +13279,12 @@ class WeatherType(BSElement):
         pass
 
 
-WeatherType.element_children = [
+WeatherType.element_children = (
     ("Normalized", Normalized),
     ("AdjustedToYear", AdjustedToYear),
     ("Actual", Actual),
     ("Other", WeatherType.Other),
-]
+)
 
 
 # AssetScore
@@ -13274,10 +13292,10 @@ class AssetScore(BSElement):
     """A facility's Commercial Building Energy Asset Score Data."""
 
 
-AssetScore.element_children = [
+AssetScore.element_children = (
     ("WholeBuilding", WholeBuilding),
     ("UseTypes", UseTypes),
-]
+)
 
 
 # ScenarioType.ScenarioType.Target
@@ -13285,7 +13303,7 @@ class Target(BSElement):
     pass
 
 
-Target.element_children = [
+Target.element_children = (
     ("ReferenceCase", ReferenceCase),
     ("AnnualSavingsSiteEnergy", AnnualSavingsSiteEnergy),
     ("AnnualSavingsSourceEnergy", AnnualSavingsSourceEnergy),
@@ -13303,7 +13321,7 @@ Target.element_children = [
     ("InternalRateOfReturn", InternalRateOfReturn),
     ("AssetScore", AssetScore),
     ("ENERGYSTARScore", ENERGYSTARScore),
-]
+)
 
 
 # AnnualSavingsByFuels
@@ -13311,9 +13329,7 @@ class AnnualSavingsByFuels(BSElement):
     pass
 
 
-AnnualSavingsByFuels.element_children = [
-    ("AnnualSavingsByFuel", AnnualSavingsByFuel),
-]
+AnnualSavingsByFuels.element_children = (("AnnualSavingsByFuel", AnnualSavingsByFuel),)
 
 
 # AllResourceTotalType
@@ -13334,10 +13350,8 @@ class AllResourceTotalType(BSElement):
         element_type = "xs:decimal"
 
 
-AllResourceTotalType.element_attributes = [
-    "ID",  # ID
-]
-AllResourceTotalType.element_children = [
+AllResourceTotalType.element_attributes = _ID_ATTRS
+AllResourceTotalType.element_children = (
     ("EndUse", EndUse),
     ("TemporalStatus", TemporalStatus),
     ("ResourceBoundary", ResourceBoundary),
@@ -13375,7 +13389,7 @@ AllResourceTotalType.element_children = [
     ("AnnualMarginalGHGEmissions", AnnualMarginalGHGEmissions),
     ("AnnualGHGEmissionIntensity", AnnualGHGEmissionIntensity),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # UtilityType.RateSchedules.RateSchedule.TypeOfRateStructure
@@ -13385,11 +13399,9 @@ class TypeOfRateStructure(BSElement):
     class Other(OtherType):
         """Other type of rate structure, or combination of other types."""
 
-    class Unknown(Unknown):
-        pass
-
 
-TypeOfRateStructure.element_children = [
+TypeOfRateStructure.Unknown = Unknown
+TypeOfRateStructure.element_children = (
     ("FlatRate", FlatRate),
     ("TimeOfUseRate", TimeOfUseRate),
     ("TieredRates", TieredRates),
@@ -13399,7 +13411,7 @@ TypeOfRateStructure.element_children = [
     ("CriticalPeakRebates", CriticalPeakRebates),
     ("Other", TypeOfRateStructure.Other),
     ("Unknown", TypeOfRateStructure.Unknown),
-]
+)
 
 
 # UtilityType.RateSchedules.RateSchedule
@@ -13407,10 +13419,8 @@ class RateSchedule(BSElement):
     """Rate structure characteristics."""
 
 
-RateSchedule.element_attributes = [
-    "ID",  # ID
-]
-RateSchedule.element_children = [
+RateSchedule.element_attributes = _ID_ATTRS
+RateSchedule.element_children = (
     ("RateStructureName", RateStructureName),
     ("TypeOfRateStructure", TypeOfRateStructure),
     ("RateStructureSector", RateStructureSector),
@@ -13422,7 +13432,7 @@ RateSchedule.element_children = [
     ("FixedMonthlyCharge", FixedMonthlyCharge),
     ("NetMetering", NetMetering),
     ("AverageMarginalCostRate", AverageMarginalCostRate),
-]
+)
 
 
 # ResourceUseType.Emissions
@@ -13430,9 +13440,7 @@ class Emissions(BSElement):
     pass
 
 
-Emissions.element_children = [
-    ("Emission", Emission),
-]
+Emissions.element_children = (("Emission", Emission),)
 
 
 # TimeSeriesType
@@ -13440,10 +13448,8 @@ class TimeSeriesType(BSElement):
     pass
 
 
-TimeSeriesType.element_attributes = [
-    "ID",  # ID
-]
-TimeSeriesType.element_children = [
+TimeSeriesType.element_attributes = _ID_ATTRS
+TimeSeriesType.element_children = (
     ("ReadingType", ReadingType),
     ("PeakType", PeakType),
     ("TimeSeriesReadingQuantity", TimeSeriesReadingQuantity),
@@ -13462,7 +13468,7 @@ TimeSeriesType.element_children = [
     ("ResourceUseID", ResourceUseID),
     ("WeatherStationID", WeatherStationID),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # MeasureType.TypeOfMeasure
@@ -13470,12 +13476,12 @@ class TypeOfMeasure(BSElement):
     """Type of action associated with the measure."""
 
 
-TypeOfMeasure.element_children = [
+TypeOfMeasure.element_children = (
     ("Replacements", Replacements),
     ("ModificationRetrocommissions", ModificationRetrocommissions),
     ("Additions", Additions),
     ("Removals", Removals),
-]
+)
 
 
 # MeasureType.TechnologyCategories
@@ -13483,9 +13489,7 @@ class TechnologyCategories(BSElement):
     pass
 
 
-TechnologyCategories.element_children = [
-    ("TechnologyCategory", TechnologyCategory),
-]
+TechnologyCategories.element_children = (("TechnologyCategory", TechnologyCategory),)
 
 
 # ReportType.AuditDates
@@ -13493,9 +13497,7 @@ class AuditDates(BSElement):
     pass
 
 
-AuditDates.element_children = [
-    ("AuditDate", AuditDate),
-]
+AuditDates.element_children = (("AuditDate", AuditDate),)
 
 
 # ReportType.OtherEscalationRates
@@ -13503,9 +13505,7 @@ class OtherEscalationRates(BSElement):
     pass
 
 
-OtherEscalationRates.element_children = [
-    ("OtherEscalationRate", OtherEscalationRate),
-]
+OtherEscalationRates.element_children = (("OtherEscalationRate", OtherEscalationRate),)
 
 
 # ReportType.Qualifications
@@ -13513,32 +13513,22 @@ class Qualifications(BSElement):
     pass
 
 
-Qualifications.element_children = [
-    ("Qualification", Qualification),
-]
+Qualifications.element_children = (("Qualification", Qualification),)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.HeatingSources.HeatingSource.HeatingSourceType
 class HeatingSourceType(BSElement):
     """Source of energy used for heating the zone."""
 
-    class ElectricResistance(ElectricResistance):
-        pass
-
     class HeatPump(BSElement):
         pass
 
-    class OtherCombination(OtherCombination):
-        pass
-
-    class NoHeating(NoHeating):
-        pass
-
-    class Unknown(Unknown):
-        pass
-
 
-HeatingSourceType.element_children = [
+HeatingSourceType.ElectricResistance = ElectricResistance
+HeatingSourceType.OtherCombination = OtherCombination
+HeatingSourceType.NoHeating = NoHeating
+HeatingSourceType.Unknown = Unknown
+HeatingSourceType.element_children = (
     ("SourceHeatingPlantID", SourceHeatingPlantID),
     ("ElectricResistance", HeatingSourceType.ElectricResistance),
     ("Furnace", Furnace),
@@ -13546,8 +13536,8 @@ HeatingSourceType.element_children = [
     ("OtherCombination", HeatingSourceType.OtherCombination),
     ("NoHeating", HeatingSourceType.NoHeating),
     ("Unknown", HeatingSourceType.Unknown),
-]
-HeatingSourceType.HeatPump.element_children = [
+)
+HeatingSourceType.HeatPump.element_children = (
     ("HeatPumpType", HeatPumpType),
     (
         "HeatPumpBackupHeatingSwitchoverTemperature",
@@ -13558,7 +13548,7 @@ HeatingSourceType.HeatPump.element_children = [
     ("ThirdPartyCertification", ThirdPartyCertification),
     ("CoolingSourceID", CoolingSourceID),
     ("LinkedHeatingPlantID", LinkedHeatingPlantID),
-]
+)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.CoolingSources.CoolingSource.CoolingSourceType.DX
@@ -13566,7 +13556,7 @@ class DX(BSElement):
     pass
 
 
-DX.element_children = [
+DX.element_children = (
     ("DXSystemType", DXSystemType),
     ("CompressorType", CompressorType),
     ("CompressorStaging", CompressorStaging),
@@ -13574,45 +13564,37 @@ DX.element_children = [
     ("Refrigerant", Refrigerant),
     ("RefrigerantChargeFactor", RefrigerantChargeFactor),
     ("ActiveDehumidification", ActiveDehumidification),
-]
+)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.CoolingSources.CoolingSource.CoolingSourceType
 class CoolingSourceType(BSElement):
     """Source of energy used for cooling the zone."""
 
-    class OtherCombination(OtherCombination):
-        pass
-
-    class NoCooling(NoCooling):
-        pass
 
-    class Unknown(Unknown):
-        pass
-
-
-CoolingSourceType.element_children = [
+CoolingSourceType.OtherCombination = OtherCombination
+CoolingSourceType.NoCooling = NoCooling
+CoolingSourceType.Unknown = Unknown
+CoolingSourceType.element_children = (
     ("CoolingPlantID", CoolingPlantID),
     ("DX", DX),
     ("EvaporativeCooler", EvaporativeCooler),
     ("OtherCombination", CoolingSourceType.OtherCombination),
     ("NoCooling", CoolingSourceType.NoCooling),
     ("Unknown", CoolingSourceType.Unknown),
-]
+)
 
 
 # HeatingPlantType.Boiler
 class Boiler(BSElement):
-    class OutputCapacity(OutputCapacity):
-        pass
-
     class Capacity(BSElement):
         """Output capacity of equipment."""
 
         element_type = "xs:decimal"
 
 
-Boiler.element_children = [
+Boiler.OutputCapacity = OutputCapacity
+Boiler.element_children = (
     ("BoilerType", BoilerType),
     ("BurnerType", BurnerType),
     ("BurnerControlType", BurnerControlType),
@@ -13648,7 +13630,7 @@ Boiler.element_children = [
     ("BoilerPercentCondensateReturn", BoilerPercentCondensateReturn),
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
-]
+)
 
 
 # ControlSystemType
@@ -13659,15 +13641,15 @@ class ControlSystemType(BSElement):
         """Other type of control system."""
 
 
-ControlSystemType.element_children = [
+ControlSystemType.element_children = (
     ("Analog", Analog),
     ("Digital", Digital),
     ("Pneumatic", Pneumatic),
     ("Other", ControlSystemType.Other),
-]
-ControlSystemType.Other.element_children = [
+)
+ControlSystemType.Other.element_children = (
     ("OtherCommunicationProtocolName", OtherCommunicationProtocolName),
-]
+)
 
 
 # CoolingPlantType.Chiller
@@ -13675,7 +13657,7 @@ class Chiller(BSElement):
     pass
 
 
-Chiller.element_children = [
+Chiller.element_children = (
     ("ChillerType", ChillerType),
     ("ChillerCompressorDriver", ChillerCompressorDriver),
     ("ChillerCompressorType", ChillerCompressorType),
@@ -13702,7 +13684,7 @@ Chiller.element_children = [
     ("ChilledWaterSupplyTemperature", ChilledWaterSupplyTemperature),
     ("ActiveDehumidification", ActiveDehumidification),
     ("Quantity", Quantity),
-]
+)
 
 
 # CondenserPlantType.AirCooled
@@ -13710,7 +13692,7 @@ class AirCooled(BSElement):
     pass
 
 
-AirCooled.element_children = [
+AirCooled.element_children = (
     ("EvaporativelyCooledCondenser", EvaporativelyCooledCondenser),
     ("CondenserFanSpeedOperation", CondenserFanSpeedOperation),
     ("CondensingTemperature", CondensingTemperature),
@@ -13719,7 +13701,7 @@ AirCooled.element_children = [
     ("DesignTemperatureDifference", DesignTemperatureDifference),
     ("Capacity", Capacity),
     ("CapacityUnits", CapacityUnits),
-]
+)
 
 
 # CondenserPlantType.WaterCooled
@@ -13728,7 +13710,7 @@ class WaterCooled(BSElement):
         """If exists then the cooling system has a water-side economizer to provide free cooling."""
 
 
-WaterCooled.element_children = [
+WaterCooled.element_children = (
     ("WaterCooledCondenserType", WaterCooledCondenserType),
     ("CondenserWaterTemperature", CondenserWaterTemperature),
     ("CondensingTemperature", CondensingTemperature),
@@ -13740,18 +13722,16 @@ WaterCooled.element_children = [
     ("CellCount", CellCount),
     ("Capacity", Capacity),
     ("CapacityUnits", CapacityUnits),
-]
-WaterCooled.WaterSideEconomizer.element_attributes = [
-    "ID",  # ID
-]
-WaterCooled.WaterSideEconomizer.element_children = [
+)
+WaterCooled.WaterSideEconomizer.element_attributes = _ID_ATTRS
+WaterCooled.WaterSideEconomizer.element_children = (
     ("WaterSideEconomizerType", WaterSideEconomizerType),
     ("WaterSideEconomizerTemperatureMaximum", WaterSideEconomizerTemperatureMaximum),
     (
         "WaterSideEconomizerDBTemperatureMaximum",
         WaterSideEconomizerDBTemperatureMaximum,
     ),
-]
+)
 
 
 # CondenserPlantType.GroundSource
@@ -13760,7 +13740,7 @@ class GroundSource(BSElement):
         """If exists then the cooling system has a water-side economizer to provide free cooling."""
 
 
-GroundSource.element_children = [
+GroundSource.element_children = (
     ("GroundSourceType", GroundSourceType),
     ("CondenserWaterTemperature", CondenserWaterTemperature),
     ("CondensingTemperature", CondensingTemperature),
@@ -13769,11 +13749,9 @@ GroundSource.element_children = [
     ("WellCount", WellCount),
     ("Capacity", Capacity),
     ("CapacityUnits", CapacityUnits),
-]
-GroundSource.WaterSideEconomizer.element_attributes = [
-    "ID",  # ID
-]
-GroundSource.WaterSideEconomizer.element_children = [
+)
+GroundSource.WaterSideEconomizer.element_attributes = _ID_ATTRS
+GroundSource.WaterSideEconomizer.element_children = (
     ("WaterSideEconomizerType", WaterSideEconomizerType),
     ("WaterSideEconomizerTemperatureSetpoint", WaterSideEconomizerTemperatureSetpoint),
     ("WaterSideEconomizerTemperatureMaximum", WaterSideEconomizerTemperatureMaximum),
@@ -13781,7 +13759,7 @@ GroundSource.WaterSideEconomizer.element_children = [
         "WaterSideEconomizerDBTemperatureMaximum",
         WaterSideEconomizerDBTemperatureMaximum,
     ),
-]
+)
 
 
 # OtherHVACSystemType.OtherHVACType.MechanicalVentilation
@@ -13789,7 +13767,7 @@ class MechanicalVentilation(BSElement):
     pass
 
 
-MechanicalVentilation.element_children = [
+MechanicalVentilation.element_children = (
     ("VentilationRate", VentilationRate),
     ("RequiredVentilationRate", RequiredVentilationRate),
     ("VentilationType", VentilationType),
@@ -13802,21 +13780,17 @@ MechanicalVentilation.element_children = [
     ("DutyCycle", DutyCycle),
     ("SystemPerformanceRatio", SystemPerformanceRatio),
     ("ThirdPartyCertification", ThirdPartyCertification),
-]
+)
 
 
 # LightingSystemType.LampType
 class LampType(BSElement):
     """A lamp is a replaceable component, or bulb, which is designed to produce light from electricity, though, non-electric lamps also exist."""
 
-    class OtherCombination(OtherCombination):
-        pass
-
-    class Unknown(Unknown):
-        pass
-
 
-LampType.element_children = [
+LampType.OtherCombination = OtherCombination
+LampType.Unknown = Unknown
+LampType.element_children = (
     ("Incandescent", Incandescent),
     ("LinearFluorescent", LinearFluorescent),
     ("CompactFluorescent", CompactFluorescent),
@@ -13830,7 +13804,7 @@ LampType.element_children = [
     ("SelfLuminous", SelfLuminous),
     ("OtherCombination", LampType.OtherCombination),
     ("Unknown", LampType.Unknown),
-]
+)
 
 
 # LightingSystemType.DimmingCapability
@@ -13838,10 +13812,10 @@ class DimmingCapability(BSElement):
     """If exists then the lighting system can be dimmed across a range of outputs."""
 
 
-DimmingCapability.element_children = [
+DimmingCapability.element_children = (
     ("MinimumDimmingLightFraction", MinimumDimmingLightFraction),
     ("MinimumDimmingPowerFraction", MinimumDimmingPowerFraction),
-]
+)
 
 
 # RefrigerationSystemType.RefrigerationSystemCategory
@@ -13849,10 +13823,10 @@ class RefrigerationSystemCategory(BSElement):
     """Basic type of refrigeration equipment."""
 
 
-RefrigerationSystemCategory.element_children = [
+RefrigerationSystemCategory.element_children = (
     ("CentralRefrigerationSystem", CentralRefrigerationSystem),
     ("RefrigerationUnit", RefrigerationUnit),
-]
+)
 
 
 # LaundrySystemType.LaundryType
@@ -13862,17 +13836,15 @@ class LaundryType(BSElement):
     class Other(OtherType):
         pass
 
-    class Unknown(Unknown):
-        pass
 
-
-LaundryType.element_children = [
+LaundryType.Unknown = Unknown
+LaundryType.element_children = (
     ("Washer", Washer),
     ("Dryer", Dryer),
     ("Combination", Combination),
     ("Other", LaundryType.Other),
     ("Unknown", LaundryType.Unknown),
-]
+)
 
 
 # WallSystemType.WallInsulations
@@ -13880,9 +13852,7 @@ class WallInsulations(BSElement):
     """A description of the type of insulation and how it is applied."""
 
 
-WallInsulations.element_children = [
-    ("WallInsulation", WallInsulation),
-]
+WallInsulations.element_children = (("WallInsulation", WallInsulation),)
 
 
 # CeilingSystemType.CeilingInsulations
@@ -13890,9 +13860,7 @@ class CeilingInsulations(BSElement):
     pass
 
 
-CeilingInsulations.element_children = [
-    ("CeilingInsulation", CeilingInsulation),
-]
+CeilingInsulations.element_children = (("CeilingInsulation", CeilingInsulation),)
 
 
 # RoofSystemType.RoofInsulations
@@ -13900,9 +13868,7 @@ class RoofInsulations(BSElement):
     pass
 
 
-RoofInsulations.element_children = [
-    ("RoofInsulation", RoofInsulation),
-]
+RoofInsulations.element_children = (("RoofInsulation", RoofInsulation),)
 
 
 # FenestrationSystemType.FenestrationType
@@ -13913,12 +13879,12 @@ class FenestrationType(BSElement):
         pass
 
 
-FenestrationType.element_children = [
+FenestrationType.element_children = (
     ("Window", Window),
     ("Skylight", Skylight),
     ("Door", Door),
     ("Other", FenestrationType.Other),
-]
+)
 
 
 # FoundationSystemType.GroundCouplings
@@ -13926,9 +13892,7 @@ class GroundCouplings(BSElement):
     pass
 
 
-GroundCouplings.element_children = [
-    ("GroundCoupling", GroundCoupling),
-]
+GroundCouplings.element_children = (("GroundCoupling", GroundCoupling),)
 
 
 # OnsiteStorageTransmissionGenerationSystemType.EnergyConversionType
@@ -13936,10 +13900,10 @@ class EnergyConversionType(BSElement):
     """Type of energy conversion provided by the system."""
 
 
-EnergyConversionType.element_children = [
+EnergyConversionType.element_children = (
     ("Storage", Storage),
     ("Generation", Generation),
-]
+)
 
 
 # CalculationMethodType.Measured
@@ -13947,9 +13911,7 @@ class Measured(BSElement):
     """The 'Measured' calculation method is used to represent a scenario in which actual measurements were used to derive data represented by this scenario type."""
 
 
-Measured.element_children = [
-    ("MeasuredEnergySource", MeasuredEnergySource),
-]
+Measured.element_children = (("MeasuredEnergySource", MeasuredEnergySource),)
 
 
 # LinkedFacilityID
@@ -13957,13 +13919,11 @@ class LinkedFacilityID(BSElement):
     """ID numbers of the facilities associated with the system."""
 
 
-LinkedFacilityID.element_attributes = [
-    "IDref",  # IDREF
-]
-LinkedFacilityID.element_children = [
+LinkedFacilityID.element_attributes = ("IDref",)  # IDREF
+LinkedFacilityID.element_children = (
     ("LinkedScheduleIDs", LinkedScheduleIDs),
     ("FloorAreas", FloorAreas),
-]
+)
 
 
 # LinkedSiteID
@@ -13971,13 +13931,11 @@ class LinkedSiteID(BSElement):
     """ID numbers of the sites associated with the system."""
 
 
-LinkedSiteID.element_attributes = [
-    "IDref",  # IDREF
-]
-LinkedSiteID.element_children = [
+LinkedSiteID.element_attributes = ("IDref",)  # IDREF
+LinkedSiteID.element_children = (
     ("LinkedScheduleIDs", LinkedScheduleIDs),
     ("FloorAreas", FloorAreas),
-]
+)
 
 
 # LinkedBuildingID
@@ -13985,13 +13943,11 @@ class LinkedBuildingID(BSElement):
     """ID numbers of the associated buildings."""
 
 
-LinkedBuildingID.element_attributes = [
-    "IDref",  # IDREF
-]
-LinkedBuildingID.element_children = [
+LinkedBuildingID.element_attributes = ("IDref",)  # IDREF
+LinkedBuildingID.element_children = (
     ("LinkedScheduleIDs", LinkedScheduleIDs),
     ("FloorAreas", FloorAreas),
-]
+)
 
 
 # LinkedSectionID
@@ -13999,13 +13955,11 @@ class LinkedSectionID(BSElement):
     """ID numbers of the associated sections."""
 
 
-LinkedSectionID.element_attributes = [
-    "IDref",  # IDREF
-]
-LinkedSectionID.element_children = [
+LinkedSectionID.element_attributes = ("IDref",)  # IDREF
+LinkedSectionID.element_children = (
     ("LinkedScheduleIDs", LinkedScheduleIDs),
     ("FloorAreas", FloorAreas),
-]
+)
 
 
 # LinkedThermalZoneID
@@ -14013,13 +13967,11 @@ class LinkedThermalZoneID(BSElement):
     """ID numbers of the associated zones."""
 
 
-LinkedThermalZoneID.element_attributes = [
-    "IDref",  # IDREF
-]
-LinkedThermalZoneID.element_children = [
+LinkedThermalZoneID.element_attributes = ("IDref",)  # IDREF
+LinkedThermalZoneID.element_children = (
     ("LinkedScheduleIDs", LinkedScheduleIDs),
     ("FloorAreas", FloorAreas),
-]
+)
 
 
 # LinkedSpaceID
@@ -14027,13 +13979,11 @@ class LinkedSpaceID(BSElement):
     """ID numbers of the associated spaces."""
 
 
-LinkedSpaceID.element_attributes = [
-    "IDref",  # IDREF
-]
-LinkedSpaceID.element_children = [
+LinkedSpaceID.element_attributes = ("IDref",)  # IDREF
+LinkedSpaceID.element_children = (
     ("LinkedScheduleIDs", LinkedScheduleIDs),
     ("FloorAreas", FloorAreas),
-]
+)
 
 
 # LinkedAuditCycle.IndexYearOfAuditCycle
@@ -14050,12 +14000,8 @@ class LinkedAuditCycle(BSElement):
     pass
 
 
-LinkedAuditCycle.element_attributes = [
-    "IDref",  # IDREF
-]
-LinkedAuditCycle.element_children = [
-    ("IndexYearOfAuditCycle", IndexYearOfAuditCycle),
-]
+LinkedAuditCycle.element_attributes = ("IDref",)  # IDREF
+LinkedAuditCycle.element_children = (("IndexYearOfAuditCycle", IndexYearOfAuditCycle),)
 
 
 # LinkedAuditCycles
@@ -14065,9 +14011,7 @@ class LinkedAuditCycles(BSElement):
     pass
 
 
-LinkedAuditCycles.element_children = [
-    ("LinkedAuditCycle", LinkedAuditCycle),
-]
+LinkedAuditCycles.element_children = (("LinkedAuditCycle", LinkedAuditCycle),)
 
 
 # FanBasedDistributionTypeType
@@ -14075,9 +14019,7 @@ class FanBasedDistributionTypeType(BSElement):
     pass
 
 
-FanBasedDistributionTypeType.element_children = [
-    ("FanCoil", FanCoil),
-]
+FanBasedDistributionTypeType.element_children = (("FanCoil", FanCoil),)
 
 
 # FanBasedType.FanBasedDistributionType
@@ -14096,12 +14038,12 @@ class Occupancy(BSElement):
         """Occupancy-based control strategy."""
 
 
-Occupancy.element_children = [
+Occupancy.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlSensor", Occupancy.ControlSensor),
     ("ControlStrategy", Occupancy.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
+)
 
 
 # ControlGeneralType.Thermostat
@@ -14112,11 +14054,11 @@ class Thermostat(BSElement):
         """Thermostat controller strategy."""
 
 
-Thermostat.element_children = [
+Thermostat.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlStrategy", Thermostat.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
+)
 
 
 # ControlLightingType.Daylighting
@@ -14130,13 +14072,13 @@ class Daylighting(BSElement):
         """Daylighting control strategy."""
 
 
-Daylighting.element_children = [
+Daylighting.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlSensor", Daylighting.ControlSensor),
     ("ControlSteps", ControlSteps),
     ("ControlStrategy", Daylighting.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
+)
 
 
 # DerivedModelType.Models.Model.DerivedModelInputs.ResponseVariable.ResponseVariableUnits
@@ -14149,11 +14091,11 @@ class ResponseVariable(BSElement):
     pass
 
 
-ResponseVariable.element_children = [
+ResponseVariable.element_children = (
     ("ResponseVariableName", ResponseVariableName),
     ("ResponseVariableUnits", ResponseVariableUnits),
     ("ResponseVariableEndUse", ResponseVariableEndUse),
-]
+)
 
 
 # UnitsType
@@ -14161,12 +14103,12 @@ class UnitsType(BSElement):
     """Enumeration for different potential units."""
 
 
-UnitsType.element_union = [
+UnitsType.element_union = (
     ResourceUnitsType,
     PressureUnitsType,
     PeakResourceUnitsType,
     TemperatureUnitsType,
-]
+)
 
 
 # WallSystemType
@@ -14174,11 +14116,11 @@ class WallSystemType(BSElement):
     pass
 
 
-WallSystemType.element_attributes = [
+WallSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-WallSystemType.element_children = [
+)
+WallSystemType.element_children = (
     ("ExteriorWallConstruction", ExteriorWallConstruction),
     ("ExteriorWallFinish", ExteriorWallFinish),
     ("ExteriorWallColor", ExteriorWallColor),
@@ -14197,7 +14139,7 @@ WallSystemType.element_children = [
     ("Quantity", Quantity),
     ("YearInstalled", YearInstalled),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # RoofSystemType
@@ -14205,11 +14147,11 @@ class RoofSystemType(BSElement):
     pass
 
 
-RoofSystemType.element_attributes = [
+RoofSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-RoofSystemType.element_children = [
+)
+RoofSystemType.element_children = (
     ("RoofConstruction", RoofConstruction),
     ("BlueRoof", BlueRoof),
     ("CoolRoof", CoolRoof),
@@ -14232,7 +14174,7 @@ RoofSystemType.element_children = [
     ("Quantity", Quantity),
     ("YearInstalled", YearInstalled),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # CeilingSystemType
@@ -14240,11 +14182,11 @@ class CeilingSystemType(BSElement):
     pass
 
 
-CeilingSystemType.element_attributes = [
+CeilingSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-CeilingSystemType.element_children = [
+)
+CeilingSystemType.element_children = (
     ("CeilingConstruction", CeilingConstruction),
     ("CeilingFinish", CeilingFinish),
     ("CeilingColor", CeilingColor),
@@ -14259,7 +14201,7 @@ CeilingSystemType.element_children = [
     ("Quantity", Quantity),
     ("YearInstalled", YearInstalled),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # FenestrationSystemType
@@ -14267,11 +14209,11 @@ class FenestrationSystemType(BSElement):
     pass
 
 
-FenestrationSystemType.element_attributes = [
+FenestrationSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-FenestrationSystemType.element_children = [
+)
+FenestrationSystemType.element_children = (
     ("FenestrationType", FenestrationType),
     ("FenestrationFrameMaterial", FenestrationFrameMaterial),
     ("FenestrationOperation", FenestrationOperation),
@@ -14291,7 +14233,7 @@ FenestrationSystemType.element_children = [
     ("ModelNumber", ModelNumber),
     ("UserDefinedFields", UserDefinedFields),
     ("EquipmentID", EquipmentID),
-]
+)
 
 
 # ExteriorFloorSystemType
@@ -14299,11 +14241,11 @@ class ExteriorFloorSystemType(BSElement):
     pass
 
 
-ExteriorFloorSystemType.element_attributes = [
+ExteriorFloorSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-ExteriorFloorSystemType.element_children = [
+)
+ExteriorFloorSystemType.element_children = (
     ("ExteriorFloorConstruction", ExteriorFloorConstruction),
     ("ExteriorFloorFinish", ExteriorFloorFinish),
     ("ExteriorFloorColor", ExteriorFloorColor),
@@ -14323,7 +14265,7 @@ ExteriorFloorSystemType.element_children = [
     ("Quantity", Quantity),
     ("YearInstalled", YearInstalled),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # FoundationSystemType
@@ -14331,11 +14273,11 @@ class FoundationSystemType(BSElement):
     pass
 
 
-FoundationSystemType.element_attributes = [
+FoundationSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-FoundationSystemType.element_children = [
+)
+FoundationSystemType.element_children = (
     ("GroundCouplings", GroundCouplings),
     ("FloorCovering", FloorCovering),
     ("FloorConstructionType", FloorConstructionType),
@@ -14343,7 +14285,7 @@ FoundationSystemType.element_children = [
     ("YearInstalled", YearInstalled),
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
-]
+)
 
 
 # ContactType
@@ -14351,10 +14293,8 @@ class ContactType(BSElement):
     pass
 
 
-ContactType.element_attributes = [
-    "ID",  # ID
-]
-ContactType.element_children = [
+ContactType.element_attributes = _ID_ATTRS
+ContactType.element_children = (
     ("ContactRoles", ContactRoles),
     ("ContactName", ContactName),
     ("ContactCompany", ContactCompany),
@@ -14363,7 +14303,7 @@ ContactType.element_children = [
     ("ContactTelephoneNumbers", ContactTelephoneNumbers),
     ("ContactEmailAddresses", ContactEmailAddresses),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # TenantType
@@ -14371,17 +14311,15 @@ class TenantType(BSElement):
     pass
 
 
-TenantType.element_attributes = [
-    "ID",  # ID
-]
-TenantType.element_children = [
+TenantType.element_attributes = _ID_ATTRS
+TenantType.element_children = (
     ("TenantName", TenantName),
     ("Address", Address),
     ("TenantTelephoneNumbers", TenantTelephoneNumbers),
     ("TenantEmailAddresses", TenantEmailAddresses),
     ("ContactIDs", ContactIDs),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # AuditCycleType
@@ -14389,16 +14327,14 @@ class AuditCycleType(BSElement):
     pass
 
 
-AuditCycleType.element_attributes = [
-    "ID",  # ID
-]
-AuditCycleType.element_children = [
+AuditCycleType.element_attributes = _ID_ATTRS
+AuditCycleType.element_children = (
     ("AuditCycleName", AuditCycleName),
     ("AuditCycleNotes", AuditCycleNotes),
     ("AuditCycleStartYear", AuditCycleStartYear),
     ("AuditCycleEndYear", AuditCycleEndYear),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # ResourceUseType
@@ -14406,10 +14342,8 @@ class ResourceUseType(BSElement):
     pass
 
 
-ResourceUseType.element_attributes = [
-    "ID",  # ID
-]
-ResourceUseType.element_children = [
+ResourceUseType.element_attributes = _ID_ATTRS
+ResourceUseType.element_children = (
     ("EnergyResource", EnergyResource),
     ("ResourceUseNotes", ResourceUseNotes),
     ("ResourceBoundary", ResourceBoundary),
@@ -14432,7 +14366,7 @@ ResourceUseType.element_children = [
     ("MeterID", MeterID),
     ("ParentResourceUseID", ParentResourceUseID),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # TimeSeries
@@ -14450,9 +14384,7 @@ class RateSchedules(BSElement):
     pass
 
 
-RateSchedules.element_children = [
-    ("RateSchedule", RateSchedule),
-]
+RateSchedules.element_children = (("RateSchedule", RateSchedule),)
 
 
 # LinkedPremisesOrSystem
@@ -14478,7 +14410,7 @@ class LinkedPremisesOrSystem(BSElement):
         pass
 
 
-LinkedPremisesOrSystem.element_children = [
+LinkedPremisesOrSystem.element_children = (
     ("Facility", LinkedPremisesOrSystem.Facility),
     ("Site", LinkedPremisesOrSystem.Site),
     ("Building", LinkedPremisesOrSystem.Building),
@@ -14486,47 +14418,37 @@ LinkedPremisesOrSystem.element_children = [
     ("ThermalZone", LinkedPremisesOrSystem.ThermalZone),
     ("Space", LinkedPremisesOrSystem.Space),
     ("System", System),
-]
-LinkedPremisesOrSystem.Facility.element_children = [
+)
+LinkedPremisesOrSystem.Facility.element_children = (
     ("LinkedFacilityID", LinkedFacilityID),
-]
-LinkedPremisesOrSystem.Site.element_children = [
-    ("LinkedSiteID", LinkedSiteID),
-]
-LinkedPremisesOrSystem.Building.element_children = [
+)
+LinkedPremisesOrSystem.Site.element_children = (("LinkedSiteID", LinkedSiteID),)
+LinkedPremisesOrSystem.Building.element_children = (
     ("LinkedBuildingID", LinkedBuildingID),
-]
-LinkedPremisesOrSystem.Section.element_children = [
+)
+LinkedPremisesOrSystem.Section.element_children = (
     ("LinkedSectionID", LinkedSectionID),
-]
-LinkedPremisesOrSystem.ThermalZone.element_children = [
+)
+LinkedPremisesOrSystem.ThermalZone.element_children = (
     ("LinkedThermalZoneID", LinkedThermalZoneID),
-]
-LinkedPremisesOrSystem.Space.element_children = [
-    ("LinkedSpaceID", LinkedSpaceID),
-]
+)
+LinkedPremisesOrSystem.Space.element_children = (("LinkedSpaceID", LinkedSpaceID),)
 
 
 # CoolingPlantType
 class CoolingPlantType(BSElement):
-    class OtherCombination(OtherCombination):
-        pass
-
-    class NoCooling(NoCooling):
-        pass
-
-    class Unknown(Unknown):
-        pass
-
     class ControlSystemTypes(BSElement):
         """CoolingPlant equipment control strategies."""
 
 
-CoolingPlantType.element_attributes = [
+CoolingPlantType.OtherCombination = OtherCombination
+CoolingPlantType.NoCooling = NoCooling
+CoolingPlantType.Unknown = Unknown
+CoolingPlantType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-CoolingPlantType.element_children = [
+)
+CoolingPlantType.element_children = (
     ("Chiller", Chiller),
     ("DistrictChilledWater", DistrictChilledWater),
     ("OtherCombination", OtherCombination),
@@ -14540,10 +14462,10 @@ CoolingPlantType.element_children = [
     ("BuildingAutomationSystem", BuildingAutomationSystem),
     ("ControlSystemTypes", CoolingPlantType.ControlSystemTypes),
     ("UserDefinedFields", UserDefinedFields),
-]
-CoolingPlantType.ControlSystemTypes.element_children = [
+)
+CoolingPlantType.ControlSystemTypes.element_children = (
     ("ControlSystemType", ControlSystemType),
-]
+)
 
 
 # CondenserPlantType
@@ -14551,17 +14473,13 @@ class CondenserPlantType(BSElement):
     class Other(OtherType):
         pass
 
-    class Unknown(Unknown):
-        pass
-
     class ControlSystemTypes(BSElement):
         """CondenserPlant equipment control strategies."""
 
 
-CondenserPlantType.element_attributes = [
-    "ID",  # ID
-]
-CondenserPlantType.element_children = [
+CondenserPlantType.Unknown = Unknown
+CondenserPlantType.element_attributes = _ID_ATTRS
+CondenserPlantType.element_children = (
     ("AirCooled", AirCooled),
     ("WaterCooled", WaterCooled),
     ("GroundSource", GroundSource),
@@ -14575,10 +14493,10 @@ CondenserPlantType.element_children = [
     ("BuildingAutomationSystem", BuildingAutomationSystem),
     ("ControlSystemTypes", CondenserPlantType.ControlSystemTypes),
     ("UserDefinedFields", UserDefinedFields),
-]
-CondenserPlantType.ControlSystemTypes.element_children = [
+)
+CondenserPlantType.ControlSystemTypes.element_children = (
     ("ControlSystemType", ControlSystemType),
-]
+)
 
 
 # ControlGeneralType
@@ -14610,35 +14528,35 @@ class ControlGeneralType(BSElement):
             """HVAC control strategy for other control technology."""
 
 
-ControlGeneralType.element_children = [
+ControlGeneralType.element_children = (
     ("AdvancedPowerStrip", ControlGeneralType.AdvancedPowerStrip),
     ("Manual", ControlGeneralType.Manual),
     ("Occupancy", Occupancy),
     ("Timer", ControlGeneralType.Timer),
     ("Thermostat", Thermostat),
     ("OtherControlTechnology", ControlGeneralType.OtherControlTechnology),
-]
-ControlGeneralType.AdvancedPowerStrip.element_children = [
+)
+ControlGeneralType.AdvancedPowerStrip.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlStrategy", ControlGeneralType.AdvancedPowerStrip.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
-ControlGeneralType.Manual.element_children = [
+)
+ControlGeneralType.Manual.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlStrategy", ControlGeneralType.Manual.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
-ControlGeneralType.Timer.element_children = [
+)
+ControlGeneralType.Timer.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlStrategy", ControlGeneralType.Timer.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
-ControlGeneralType.OtherControlTechnology.element_children = [
+)
+ControlGeneralType.OtherControlTechnology.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("OtherControlTechnologyName", OtherControlTechnologyName),
     ("ControlStrategy", ControlGeneralType.OtherControlTechnology.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
+)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.CoolingSources.CoolingSource
@@ -14650,11 +14568,11 @@ class CoolingSource(BSElement):
             """CoolingSource control."""
 
 
-CoolingSource.element_attributes = [
+CoolingSource.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-CoolingSource.element_children = [
+)
+CoolingSource.element_children = (
     ("CoolingSourceType", CoolingSourceType),
     ("CoolingMedium", CoolingMedium),
     ("AnnualCoolingEfficiencyValue", AnnualCoolingEfficiencyValue),
@@ -14677,10 +14595,8 @@ CoolingSource.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-CoolingSource.Controls.element_children = [
-    ("Control", CoolingSource.Controls.Control),
-]
+)
+CoolingSource.Controls.element_children = (("Control", CoolingSource.Controls.Control),)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.CoolingSources
@@ -14688,23 +14604,17 @@ class CoolingSources(BSElement):
     pass
 
 
-CoolingSources.element_children = [
-    ("CoolingSource", CoolingSource),
-]
+CoolingSources.element_children = (("CoolingSource", CoolingSource),)
 
 
 # OtherHVACSystemType.OtherHVACType
 class OtherHVACType(BSElement):
     """Type of space conditioning equipment that is not classified as heating, cooling, or air-distribution. This category includes ventilation, dehumidification, humidification, and air cleaning systems."""
 
-    class OtherCombination(OtherCombination):
-        pass
 
-    class Unknown(Unknown):
-        pass
-
-
-OtherHVACType.element_children = [
+OtherHVACType.OtherCombination = OtherCombination
+OtherHVACType.Unknown = Unknown
+OtherHVACType.element_children = (
     ("Humidifier", Humidifier),
     ("Dehumidifier", Dehumidifier),
     ("AirCleaner", AirCleaner),
@@ -14713,7 +14623,7 @@ OtherHVACType.element_children = [
     ("NaturalVentilation", NaturalVentilation),
     ("OtherCombination", OtherHVACType.OtherCombination),
     ("Unknown", OtherHVACType.Unknown),
-]
+)
 
 
 # ControlLightingType
@@ -14731,7 +14641,7 @@ class ControlLightingType(BSElement):
             """Manual lighting control strategy."""
 
             element_type = "xs:string"
-            element_enumerations = [
+            element_enumerations = (
                 "Always On",
                 "Always Off",
                 "Manual On/Off",
@@ -14741,7 +14651,7 @@ class ControlLightingType(BSElement):
                 "Other",
                 "None",
                 "Unknown",
-            ]
+            )
 
     class Timer(BSElement):
         """Type of timer-based controls for managing lighting on specified timed intervals."""
@@ -14754,35 +14664,35 @@ class ControlLightingType(BSElement):
             """Control strategy used for other control technology."""
 
 
-ControlLightingType.element_children = [
+ControlLightingType.element_children = (
     ("AdvancedPowerStrip", ControlLightingType.AdvancedPowerStrip),
     ("Daylighting", Daylighting),
     ("Manual", ControlLightingType.Manual),
     ("Occupancy", Occupancy),
     ("Timer", ControlLightingType.Timer),
     ("OtherControlTechnology", ControlLightingType.OtherControlTechnology),
-]
-ControlLightingType.AdvancedPowerStrip.element_children = [
+)
+ControlLightingType.AdvancedPowerStrip.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlStrategy", ControlLightingType.AdvancedPowerStrip.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
-ControlLightingType.Manual.element_children = [
+)
+ControlLightingType.Manual.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlStrategy", ControlLightingType.Manual.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
-ControlLightingType.Timer.element_children = [
+)
+ControlLightingType.Timer.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("ControlStrategy", ControlLightingType.Timer.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
-ControlLightingType.OtherControlTechnology.element_children = [
+)
+ControlLightingType.OtherControlTechnology.element_children = (
     ("ControlSystemType", ControlSystemType),
     ("OtherControlTechnologyName", OtherControlTechnologyName),
     ("ControlStrategy", ControlLightingType.OtherControlTechnology.ControlStrategy),
     ("OtherControlStrategyName", OtherControlStrategyName),
-]
+)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Indirect.IndirectTankHeatingSource.Solar
@@ -14794,7 +14704,7 @@ class Solar(BSElement):
             """Solar hot water control."""
 
 
-Solar.element_children = [
+Solar.element_children = (
     ("SolarThermalSystemType", SolarThermalSystemType),
     ("SolarThermalSystemCollectorArea", SolarThermalSystemCollectorArea),
     ("SolarThermalSystemCollectorLoopType", SolarThermalSystemCollectorLoopType),
@@ -14810,10 +14720,8 @@ Solar.element_children = [
     ("ModelNumber", ModelNumber),
     ("Location", Location),
     ("EquipmentID", EquipmentID),
-]
-Solar.Controls.element_children = [
-    ("Control", Solar.Controls.Control),
-]
+)
+Solar.Controls.element_children = (("Control", Solar.Controls.Control),)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Indirect.IndirectTankHeatingSource
@@ -14826,22 +14734,20 @@ class IndirectTankHeatingSource(BSElement):
     class Other(OtherType):
         pass
 
-    class Unknown(Unknown):
-        pass
-
 
-IndirectTankHeatingSource.element_children = [
+IndirectTankHeatingSource.Unknown = Unknown
+IndirectTankHeatingSource.element_children = (
     ("HeatPump", IndirectTankHeatingSource.HeatPump),
     ("Solar", Solar),
     ("SpaceHeatingSystem", SpaceHeatingSystem),
     ("Other", IndirectTankHeatingSource.Other),
     ("Unknown", IndirectTankHeatingSource.Unknown),
-]
-IndirectTankHeatingSource.HeatPump.element_children = [
+)
+IndirectTankHeatingSource.HeatPump.element_children = (
     ("RatedHeatPumpSensibleHeatRatio", RatedHeatPumpSensibleHeatRatio),
     ("HPWHMinimumAirTemperature", HPWHMinimumAirTemperature),
     ("Refrigerant", Refrigerant),
-]
+)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType.Indirect
@@ -14849,9 +14755,7 @@ class Indirect(BSElement):
     pass
 
 
-Indirect.element_children = [
-    ("IndirectTankHeatingSource", IndirectTankHeatingSource),
-]
+Indirect.element_children = (("IndirectTankHeatingSource", IndirectTankHeatingSource),)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank.TankHeatingType
@@ -14861,16 +14765,14 @@ class TankHeatingType(BSElement):
     class Other(OtherType):
         pass
 
-    class Unknown(Unknown):
-        pass
 
-
-TankHeatingType.element_children = [
+TankHeatingType.Unknown = Unknown
+TankHeatingType.element_children = (
     ("Direct", Direct),
     ("Indirect", Indirect),
     ("Other", TankHeatingType.Other),
     ("Unknown", TankHeatingType.Unknown),
-]
+)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType.StorageTank
@@ -14878,7 +14780,7 @@ class StorageTank(BSElement):
     pass
 
 
-StorageTank.element_children = [
+StorageTank.element_children = (
     ("TankHeatingType", TankHeatingType),
     ("TankVolume", TankVolume),
     ("TankHeight", TankHeight),
@@ -14887,7 +14789,7 @@ StorageTank.element_children = [
     ("StorageTankInsulationRValue", StorageTankInsulationRValue),
     ("StorageTankInsulationThickness", StorageTankInsulationThickness),
     ("OffCycleHeatLossCoefficient", OffCycleHeatLossCoefficient),
-]
+)
 
 
 # CalculationMethodType
@@ -14896,13 +14798,13 @@ class CalculationMethodType(BSElement):
         pass
 
 
-CalculationMethodType.element_children = [
+CalculationMethodType.element_children = (
     ("Modeled", Modeled),
     ("Measured", Measured),
     ("Estimated", Estimated),
     ("EngineeringCalculation", EngineeringCalculation),
     ("Other", CalculationMethodType.Other),
-]
+)
 
 
 # FanBasedType
@@ -14910,7 +14812,7 @@ class FanBasedType(BSElement):
     pass
 
 
-FanBasedType.element_children = [
+FanBasedType.element_children = (
     ("FanBasedDistributionType", FanBasedDistributionType),
     ("AirSideEconomizer", AirSideEconomizer),
     ("HeatingSupplyAirTemperatureControl", HeatingSupplyAirTemperatureControl),
@@ -14951,7 +14853,7 @@ FanBasedType.element_children = [
     ("HeatingSupplyAirTemperature", HeatingSupplyAirTemperature),
     ("SupplyAirTemperatureResetControl", SupplyAirTemperatureResetControl),
     ("StaticPressureResetControl", StaticPressureResetControl),
-]
+)
 
 
 # DerivedModelType.Models.Model.DerivedModelInputs.ExplanatoryVariables.ExplanatoryVariable.ExplanatoryVariableUnits
@@ -14964,10 +14866,10 @@ class ExplanatoryVariable(BSElement):
     pass
 
 
-ExplanatoryVariable.element_children = [
+ExplanatoryVariable.element_children = (
     ("ExplanatoryVariableName", ExplanatoryVariableName),
     ("ExplanatoryVariableUnits", ExplanatoryVariableUnits),
-]
+)
 
 
 # DerivedModelType.Models.Model.DerivedModelInputs.ExplanatoryVariables
@@ -14975,9 +14877,7 @@ class ExplanatoryVariables(BSElement):
     pass
 
 
-ExplanatoryVariables.element_children = [
-    ("ExplanatoryVariable", ExplanatoryVariable),
-]
+ExplanatoryVariables.element_children = (("ExplanatoryVariable", ExplanatoryVariable),)
 
 
 # DerivedModelType.Models.Model.DerivedModelInputs
@@ -14985,11 +14885,11 @@ class DerivedModelInputs(BSElement):
     pass
 
 
-DerivedModelInputs.element_children = [
+DerivedModelInputs.element_children = (
     ("IntervalFrequency", IntervalFrequency),
     ("ResponseVariable", ResponseVariable),
     ("ExplanatoryVariables", ExplanatoryVariables),
-]
+)
 
 
 # DerivedModelType.Models.Model.ModeledTimeSeriesData
@@ -14997,9 +14897,7 @@ class ModeledTimeSeriesData(BSElement):
     """This element stores the timeseries data generated when the model is applied to the training data, oftentimes referred to as yhat. The difference between each pairwise element in this series with its corresponding data from the Current Building Modeled Scenario would generate the residuals."""
 
 
-ModeledTimeSeriesData.element_children = [
-    ("TimeSeries", TimeSeries),
-]
+ModeledTimeSeriesData.element_children = (("TimeSeries", TimeSeries),)
 
 
 # DerivedModelType.Models.Model
@@ -15007,10 +14905,8 @@ class Model(BSElement):
     pass
 
 
-Model.element_attributes = [
-    "ID",  # ID
-]
-Model.element_children = [
+Model.element_attributes = _ID_ATTRS
+Model.element_children = (
     ("StartTimestamp", StartTimestamp),
     ("EndTimestamp", EndTimestamp),
     ("DerivedModelInputs", DerivedModelInputs),
@@ -15018,7 +14914,7 @@ Model.element_children = [
     ("DerivedModelPerformance", DerivedModelPerformance),
     ("SummaryInformation", SummaryInformation),
     ("ModeledTimeSeriesData", ModeledTimeSeriesData),
-]
+)
 
 
 # DerivedModelType.SavingsSummaries.SavingsSummary.ComparisonPeriodModeledTimeSeriesData
@@ -15026,9 +14922,7 @@ class ComparisonPeriodModeledTimeSeriesData(BSElement):
     """Applicable when the NormalizationMethod is Forecast or Backcast. Used to capture the modeled timeseries data associated with the comparison period."""
 
 
-ComparisonPeriodModeledTimeSeriesData.element_children = [
-    ("TimeSeries", TimeSeries),
-]
+ComparisonPeriodModeledTimeSeriesData.element_children = (("TimeSeries", TimeSeries),)
 
 
 # DerivedModelType.SavingsSummaries.SavingsSummary.StandardConditionsBaselinePeriodModeledTimeSeriesData
@@ -15036,9 +14930,9 @@ class StandardConditionsBaselinePeriodModeledTimeSeriesData(BSElement):
     """Applicable when the NormalizationMethod is Standard Conditions. Used to capture the modeled timeseries data associated with the baseline period at standard conditions."""
 
 
-StandardConditionsBaselinePeriodModeledTimeSeriesData.element_children = [
+StandardConditionsBaselinePeriodModeledTimeSeriesData.element_children = (
     ("TimeSeries", TimeSeries),
-]
+)
 
 
 # DerivedModelType.SavingsSummaries.SavingsSummary.StandardConditionsReportingPeriodModeledTimeSeriesData
@@ -15046,9 +14940,9 @@ class StandardConditionsReportingPeriodModeledTimeSeriesData(BSElement):
     """Applicable when the NormalizationMethod is Standard Conditions. Used to capture the modeled timeseries data associated with the reporting period at standard conditions."""
 
 
-StandardConditionsReportingPeriodModeledTimeSeriesData.element_children = [
+StandardConditionsReportingPeriodModeledTimeSeriesData.element_children = (
     ("TimeSeries", TimeSeries),
-]
+)
 
 
 # DerivedModelType.SavingsSummaries.SavingsSummary.StandardConditionsTimeSeriesData
@@ -15056,9 +14950,7 @@ class StandardConditionsTimeSeriesData(BSElement):
     """Applicable when the NormalizationMethod is Standard Conditions. Used to capture timeseries data inputs (i.e. temperature or weather data from a TMY3 file, etc.)."""
 
 
-StandardConditionsTimeSeriesData.element_children = [
-    ("TimeSeries", TimeSeries),
-]
+StandardConditionsTimeSeriesData.element_children = (("TimeSeries", TimeSeries),)
 
 
 # DerivedModelType.SavingsSummaries.SavingsSummary
@@ -15066,10 +14958,8 @@ class SavingsSummary(BSElement):
     pass
 
 
-SavingsSummary.element_attributes = [
-    "ID",  # ID
-]
-SavingsSummary.element_children = [
+SavingsSummary.element_attributes = _ID_ATTRS
+SavingsSummary.element_children = (
     ("BaselinePeriodModelID", BaselinePeriodModelID),
     ("ReportingPeriodModelID", ReportingPeriodModelID),
     ("NormalizationMethod", NormalizationMethod),
@@ -15105,7 +14995,7 @@ SavingsSummary.element_children = [
         StandardConditionsReportingPeriodModeledTimeSeriesData,
     ),
     ("StandardConditionsTimeSeriesData", StandardConditionsTimeSeriesData),
-]
+)
 
 
 # BuildingSync.Facilities.Facility.Systems.WallSystems.WallSystem
@@ -15118,9 +15008,7 @@ class WallSystems(BSElement):
     pass
 
 
-WallSystems.element_children = [
-    ("WallSystem", WallSystem),
-]
+WallSystems.element_children = (("WallSystem", WallSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.RoofSystems.RoofSystem
@@ -15133,9 +15021,7 @@ class RoofSystems(BSElement):
     pass
 
 
-RoofSystems.element_children = [
-    ("RoofSystem", RoofSystem),
-]
+RoofSystems.element_children = (("RoofSystem", RoofSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.CeilingSystems.CeilingSystem
@@ -15148,9 +15034,7 @@ class CeilingSystems(BSElement):
     pass
 
 
-CeilingSystems.element_children = [
-    ("CeilingSystem", CeilingSystem),
-]
+CeilingSystems.element_children = (("CeilingSystem", CeilingSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.FenestrationSystems.FenestrationSystem
@@ -15163,9 +15047,7 @@ class FenestrationSystems(BSElement):
     pass
 
 
-FenestrationSystems.element_children = [
-    ("FenestrationSystem", FenestrationSystem),
-]
+FenestrationSystems.element_children = (("FenestrationSystem", FenestrationSystem),)
 
 # BuildingSync.Facilities.Facility.Systems.ExteriorFloorSystems.ExteriorFloorSystem
 class ExteriorFloorSystem(ExteriorFloorSystemType):
@@ -15177,9 +15059,7 @@ class ExteriorFloorSystems(BSElement):
     pass
 
 
-ExteriorFloorSystems.element_children = [
-    ("ExteriorFloorSystem", ExteriorFloorSystem),
-]
+ExteriorFloorSystems.element_children = (("ExteriorFloorSystem", ExteriorFloorSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.FoundationSystems.FoundationSystem
@@ -15192,9 +15072,7 @@ class FoundationSystems(BSElement):
     pass
 
 
-FoundationSystems.element_children = [
-    ("FoundationSystem", FoundationSystem),
-]
+FoundationSystems.element_children = (("FoundationSystem", FoundationSystem),)
 
 
 # LinkedPremises
@@ -15220,32 +15098,22 @@ class LinkedPremises(BSElement):
         pass
 
 
-LinkedPremises.element_children = [
+LinkedPremises.element_children = (
     ("Facility", LinkedPremises.Facility),
     ("Site", LinkedPremises.Site),
     ("Building", LinkedPremises.Building),
     ("Section", LinkedPremises.Section),
     ("ThermalZone", LinkedPremises.ThermalZone),
     ("Space", LinkedPremises.Space),
-]
-LinkedPremises.Facility.element_children = [
-    ("LinkedFacilityID", LinkedFacilityID),
-]
-LinkedPremises.Site.element_children = [
-    ("LinkedSiteID", LinkedSiteID),
-]
-LinkedPremises.Building.element_children = [
-    ("LinkedBuildingID", LinkedBuildingID),
-]
-LinkedPremises.Section.element_children = [
-    ("LinkedSectionID", LinkedSectionID),
-]
-LinkedPremises.ThermalZone.element_children = [
+)
+LinkedPremises.Facility.element_children = (("LinkedFacilityID", LinkedFacilityID),)
+LinkedPremises.Site.element_children = (("LinkedSiteID", LinkedSiteID),)
+LinkedPremises.Building.element_children = (("LinkedBuildingID", LinkedBuildingID),)
+LinkedPremises.Section.element_children = (("LinkedSectionID", LinkedSectionID),)
+LinkedPremises.ThermalZone.element_children = (
     ("LinkedThermalZoneID", LinkedThermalZoneID),
-]
-LinkedPremises.Space.element_children = [
-    ("LinkedSpaceID", LinkedSpaceID),
-]
+)
+LinkedPremises.Space.element_children = (("LinkedSpaceID", LinkedSpaceID),)
 
 
 # BuildingSync.Facilities.Facility.Systems.WaterInfiltrationSystems.WaterInfiltrationSystem
@@ -15253,7 +15121,7 @@ class WaterInfiltrationSystem(BSElement):
     """Description of the infiltration characteristics for an opaque surface, fenestration unit, a thermal zone."""
 
 
-WaterInfiltrationSystem.element_children = [
+WaterInfiltrationSystem.element_children = (
     ("WaterInfiltrationNotes", WaterInfiltrationNotes),
     (
         "LocationsOfExteriorWaterIntrusionDamages",
@@ -15265,7 +15133,7 @@ WaterInfiltrationSystem.element_children = [
     ),
     ("LinkedPremises", LinkedPremises),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # BuildingSync.Facilities.Facility.Systems.WaterInfiltrationSystems
@@ -15273,9 +15141,9 @@ class WaterInfiltrationSystems(BSElement):
     pass
 
 
-WaterInfiltrationSystems.element_children = [
+WaterInfiltrationSystems.element_children = (
     ("WaterInfiltrationSystem", WaterInfiltrationSystem),
-]
+)
 
 
 # ScheduleType
@@ -15283,17 +15151,17 @@ class ScheduleType(BSElement):
     pass
 
 
-ScheduleType.element_attributes = [
+ScheduleType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-ScheduleType.element_children = [
+)
+ScheduleType.element_children = (
     ("SchedulePeriodBeginDate", SchedulePeriodBeginDate),
     ("SchedulePeriodEndDate", SchedulePeriodEndDate),
     ("ScheduleDetails", ScheduleDetails),
     ("LinkedPremises", LinkedPremises),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # BuildingSync.Facilities.Facility.Contacts.Contact
@@ -15306,9 +15174,7 @@ class Contacts(BSElement):
     pass
 
 
-Contacts.element_children = [
-    ("Contact", Contact),
-]
+Contacts.element_children = (("Contact", Contact),)
 
 
 # BuildingSync.Facilities.Facility.Tenants.Tenant
@@ -15321,9 +15187,7 @@ class Tenants(BSElement):
     pass
 
 
-Tenants.element_children = [
-    ("Tenant", Tenant),
-]
+Tenants.element_children = (("Tenant", Tenant),)
 
 
 # BuildingSync.Facilities.Facility.AuditCycles.AuditCycle
@@ -15336,9 +15200,7 @@ class AuditCycles(BSElement):
     pass
 
 
-AuditCycles.element_children = [
-    ("AuditCycle", AuditCycle),
-]
+AuditCycles.element_children = (("AuditCycle", AuditCycle),)
 
 
 # ThermalZoneType.Spaces
@@ -15349,9 +15211,7 @@ class Spaces(BSElement):
         pass
 
 
-Spaces.element_children = [
-    ("Space", Spaces.Space),
-]
+Spaces.element_children = (("Space", Spaces.Space),)
 
 
 # ScenarioType.TimeSeriesData
@@ -15359,9 +15219,7 @@ class TimeSeriesData(BSElement):
     pass
 
 
-TimeSeriesData.element_children = [
-    ("TimeSeries", TimeSeries),
-]
+TimeSeriesData.element_children = (("TimeSeries", TimeSeries),)
 
 
 # ScenarioType.AllResourceTotals
@@ -15369,9 +15227,7 @@ class AllResourceTotals(BSElement):
     pass
 
 
-AllResourceTotals.element_children = [
-    ("AllResourceTotal", AllResourceTotal),
-]
+AllResourceTotals.element_children = (("AllResourceTotal", AllResourceTotal),)
 
 
 # CalculationMethod
@@ -15384,12 +15240,12 @@ class CodeMinimum(BSElement):
     pass
 
 
-CodeMinimum.element_children = [
+CodeMinimum.element_children = (
     ("CodeName", CodeName),
     ("CodeVersion", CodeVersion),
     ("CodeYear", CodeYear),
     ("CalculationMethod", CalculationMethod),
-]
+)
 
 
 # ScenarioType.ScenarioType.Benchmark.BenchmarkType.StandardPractice
@@ -15397,19 +15253,16 @@ class StandardPractice(BSElement):
     pass
 
 
-StandardPractice.element_children = [
+StandardPractice.element_children = (
     ("StandardPracticeDescription", StandardPracticeDescription),
     ("CalculationMethod", CalculationMethod),
-]
+)
 
 
 # ScenarioType.ScenarioType.Benchmark.BenchmarkType
 class BenchmarkType(BSElement):
     """Source of energy data or building characteristics for benchmarking energy performance."""
 
-    class PortfolioManager(PortfolioManager):
-        pass
-
     class CBECS(CBECSType):
         pass
 
@@ -15417,17 +15270,18 @@ class BenchmarkType(BSElement):
         pass
 
 
-BenchmarkType.element_children = [
+BenchmarkType.PortfolioManager = PortfolioManager
+BenchmarkType.element_children = (
     ("PortfolioManager", BenchmarkType.PortfolioManager),
     ("CBECS", BenchmarkType.CBECS),
     ("CodeMinimum", CodeMinimum),
     ("StandardPractice", StandardPractice),
     ("Other", BenchmarkType.Other),
-]
-BenchmarkType.Other.element_children = [
+)
+BenchmarkType.Other.element_children = (
     ("OtherBenchmarkDescription", OtherBenchmarkDescription),
     ("CalculationMethod", CalculationMethod),
-]
+)
 
 
 # ScenarioType.ScenarioType.Benchmark
@@ -15435,13 +15289,13 @@ class Benchmark(BSElement):
     pass
 
 
-Benchmark.element_children = [
+Benchmark.element_children = (
     ("BenchmarkType", BenchmarkType),
     ("BenchmarkTool", BenchmarkTool),
     ("BenchmarkYear", BenchmarkYear),
     ("BenchmarkValue", BenchmarkValue),
     ("LinkedPremises", LinkedPremises),
-]
+)
 
 
 # MeasureType.MeasureSavingsAnalysis
@@ -15449,7 +15303,7 @@ class MeasureSavingsAnalysis(BSElement):
     """Energy and cost effectiveness data for an individual measure. In most cases, this data depends on the other measures included in the package, and should be entered at the package level under Scenarios."""
 
 
-MeasureSavingsAnalysis.element_children = [
+MeasureSavingsAnalysis.element_children = (
     ("MeasureRank", MeasureRank),
     ("ReferenceCase", ReferenceCase),
     ("CalculationMethod", CalculationMethod),
@@ -15476,7 +15330,7 @@ MeasureSavingsAnalysis.element_children = [
     ("SimplePayback", SimplePayback),
     ("NetPresentValue", NetPresentValue),
     ("InternalRateOfReturn", InternalRateOfReturn),
-]
+)
 
 
 # ScenarioType.ScenarioType.PackageOfMeasures.MeasureIDs.MeasureID
@@ -15484,12 +15338,8 @@ class MeasureID(BSElement):
     """ID number of measure."""
 
 
-MeasureID.element_attributes = [
-    "IDref",  # IDREF
-]
-MeasureID.element_children = [
-    ("MeasureSavingsAnalysis", MeasureSavingsAnalysis),
-]
+MeasureID.element_attributes = ("IDref",)  # IDREF
+MeasureID.element_children = (("MeasureSavingsAnalysis", MeasureSavingsAnalysis),)
 
 
 # ScenarioType.ScenarioType.PackageOfMeasures.MeasureIDs
@@ -15497,9 +15347,7 @@ class MeasureIDs(BSElement):
     """ID numbers for measures included in the package. Multiple items may be selected."""
 
 
-MeasureIDs.element_children = [
-    ("MeasureID", MeasureID),
-]
+MeasureIDs.element_children = (("MeasureID", MeasureID),)
 
 
 # ScenarioType.ScenarioType.PackageOfMeasures
@@ -15507,10 +15355,8 @@ class PackageOfMeasures(BSElement):
     pass
 
 
-PackageOfMeasures.element_attributes = [
-    "ID",  # ID
-]
-PackageOfMeasures.element_children = [
+PackageOfMeasures.element_attributes = _ID_ATTRS
+PackageOfMeasures.element_children = (
     ("ReferenceCase", ReferenceCase),
     ("MeasureIDs", MeasureIDs),
     ("CostCategory", CostCategory),
@@ -15550,7 +15396,7 @@ PackageOfMeasures.element_children = [
     ("AssetScore", AssetScore),
     ("ENERGYSTARScore", ENERGYSTARScore),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # ScenarioType.ResourceUses.ResourceUse
@@ -15563,10 +15409,8 @@ class UtilityType(BSElement):
     pass
 
 
-UtilityType.element_attributes = [
-    "ID",  # ID
-]
-UtilityType.element_children = [
+UtilityType.element_attributes = _ID_ATTRS
+UtilityType.element_children = (
     ("RateSchedules", RateSchedules),
     ("MeteringConfiguration", MeteringConfiguration),
     ("TypeOfResourceMeter", TypeOfResourceMeter),
@@ -15579,7 +15423,7 @@ UtilityType.element_children = [
     ("UtilityBillpayer", UtilityBillpayer),
     ("ElectricDistributionUtility", ElectricDistributionUtility),
     ("SourceSiteRatio", SourceSiteRatio),
-]
+)
 
 
 # ReportType.Utilities.Utility
@@ -15589,24 +15433,18 @@ class Utility(UtilityType):
 
 # HeatingPlantType
 class HeatingPlantType(BSElement):
-    class OtherCombination(OtherCombination):
-        pass
-
-    class NoHeating(NoHeating):
-        pass
-
-    class Unknown(Unknown):
-        pass
-
     class ControlSystemTypes(BSElement):
         """HeatingPlant equipment control strategies."""
 
 
-HeatingPlantType.element_attributes = [
+HeatingPlantType.OtherCombination = OtherCombination
+HeatingPlantType.NoHeating = NoHeating
+HeatingPlantType.Unknown = Unknown
+HeatingPlantType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-HeatingPlantType.element_children = [
+)
+HeatingPlantType.element_children = (
     ("Boiler", Boiler),
     ("DistrictHeating", DistrictHeating),
     ("SolarThermal", SolarThermal),
@@ -15620,10 +15458,10 @@ HeatingPlantType.element_children = [
     ("BuildingAutomationSystem", BuildingAutomationSystem),
     ("ControlSystemTypes", HeatingPlantType.ControlSystemTypes),
     ("UserDefinedFields", UserDefinedFields),
-]
-HeatingPlantType.ControlSystemTypes.element_children = [
+)
+HeatingPlantType.ControlSystemTypes.element_children = (
     ("ControlSystemType", ControlSystemType),
-]
+)
 
 
 # HVACSystemType.Plants.CoolingPlants.CoolingPlant
@@ -15636,9 +15474,7 @@ class CoolingPlants(BSElement):
     pass
 
 
-CoolingPlants.element_children = [
-    ("CoolingPlant", CoolingPlant),
-]
+CoolingPlants.element_children = (("CoolingPlant", CoolingPlant),)
 
 
 # HVACSystemType.Plants.CondenserPlants.CondenserPlant
@@ -15651,16 +15487,11 @@ class CondenserPlants(BSElement):
     pass
 
 
-CondenserPlants.element_children = [
-    ("CondenserPlant", CondenserPlant),
-]
+CondenserPlants.element_children = (("CondenserPlant", CondenserPlant),)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.HeatingSources.HeatingSource
 class HeatingSource(BSElement):
-    class OutputCapacity(OutputCapacity):
-        pass
-
     class Capacity(BSElement):
         """Output capacity of equipment."""
 
@@ -15673,11 +15504,12 @@ class HeatingSource(BSElement):
             """Control for HeatingSource."""
 
 
-HeatingSource.element_attributes = [
+HeatingSource.OutputCapacity = OutputCapacity
+HeatingSource.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-HeatingSource.element_children = [
+)
+HeatingSource.element_children = (
     ("HeatingSourceType", HeatingSourceType),
     ("HeatingMedium", HeatingMedium),
     ("AnnualHeatingEfficiencyValue", AnnualHeatingEfficiencyValue),
@@ -15700,10 +15532,8 @@ HeatingSource.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-HeatingSource.Controls.element_children = [
-    ("Control", HeatingSource.Controls.Control),
-]
+)
+HeatingSource.Controls.element_children = (("Control", HeatingSource.Controls.Control),)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.HeatingSources
@@ -15711,9 +15541,7 @@ class HeatingSources(BSElement):
     pass
 
 
-HeatingSources.element_children = [
-    ("HeatingSource", HeatingSource),
-]
+HeatingSources.element_children = (("HeatingSource", HeatingSource),)
 
 
 # FanBased
@@ -15726,14 +15554,14 @@ class CentralAirDistribution(BSElement):
     pass
 
 
-CentralAirDistribution.element_children = [
+CentralAirDistribution.element_children = (
     ("AirDeliveryType", AirDeliveryType),
     ("TerminalUnit", TerminalUnit),
     ("ReheatSource", ReheatSource),
     ("ReheatControlMethod", ReheatControlMethod),
     ("ReheatPlantID", ReheatPlantID),
     ("FanBased", FanBased),
-]
+)
 
 
 # DuctSystemType
@@ -15741,11 +15569,11 @@ class DuctSystemType(BSElement):
     pass
 
 
-DuctSystemType.element_attributes = [
+DuctSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-DuctSystemType.element_children = [
+)
+DuctSystemType.element_children = (
     ("DuctConfiguration", DuctConfiguration),
     ("MinimumOutsideAirPercentage", MinimumOutsideAirPercentage),
     ("MaximumOAFlowRate", MaximumOAFlowRate),
@@ -15773,7 +15601,7 @@ DuctSystemType.element_children = [
     ("LinkedPremises", LinkedPremises),
     ("UserDefinedFields", UserDefinedFields),
     ("EquipmentID", EquipmentID),
-]
+)
 
 
 # DomesticHotWaterSystemType.DomesticHotWaterType
@@ -15783,17 +15611,15 @@ class DomesticHotWaterType(BSElement):
     class Other(OtherType):
         pass
 
-    class Unknown(Unknown):
-        pass
-
 
-DomesticHotWaterType.element_children = [
+DomesticHotWaterType.Unknown = Unknown
+DomesticHotWaterType.element_children = (
     ("StorageTank", StorageTank),
     ("Instantaneous", Instantaneous),
     ("HeatExchanger", HeatExchanger),
     ("Other", DomesticHotWaterType.Other),
     ("Unknown", DomesticHotWaterType.Unknown),
-]
+)
 
 
 # PoolType.Heated
@@ -15807,15 +15633,13 @@ class Heated(BSElement):
             """Heated pool control."""
 
 
-Heated.element_children = [
+Heated.element_children = (
     ("PrimaryFuel", PrimaryFuel),
     ("WaterTemperature", WaterTemperature),
     ("HoursUncovered", HoursUncovered),
     ("Controls", Heated.Controls),
-]
-Heated.Controls.element_children = [
-    ("Control", Heated.Controls.Control),
-]
+)
+Heated.Controls.element_children = (("Control", Heated.Controls.Control),)
 
 
 # DerivedModelType.Models
@@ -15823,9 +15647,7 @@ class Models(BSElement):
     pass
 
 
-Models.element_children = [
-    ("Model", Model),
-]
+Models.element_children = (("Model", Model),)
 
 
 # DerivedModelType.SavingsSummaries
@@ -15833,9 +15655,7 @@ class SavingsSummaries(BSElement):
     pass
 
 
-SavingsSummaries.element_children = [
-    ("SavingsSummary", SavingsSummary),
-]
+SavingsSummaries.element_children = (("SavingsSummary", SavingsSummary),)
 
 
 # DomesticHotWaterSystemType
@@ -15847,11 +15667,11 @@ class DomesticHotWaterSystemType(BSElement):
             """Domestic hot water control."""
 
 
-DomesticHotWaterSystemType.element_attributes = [
+DomesticHotWaterSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-DomesticHotWaterSystemType.element_children = [
+)
+DomesticHotWaterSystemType.element_children = (
     ("DomesticHotWaterType", DomesticHotWaterType),
     ("DomesticHotWaterSystemNotes", DomesticHotWaterSystemNotes),
     ("Recirculation", Recirculation),
@@ -15876,10 +15696,10 @@ DomesticHotWaterSystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-DomesticHotWaterSystemType.Controls.element_children = [
+)
+DomesticHotWaterSystemType.Controls.element_children = (
     ("Control", DomesticHotWaterSystemType.Controls.Control),
-]
+)
 
 
 # CookingSystemType
@@ -15887,11 +15707,11 @@ class CookingSystemType(BSElement):
     pass
 
 
-CookingSystemType.element_attributes = [
+CookingSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-CookingSystemType.element_children = [
+)
+CookingSystemType.element_children = (
     ("TypeOfCookingEquipment", TypeOfCookingEquipment),
     ("NumberOfMeals", NumberOfMeals),
     ("CookingEnergyPerMeal", CookingEnergyPerMeal),
@@ -15909,7 +15729,7 @@ CookingSystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
+)
 
 
 # RefrigerationSystemType
@@ -15917,11 +15737,11 @@ class RefrigerationSystemType(BSElement):
     pass
 
 
-RefrigerationSystemType.element_attributes = [
+RefrigerationSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-RefrigerationSystemType.element_children = [
+)
+RefrigerationSystemType.element_children = (
     ("RefrigerationSystemCategory", RefrigerationSystemCategory),
     ("ThirdPartyCertification", ThirdPartyCertification),
     ("YearInstalled", YearInstalled),
@@ -15934,7 +15754,7 @@ RefrigerationSystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
+)
 
 
 # DishwasherSystemType
@@ -15946,11 +15766,11 @@ class DishwasherSystemType(BSElement):
             """Dishwasher control."""
 
 
-DishwasherSystemType.element_attributes = [
+DishwasherSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-DishwasherSystemType.element_children = [
+)
+DishwasherSystemType.element_children = (
     ("DishwasherMachineType", DishwasherMachineType),
     ("DishwasherConfiguration", DishwasherConfiguration),
     ("DishwasherClassification", DishwasherClassification),
@@ -15969,10 +15789,10 @@ DishwasherSystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-DishwasherSystemType.Controls.element_children = [
+)
+DishwasherSystemType.Controls.element_children = (
     ("Control", DishwasherSystemType.Controls.Control),
-]
+)
 
 
 # LaundrySystemType
@@ -15984,11 +15804,11 @@ class LaundrySystemType(BSElement):
             """LaundrySystem control."""
 
 
-LaundrySystemType.element_attributes = [
+LaundrySystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-LaundrySystemType.element_children = [
+)
+LaundrySystemType.element_children = (
     ("LaundryType", LaundryType),
     ("QuantityOfLaundry", QuantityOfLaundry),
     ("LaundryEquipmentUsage", LaundryEquipmentUsage),
@@ -16004,10 +15824,10 @@ LaundrySystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-LaundrySystemType.Controls.element_children = [
+)
+LaundrySystemType.Controls.element_children = (
     ("Control", LaundrySystemType.Controls.Control),
-]
+)
 
 
 # PumpSystemType
@@ -16019,11 +15839,11 @@ class PumpSystemType(BSElement):
             """Pump system control."""
 
 
-PumpSystemType.element_attributes = [
+PumpSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-PumpSystemType.element_children = [
+)
+PumpSystemType.element_children = (
     ("PumpEfficiency", PumpEfficiency),
     ("PumpMaximumFlowRate", PumpMaximumFlowRate),
     ("PumpMinimumFlowRate", PumpMinimumFlowRate),
@@ -16045,10 +15865,10 @@ PumpSystemType.element_children = [
     ("LinkedSystemIDs", LinkedSystemIDs),
     ("UserDefinedFields", UserDefinedFields),
     ("EquipmentID", EquipmentID),
-]
-PumpSystemType.Controls.element_children = [
+)
+PumpSystemType.Controls.element_children = (
     ("Control", PumpSystemType.Controls.Control),
-]
+)
 
 
 # FanSystemType
@@ -16060,11 +15880,11 @@ class FanSystemType(BSElement):
             """FanSystem control."""
 
 
-FanSystemType.element_attributes = [
+FanSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-FanSystemType.element_children = [
+)
+FanSystemType.element_children = (
     ("FanEfficiency", FanEfficiency),
     ("FanSize", FanSize),
     ("InstalledFlowRate", InstalledFlowRate),
@@ -16094,10 +15914,8 @@ FanSystemType.element_children = [
     ("LinkedSystemIDs", LinkedSystemIDs),
     ("UserDefinedFields", UserDefinedFields),
     ("EquipmentID", EquipmentID),
-]
-FanSystemType.Controls.element_children = [
-    ("Control", FanSystemType.Controls.Control),
-]
+)
+FanSystemType.Controls.element_children = (("Control", FanSystemType.Controls.Control),)
 
 
 # MotorSystemType
@@ -16109,11 +15927,11 @@ class MotorSystemType(BSElement):
             """MotorSystem control."""
 
 
-MotorSystemType.element_attributes = [
+MotorSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-MotorSystemType.element_children = [
+)
+MotorSystemType.element_children = (
     ("MotorRPM", MotorRPM),
     ("MotorBrakeHP", MotorBrakeHP),
     ("MotorHP", MotorHP),
@@ -16136,10 +15954,10 @@ MotorSystemType.element_children = [
     ("LinkedSystemIDs", LinkedSystemIDs),
     ("UserDefinedFields", UserDefinedFields),
     ("EquipmentID", EquipmentID),
-]
-MotorSystemType.Controls.element_children = [
+)
+MotorSystemType.Controls.element_children = (
     ("Control", MotorSystemType.Controls.Control),
-]
+)
 
 
 # HeatRecoverySystemType
@@ -16151,11 +15969,11 @@ class HeatRecoverySystemType(BSElement):
             """Heat recovery system control."""
 
 
-HeatRecoverySystemType.element_attributes = [
+HeatRecoverySystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-HeatRecoverySystemType.element_children = [
+)
+HeatRecoverySystemType.element_children = (
     ("HeatRecoveryEfficiency", HeatRecoveryEfficiency),
     ("EnergyRecoveryEfficiency", EnergyRecoveryEfficiency),
     ("HeatRecoveryType", HeatRecoveryType),
@@ -16171,10 +15989,10 @@ HeatRecoverySystemType.element_children = [
     ("Location", Location),
     ("UserDefinedFields", UserDefinedFields),
     ("EquipmentID", EquipmentID),
-]
-HeatRecoverySystemType.Controls.element_children = [
+)
+HeatRecoverySystemType.Controls.element_children = (
     ("Control", HeatRecoverySystemType.Controls.Control),
-]
+)
 
 
 # CriticalITSystemType
@@ -16186,11 +16004,11 @@ class CriticalITSystemType(BSElement):
             """Critical IT system control."""
 
 
-CriticalITSystemType.element_attributes = [
+CriticalITSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-CriticalITSystemType.element_children = [
+)
+CriticalITSystemType.element_children = (
     ("ITSystemType", ITSystemType),
     ("ITPeakPower", ITPeakPower),
     ("ITStandbyPower", ITStandbyPower),
@@ -16207,10 +16025,10 @@ CriticalITSystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-CriticalITSystemType.Controls.element_children = [
+)
+CriticalITSystemType.Controls.element_children = (
     ("Control", CriticalITSystemType.Controls.Control),
-]
+)
 
 
 # PlugElectricLoadType
@@ -16222,12 +16040,12 @@ class PlugElectricLoadType(BSElement):
             """Plug load control."""
 
 
-PlugElectricLoadType.element_attributes = [
+PlugElectricLoadType.element_attributes = (
     "ID",  # ID
     "Source",  # Source
     "Status",  # Status
-]
-PlugElectricLoadType.element_children = [
+)
+PlugElectricLoadType.element_children = (
     ("PlugLoadType", PlugLoadType),
     ("PlugLoadPeakPower", PlugLoadPeakPower),
     ("PlugLoadStandbyPower", PlugLoadStandbyPower),
@@ -16245,10 +16063,10 @@ PlugElectricLoadType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-PlugElectricLoadType.Controls.element_children = [
+)
+PlugElectricLoadType.Controls.element_children = (
     ("Control", PlugElectricLoadType.Controls.Control),
-]
+)
 
 
 # ProcessGasElectricLoadType
@@ -16260,12 +16078,12 @@ class ProcessGasElectricLoadType(BSElement):
             """Process load control."""
 
 
-ProcessGasElectricLoadType.element_attributes = [
+ProcessGasElectricLoadType.element_attributes = (
     "ID",  # ID
     "Source",  # Source
     "Status",  # Status
-]
-ProcessGasElectricLoadType.element_children = [
+)
+ProcessGasElectricLoadType.element_children = (
     ("ProcessLoadType", ProcessLoadType),
     ("ProcessLoadPeakPower", ProcessLoadPeakPower),
     ("ProcessLoadStandbyPower", ProcessLoadStandbyPower),
@@ -16284,10 +16102,10 @@ ProcessGasElectricLoadType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-ProcessGasElectricLoadType.Controls.element_children = [
+)
+ProcessGasElectricLoadType.Controls.element_children = (
     ("Control", ProcessGasElectricLoadType.Controls.Control),
-]
+)
 
 
 # ConveyanceSystemType
@@ -16296,14 +16114,14 @@ class ConveyanceSystemType(BSElement):
         """Type of vertical or horizontal transportation equipment that moves people or goods between levels, floors, or sections."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Escalator",
             "Elevator",
             "Conveyor Belt",
             "Overhead Conveyor",
             "Other",
             "Unknown",
-        ]
+        )
 
     class Controls(BSElement):
         """List of conveyance system controls."""
@@ -16312,11 +16130,11 @@ class ConveyanceSystemType(BSElement):
             """Conveyance system control."""
 
 
-ConveyanceSystemType.element_attributes = [
+ConveyanceSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-ConveyanceSystemType.element_children = [
+)
+ConveyanceSystemType.element_children = (
     ("ConveyanceSystemType", ConveyanceSystemType.ConveyanceSystemType),
     ("ConveyanceLoadType", ConveyanceLoadType),
     ("ConveyancePeakPower", ConveyancePeakPower),
@@ -16334,10 +16152,10 @@ ConveyanceSystemType.element_children = [
     ("LinkedPremises", LinkedPremises),
     ("UserDefinedFields", UserDefinedFields),
     ("EquipmentID", EquipmentID),
-]
-ConveyanceSystemType.Controls.element_children = [
+)
+ConveyanceSystemType.Controls.element_children = (
     ("Control", ConveyanceSystemType.Controls.Control),
-]
+)
 
 
 # OnsiteStorageTransmissionGenerationSystemType
@@ -16349,11 +16167,11 @@ class OnsiteStorageTransmissionGenerationSystemType(BSElement):
             """Onsite storage transmission control."""
 
 
-OnsiteStorageTransmissionGenerationSystemType.element_attributes = [
+OnsiteStorageTransmissionGenerationSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-OnsiteStorageTransmissionGenerationSystemType.element_children = [
+)
+OnsiteStorageTransmissionGenerationSystemType.element_children = (
     ("AverageAnnualOperatingHours", AverageAnnualOperatingHours),
     ("EnergyConversionType", EnergyConversionType),
     ("BackupGenerator", BackupGenerator),
@@ -16371,10 +16189,10 @@ OnsiteStorageTransmissionGenerationSystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-OnsiteStorageTransmissionGenerationSystemType.Controls.element_children = [
+)
+OnsiteStorageTransmissionGenerationSystemType.Controls.element_children = (
     ("Control", OnsiteStorageTransmissionGenerationSystemType.Controls.Control),
-]
+)
 
 
 # PoolType
@@ -16383,14 +16201,14 @@ class PoolType(BSElement):
         """General category of the pool."""
 
         element_type = "xs:string"
-        element_enumerations = ["Hot Tub", "Pool", "Other", "Unknown"]
+        element_enumerations = ("Hot Tub", "Pool", "Other", "Unknown")
 
 
-PoolType.element_attributes = [
+PoolType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-PoolType.element_children = [
+)
+PoolType.element_children = (
     ("PoolType", PoolType.PoolType),
     ("PoolSizeCategory", PoolSizeCategory),
     ("PoolArea", PoolArea),
@@ -16406,7 +16224,7 @@ PoolType.element_children = [
     ("LinkedPremises", LinkedPremises),
     ("UserDefinedFields", UserDefinedFields),
     ("EquipmentID", EquipmentID),
-]
+)
 
 
 # WaterUseType
@@ -16415,7 +16233,7 @@ class WaterUseType(BSElement):
         """Short description of the water fixture or application."""
 
         element_type = "xs:string"
-        element_enumerations = [
+        element_enumerations = (
             "Restroom Sink Use",
             "Restroom Toilet/Urinal Water Use",
             "Kitchen Water Use",
@@ -16438,7 +16256,7 @@ class WaterUseType(BSElement):
             "Stormwater Discharge",
             "Other",
             "Unknown",
-        ]
+        )
 
     class Controls(BSElement):
         """List of controls for water use system."""
@@ -16447,11 +16265,11 @@ class WaterUseType(BSElement):
             """Control for water use."""
 
 
-WaterUseType.element_attributes = [
+WaterUseType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-WaterUseType.element_children = [
+)
+WaterUseType.element_children = (
     ("WaterUseType", WaterUseType.WaterUseType),
     ("WaterResource", WaterResource),
     ("LowFlowFixtures", LowFlowFixtures),
@@ -16470,10 +16288,8 @@ WaterUseType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-WaterUseType.Controls.element_children = [
-    ("Control", WaterUseType.Controls.Control),
-]
+)
+WaterUseType.Controls.element_children = (("Control", WaterUseType.Controls.Control),)
 
 
 # BuildingSync.Facilities.Facility.Systems.AirInfiltrationSystems.AirInfiltrationSystem
@@ -16484,10 +16300,8 @@ class AirInfiltrationSystem(BSElement):
         """Description of the infiltration characteristics for an opaque surface, fenestration unit, a thermal zone."""
 
 
-AirInfiltrationSystem.element_attributes = [
-    "ID",  # ID
-]
-AirInfiltrationSystem.element_children = [
+AirInfiltrationSystem.element_attributes = _ID_ATTRS
+AirInfiltrationSystem.element_children = (
     ("AirInfiltrationNotes", AirInfiltrationNotes),
     ("Tightness", AirInfiltrationSystem.Tightness),
     ("AirInfiltrationValue", AirInfiltrationValue),
@@ -16495,7 +16309,7 @@ AirInfiltrationSystem.element_children = [
     ("AirInfiltrationTest", AirInfiltrationTest),
     ("LinkedPremises", LinkedPremises),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # BuildingSync.Facilities.Facility.Systems.AirInfiltrationSystems
@@ -16503,9 +16317,9 @@ class AirInfiltrationSystems(BSElement):
     pass
 
 
-AirInfiltrationSystems.element_children = [
+AirInfiltrationSystems.element_children = (
     ("AirInfiltrationSystem", AirInfiltrationSystem),
-]
+)
 
 
 # BuildingSync.Facilities.Facility.Schedules.Schedule
@@ -16518,9 +16332,7 @@ class Schedules(BSElement):
     pass
 
 
-Schedules.element_children = [
-    ("Schedule", Schedule),
-]
+Schedules.element_children = (("Schedule", Schedule),)
 
 
 # MeasureType
@@ -16528,10 +16340,8 @@ class MeasureType(BSElement):
     pass
 
 
-MeasureType.element_attributes = [
-    "ID",  # ID
-]
-MeasureType.element_children = [
+MeasureType.element_attributes = _ID_ATTRS
+MeasureType.element_children = (
     ("TypeOfMeasure", TypeOfMeasure),
     ("SystemCategoryAffected", SystemCategoryAffected),
     ("LinkedPremises", LinkedPremises),
@@ -16554,7 +16364,7 @@ MeasureType.element_children = [
     ("ImplementationStatus", ImplementationStatus),
     ("DiscardReason", DiscardReason),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # ThermalZoneType
@@ -16562,10 +16372,8 @@ class ThermalZoneType(BSElement):
     pass
 
 
-ThermalZoneType.element_attributes = [
-    "ID",  # ID
-]
-ThermalZoneType.element_children = [
+ThermalZoneType.element_attributes = _ID_ATTRS
+ThermalZoneType.element_children = (
     ("PremisesName", PremisesName),
     ("DeliveryIDs", DeliveryIDs),
     ("HVACScheduleIDs", HVACScheduleIDs),
@@ -16577,7 +16385,7 @@ ThermalZoneType.element_children = [
     ("ACAdjusted", ACAdjusted),
     ("Spaces", Spaces),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # ScenarioType.ResourceUses
@@ -16585,9 +16393,7 @@ class ResourceUses(BSElement):
     pass
 
 
-ResourceUses.element_children = [
-    ("ResourceUse", ResourceUse),
-]
+ResourceUses.element_children = (("ResourceUse", ResourceUse),)
 
 
 # ScenarioType.ScenarioType.CurrentBuilding
@@ -16595,11 +16401,11 @@ class CurrentBuilding(BSElement):
     pass
 
 
-CurrentBuilding.element_children = [
+CurrentBuilding.element_children = (
     ("CalculationMethod", CalculationMethod),
     ("AssetScore", AssetScore),
     ("ENERGYSTARScore", ENERGYSTARScore),
-]
+)
 
 
 # DerivedModelType
@@ -16607,16 +16413,14 @@ class DerivedModelType(BSElement):
     """A derived model represents a supervised or unsupervised learning model derived from data presented in a scenario."""
 
 
-DerivedModelType.element_attributes = [
-    "ID",  # ID
-]
-DerivedModelType.element_children = [
+DerivedModelType.element_attributes = _ID_ATTRS
+DerivedModelType.element_children = (
     ("DerivedModelName", DerivedModelName),
     ("MeasuredScenarioID", MeasuredScenarioID),
     ("Models", Models),
     ("SavingsSummaries", SavingsSummaries),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # ReportType.Utilities
@@ -16624,9 +16428,7 @@ class Utilities(BSElement):
     pass
 
 
-Utilities.element_children = [
-    ("Utility", Utility),
-]
+Utilities.element_children = (("Utility", Utility),)
 
 
 # HVACSystemType.Plants.HeatingPlants.HeatingPlant
@@ -16639,9 +16441,7 @@ class HeatingPlants(BSElement):
     pass
 
 
-HeatingPlants.element_children = [
-    ("HeatingPlant", HeatingPlant),
-]
+HeatingPlants.element_children = (("HeatingPlant", HeatingPlant),)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType.ZoneEquipment
@@ -16652,12 +16452,12 @@ class ZoneEquipment(BSElement):
         pass
 
 
-ZoneEquipment.element_children = [
+ZoneEquipment.element_children = (
     ("FanBased", FanBased),
     ("Convection", Convection),
     ("Radiant", Radiant),
     ("Other", ZoneEquipment.Other),
-]
+)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery.DeliveryType
@@ -16666,11 +16466,11 @@ class DeliveryType(BSElement):
         pass
 
 
-DeliveryType.element_children = [
+DeliveryType.element_children = (
     ("ZoneEquipment", ZoneEquipment),
     ("CentralAirDistribution", CentralAirDistribution),
     ("Other", DeliveryType.Other),
-]
+)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries.Delivery
@@ -16682,11 +16482,11 @@ class Delivery(BSElement):
             """DeliverySystem control."""
 
 
-Delivery.element_attributes = [
+Delivery.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-Delivery.element_children = [
+)
+Delivery.element_children = (
     ("DeliveryType", DeliveryType),
     ("HeatingSourceID", HeatingSourceID),
     ("CoolingSourceID", CoolingSourceID),
@@ -16702,10 +16502,8 @@ Delivery.element_children = [
     ("Quantity", Quantity),
     ("DeliveryCondition", DeliveryCondition),
     ("EquipmentID", EquipmentID),
-]
-Delivery.Controls.element_children = [
-    ("Control", Delivery.Controls.Control),
-]
+)
+Delivery.Controls.element_children = (("Control", Delivery.Controls.Control),)
 
 
 # HVACSystemType.HeatingAndCoolingSystems.Deliveries
@@ -16713,9 +16511,7 @@ class Deliveries(BSElement):
     pass
 
 
-Deliveries.element_children = [
-    ("Delivery", Delivery),
-]
+Deliveries.element_children = (("Delivery", Delivery),)
 
 
 # HVACSystemType.DuctSystems.DuctSystem
@@ -16732,11 +16528,11 @@ class OtherHVACSystemType(BSElement):
             """Other HVAC system control."""
 
 
-OtherHVACSystemType.element_attributes = [
+OtherHVACSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-OtherHVACSystemType.element_children = [
+)
+OtherHVACSystemType.element_children = (
     ("OtherHVACType", OtherHVACType),
     ("Location", Location),
     ("PrimaryFuel", PrimaryFuel),
@@ -16752,10 +16548,10 @@ OtherHVACSystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-OtherHVACSystemType.Controls.element_children = [
+)
+OtherHVACSystemType.Controls.element_children = (
     ("Control", OtherHVACSystemType.Controls.Control),
-]
+)
 
 
 # LightingSystemType
@@ -16767,11 +16563,11 @@ class LightingSystemType(BSElement):
             """Type of system operation control."""
 
 
-LightingSystemType.element_attributes = [
+LightingSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-LightingSystemType.element_children = [
+)
+LightingSystemType.element_children = (
     ("LampType", LampType),
     ("BallastType", BallastType),
     ("InputVoltage", InputVoltage),
@@ -16805,10 +16601,10 @@ LightingSystemType.element_children = [
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
     ("EquipmentID", EquipmentID),
-]
-LightingSystemType.Controls.element_children = [
+)
+LightingSystemType.Controls.element_children = (
     ("Control", LightingSystemType.Controls.Control),
-]
+)
 
 
 # PrincipalLightingSystemType
@@ -16816,7 +16612,7 @@ class PrincipalLightingSystemType(BSElement):
     """Principal Lighting type for a building or a section. The usage of this element is not recommended except for Audit Template use cases."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Incandescent",
         "Linear Fluorescent",
         "Compact Fluorescent",
@@ -16840,7 +16636,7 @@ class PrincipalLightingSystemType(BSElement):
         "Self Luminous",
         "Other",
         "Unknown",
-    ]
+    )
 
 
 # BuildingSync.Facilities.Facility.Systems.DomesticHotWaterSystems.DomesticHotWaterSystem
@@ -16853,9 +16649,9 @@ class DomesticHotWaterSystems(BSElement):
     pass
 
 
-DomesticHotWaterSystems.element_children = [
+DomesticHotWaterSystems.element_children = (
     ("DomesticHotWaterSystem", DomesticHotWaterSystem),
-]
+)
 
 
 # BuildingSync.Facilities.Facility.Systems.CookingSystems.CookingSystem
@@ -16868,9 +16664,7 @@ class CookingSystems(BSElement):
     pass
 
 
-CookingSystems.element_children = [
-    ("CookingSystem", CookingSystem),
-]
+CookingSystems.element_children = (("CookingSystem", CookingSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.RefrigerationSystems.RefrigerationSystem
@@ -16883,9 +16677,7 @@ class RefrigerationSystems(BSElement):
     pass
 
 
-RefrigerationSystems.element_children = [
-    ("RefrigerationSystem", RefrigerationSystem),
-]
+RefrigerationSystems.element_children = (("RefrigerationSystem", RefrigerationSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.DishwasherSystems.DishwasherSystem
@@ -16898,9 +16690,7 @@ class DishwasherSystems(BSElement):
     pass
 
 
-DishwasherSystems.element_children = [
-    ("DishwasherSystem", DishwasherSystem),
-]
+DishwasherSystems.element_children = (("DishwasherSystem", DishwasherSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.LaundrySystems.LaundrySystem
@@ -16913,9 +16703,7 @@ class LaundrySystems(BSElement):
     pass
 
 
-LaundrySystems.element_children = [
-    ("LaundrySystem", LaundrySystem),
-]
+LaundrySystems.element_children = (("LaundrySystem", LaundrySystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.PumpSystems.PumpSystem
@@ -16928,9 +16716,7 @@ class PumpSystems(BSElement):
     pass
 
 
-PumpSystems.element_children = [
-    ("PumpSystem", PumpSystem),
-]
+PumpSystems.element_children = (("PumpSystem", PumpSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.FanSystems.FanSystem
@@ -16943,9 +16729,7 @@ class FanSystems(BSElement):
     pass
 
 
-FanSystems.element_children = [
-    ("FanSystem", FanSystem),
-]
+FanSystems.element_children = (("FanSystem", FanSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.MotorSystems.MotorSystem
@@ -16958,9 +16742,7 @@ class MotorSystems(BSElement):
     pass
 
 
-MotorSystems.element_children = [
-    ("MotorSystem", MotorSystem),
-]
+MotorSystems.element_children = (("MotorSystem", MotorSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.HeatRecoverySystems.HeatRecoverySystem
@@ -16973,9 +16755,7 @@ class HeatRecoverySystems(BSElement):
     pass
 
 
-HeatRecoverySystems.element_children = [
-    ("HeatRecoverySystem", HeatRecoverySystem),
-]
+HeatRecoverySystems.element_children = (("HeatRecoverySystem", HeatRecoverySystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.CriticalITSystems.CriticalITSystem
@@ -16988,9 +16768,7 @@ class CriticalITSystems(BSElement):
     pass
 
 
-CriticalITSystems.element_children = [
-    ("CriticalITSystem", CriticalITSystem),
-]
+CriticalITSystems.element_children = (("CriticalITSystem", CriticalITSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems.PlugLoads.PlugLoad
@@ -17003,9 +16781,7 @@ class PlugLoads(BSElement):
     pass
 
 
-PlugLoads.element_children = [
-    ("PlugLoad", PlugLoad),
-]
+PlugLoads.element_children = (("PlugLoad", PlugLoad),)
 
 
 # BuildingSync.Facilities.Facility.Systems.ProcessLoads.ProcessLoad
@@ -17018,9 +16794,7 @@ class ProcessLoads(BSElement):
     pass
 
 
-ProcessLoads.element_children = [
-    ("ProcessLoad", ProcessLoad),
-]
+ProcessLoads.element_children = (("ProcessLoad", ProcessLoad),)
 
 
 # BuildingSync.Facilities.Facility.Systems.ConveyanceSystems.ConveyanceSystem
@@ -17040,12 +16814,12 @@ class OnsiteStorageTransmissionGenerationSystems(BSElement):
     pass
 
 
-OnsiteStorageTransmissionGenerationSystems.element_children = [
+OnsiteStorageTransmissionGenerationSystems.element_children = (
     (
         "OnsiteStorageTransmissionGenerationSystem",
         OnsiteStorageTransmissionGenerationSystem,
     ),
-]
+)
 
 
 # BuildingSync.Facilities.Facility.Systems.Pools.Pool
@@ -17058,9 +16832,7 @@ class Pools(BSElement):
     pass
 
 
-Pools.element_children = [
-    ("Pool", Pool),
-]
+Pools.element_children = (("Pool", Pool),)
 
 
 # BuildingSync.Facilities.Facility.Systems.WaterUses
@@ -17069,9 +16841,7 @@ class WaterUses(BSElement):
         pass
 
 
-WaterUses.element_children = [
-    ("WaterUse", WaterUses.WaterUse),
-]
+WaterUses.element_children = (("WaterUse", WaterUses.WaterUse),)
 
 
 # BuildingSync.Facilities.Facility.Measures.Measure
@@ -17084,9 +16854,7 @@ class Measures(BSElement):
     pass
 
 
-Measures.element_children = [
-    ("Measure", Measure),
-]
+Measures.element_children = (("Measure", Measure),)
 
 
 # BuildingType.Sections.Section.ThermalZones
@@ -17097,9 +16865,7 @@ class ThermalZones(BSElement):
         pass
 
 
-ThermalZones.element_children = [
-    ("ThermalZone", ThermalZones.ThermalZone),
-]
+ThermalZones.element_children = (("ThermalZone", ThermalZones.ThermalZone),)
 
 
 # ScenarioType.ScenarioType.DerivedModel
@@ -17112,11 +16878,11 @@ class Plants(BSElement):
     pass
 
 
-Plants.element_children = [
+Plants.element_children = (
     ("HeatingPlants", HeatingPlants),
     ("CoolingPlants", CoolingPlants),
     ("CondenserPlants", CondenserPlants),
-]
+)
 
 
 # HVACSystemType.HeatingAndCoolingSystems
@@ -17124,12 +16890,12 @@ class HeatingAndCoolingSystems(BSElement):
     pass
 
 
-HeatingAndCoolingSystems.element_children = [
+HeatingAndCoolingSystems.element_children = (
     ("ZoningSystemType", ZoningSystemType),
     ("HeatingSources", HeatingSources),
     ("CoolingSources", CoolingSources),
     ("Deliveries", Deliveries),
-]
+)
 
 
 # HVACSystemType.DuctSystems
@@ -17137,9 +16903,7 @@ class DuctSystems(BSElement):
     pass
 
 
-DuctSystems.element_children = [
-    ("DuctSystem", DuctSystem),
-]
+DuctSystems.element_children = (("DuctSystem", DuctSystem),)
 
 
 # HVACSystemType.OtherHVACSystems.OtherHVACSystem
@@ -17157,9 +16921,7 @@ class LightingSystems(BSElement):
     pass
 
 
-LightingSystems.element_children = [
-    ("LightingSystem", LightingSystem),
-]
+LightingSystems.element_children = (("LightingSystem", LightingSystem),)
 
 
 # BuildingType.Sections
@@ -17168,13 +16930,9 @@ class Sections(BSElement):
         """Physical section of building for which features are defined. May be one or many."""
 
 
-Sections.element_children = [
-    ("Section", Sections.Section),
-]
-Sections.Section.element_attributes = [
-    "ID",  # ID
-]
-Sections.Section.element_children = [
+Sections.element_children = (("Section", Sections.Section),)
+Sections.Section.element_attributes = _ID_ATTRS
+Sections.Section.element_children = (
     ("PremisesName", PremisesName),
     ("SectionType", SectionType),
     ("PremisesNotes", PremisesNotes),
@@ -17211,7 +16969,7 @@ Sections.Section.element_children = [
     ("FloorToCeilingHeight", FloorToCeilingHeight),
     ("UserDefinedFields", UserDefinedFields),
     ("ThermalZones", ThermalZones),
-]
+)
 
 
 # HVACSystemType.OtherHVACSystems
@@ -17219,9 +16977,7 @@ class OtherHVACSystems(BSElement):
     pass
 
 
-OtherHVACSystems.element_children = [
-    ("OtherHVACSystem", OtherHVACSystem),
-]
+OtherHVACSystems.element_children = (("OtherHVACSystem", OtherHVACSystem),)
 
 
 # HVACSystemType
@@ -17229,11 +16985,11 @@ class HVACSystemType(BSElement):
     pass
 
 
-HVACSystemType.element_attributes = [
+HVACSystemType.element_attributes = (
     "ID",  # ID
     "Status",  # Status
-]
-HVACSystemType.element_children = [
+)
+HVACSystemType.element_children = (
     ("Plants", Plants),
     ("HeatingAndCoolingSystems", HeatingAndCoolingSystems),
     ("DuctSystems", DuctSystems),
@@ -17247,34 +17003,22 @@ HVACSystemType.element_children = [
     ("LinkedPremises", LinkedPremises),
     ("UserDefinedFields", UserDefinedFields),
     ("Quantity", Quantity),
-]
+)
 
 
 # BuildingType
 class BuildingType(BSElement):
-    class eGRIDRegionCode(eGRIDRegionCode):
-        pass
-
-    class eGRIDSubregionCodes(eGRIDSubregionCodes):
-        pass
-
-    class WeatherDataStationID(WeatherDataStationID):
-        pass
-
-    class WeatherStationName(WeatherStationName):
-        pass
-
-    class WeatherStationCategory(WeatherStationCategory):
-        pass
-
-    class WeatherStations(WeatherStations):
-        pass
+    pass
 
 
-BuildingType.element_attributes = [
-    "ID",  # ID
-]
-BuildingType.element_children = [
+BuildingType.eGRIDRegionCode = eGRIDRegionCode
+BuildingType.eGRIDSubregionCodes = eGRIDSubregionCodes
+BuildingType.WeatherDataStationID = WeatherDataStationID
+BuildingType.WeatherStationName = WeatherStationName
+BuildingType.WeatherStationCategory = WeatherStationCategory
+BuildingType.WeatherStations = WeatherStations
+BuildingType.element_attributes = _ID_ATTRS
+BuildingType.element_children = (
     ("PremisesName", PremisesName),
     ("PremisesNotes", PremisesNotes),
     ("PremisesIdentifiers", PremisesIdentifiers),
@@ -17341,7 +17085,7 @@ BuildingType.element_children = [
     ("OperatorType", OperatorType),
     ("Sections", Sections),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # ScenarioType
@@ -17353,10 +17097,8 @@ class ScenarioType(BSElement):
         """Type of scenario for which energy use is presented."""
 
 
-ScenarioType.element_attributes = [
-    "ID",  # ID
-]
-ScenarioType.element_children = [
+ScenarioType.element_attributes = _ID_ATTRS
+ScenarioType.element_children = (
     ("ScenarioName", ScenarioName),
     ("ScenarioNotes", ScenarioNotes),
     ("TemporalStatus", TemporalStatus),
@@ -17372,8 +17114,8 @@ ScenarioType.element_children = [
     ("CDDBaseTemperature", CDDBaseTemperature),
     ("LinkedPremises", LinkedPremises),
     ("UserDefinedFields", UserDefinedFields),
-]
-ScenarioType.Other.element_children = [
+)
+ScenarioType.Other.element_children = (
     ("ReferenceCase", ReferenceCase),
     ("AnnualSavingsSiteEnergy", AnnualSavingsSiteEnergy),
     ("AnnualSavingsSourceEnergy", AnnualSavingsSourceEnergy),
@@ -17391,15 +17133,15 @@ ScenarioType.Other.element_children = [
     ("InternalRateOfReturn", InternalRateOfReturn),
     ("AssetScore", AssetScore),
     ("ENERGYSTARScore", ENERGYSTARScore),
-]
-ScenarioType.ScenarioType.element_children = [
+)
+ScenarioType.ScenarioType.element_children = (
     ("CurrentBuilding", CurrentBuilding),
     ("Benchmark", Benchmark),
     ("Target", Target),
     ("PackageOfMeasures", PackageOfMeasures),
     ("DerivedModel", DerivedModel),
     ("Other", ScenarioType.Other),
-]
+)
 
 
 # ReportType.Scenarios.Scenario
@@ -17417,9 +17159,7 @@ class HVACSystems(BSElement):
     pass
 
 
-HVACSystems.element_children = [
-    ("HVACSystem", HVACSystem),
-]
+HVACSystems.element_children = (("HVACSystem", HVACSystem),)
 
 
 # BuildingSync.Facilities.Facility.Systems
@@ -17428,7 +17168,7 @@ class Systems(BSElement):
         pass
 
 
-Systems.element_children = [
+Systems.element_children = (
     ("HVACSystems", HVACSystems),
     ("LightingSystems", LightingSystems),
     ("DomesticHotWaterSystems", DomesticHotWaterSystems),
@@ -17458,10 +17198,8 @@ Systems.element_children = [
     ("WaterUses", WaterUses),
     ("AirInfiltrationSystems", AirInfiltrationSystems),
     ("WaterInfiltrationSystems", WaterInfiltrationSystems),
-]
-Systems.ConveyanceSystems.element_children = [
-    ("ConveyanceSystem", ConveyanceSystem),
-]
+)
+Systems.ConveyanceSystems.element_children = (("ConveyanceSystem", ConveyanceSystem),)
 
 
 # ReportType.Scenarios
@@ -17469,9 +17207,7 @@ class Scenarios(BSElement):
     pass
 
 
-Scenarios.element_children = [
-    ("Scenario", Scenario),
-]
+Scenarios.element_children = (("Scenario", Scenario),)
 
 
 # BasicOnsiteAudit
@@ -17479,11 +17215,11 @@ class BasicOnsiteAudit(BSElement):
     """Ignition mechanism in gas heating equipment. Either pilot light or an intermittent ignition device (IID)."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "ASHRAE Level 1 Audit",
         "Industrial Assessment Center (IAC) Audit",
         "Utility Incentive Program Audit",
-    ]
+    )
 
 
 # DetailedOnsiteAudit
@@ -17491,14 +17227,14 @@ class DetailedOnsiteAudit(BSElement):
     """Ignition mechanism in gas heating equipment. Either pilot light or an intermittent ignition device (IID)."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "ASHRAE Level 2 Audit",
         "ASHRAE Level 3 Audit",
         "Deep Energy Retrofit Audit",
         "Preliminary Assessment (PA)",
         "Investment Grade Audit (IGA)",
         "Retrocommissioning Audit",
-    ]
+    )
 
 
 # BasicRemoteAudit
@@ -17506,11 +17242,11 @@ class BasicRemoteAudit(BSElement):
     """Ignition mechanism in gas heating equipment. Either pilot light or an intermittent ignition device (IID)."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Rapid/Automated Audit",
         "Continuous Monitoring of Building Systems",
         "Portfolio Screening Analysis",
-    ]
+    )
 
 
 # DetailedRemoteAudit
@@ -17518,10 +17254,10 @@ class DetailedRemoteAudit(BSElement):
     """Ignition mechanism in gas heating equipment. Either pilot light or an intermittent ignition device (IID)."""
 
     element_type = "xs:string"
-    element_enumerations = [
+    element_enumerations = (
         "Desk Audit",
         "Remote Controls Audit",
-    ]
+    )
 
 
 # ReportType.FacilityEvaluationAuditDefinition
@@ -17529,12 +17265,12 @@ class FacilityEvaluationAuditDefinition(BSElement):
     pass
 
 
-FacilityEvaluationAuditDefinition.element_children = [
+FacilityEvaluationAuditDefinition.element_children = (
     ("BasicOnsiteAudit", BasicOnsiteAudit),
     ("DetailedOnsiteAudit", DetailedOnsiteAudit),
     ("BasicRemoteAudit", BasicRemoteAudit),
     ("DetailedRemoteAudit", DetailedRemoteAudit),
-]
+)
 
 
 # ReportType
@@ -17542,10 +17278,8 @@ class ReportType(BSElement):
     pass
 
 
-ReportType.element_attributes = [
-    "ID",  # ID
-]
-ReportType.element_children = [
+ReportType.element_attributes = _ID_ATTRS
+ReportType.element_children = (
     ("Scenarios", Scenarios),
     ("AuditDates", AuditDates),
     ("AuditFilingStatus", AuditFilingStatus),
@@ -17568,7 +17302,7 @@ ReportType.element_children = [
     ("LinkedPremisesOrSystem", LinkedPremisesOrSystem),
     ("LinkedAuditCycles", LinkedAuditCycles),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # SiteType.Buildings
@@ -17577,36 +17311,22 @@ class Buildings(BSElement):
         """A building is a single structure wholly or partially enclosed within exterior walls, or within exterior and abutment walls (party walls), and a roof, affording shelter to persons, animals, or property. A building can be two or more units held in the condominium form of ownership that are governed by the same board of managers."""
 
 
-Buildings.element_children = [
-    ("Building", Buildings.Building),
-]
+Buildings.element_children = (("Building", Buildings.Building),)
 
 
 # SiteType
 class SiteType(BSElement):
-    class eGRIDRegionCode(eGRIDRegionCode):
-        pass
-
-    class eGRIDSubregionCodes(eGRIDSubregionCodes):
-        pass
-
-    class WeatherDataStationID(WeatherDataStationID):
-        pass
-
-    class WeatherStationName(WeatherStationName):
-        pass
-
-    class WeatherStationCategory(WeatherStationCategory):
-        pass
-
-    class WeatherStations(WeatherStations):
-        pass
+    pass
 
 
-SiteType.element_attributes = [
-    "ID",  # ID
-]
-SiteType.element_children = [
+SiteType.eGRIDRegionCode = eGRIDRegionCode
+SiteType.eGRIDSubregionCodes = eGRIDSubregionCodes
+SiteType.WeatherDataStationID = WeatherDataStationID
+SiteType.WeatherStationName = WeatherStationName
+SiteType.WeatherStationCategory = WeatherStationCategory
+SiteType.WeatherStations = WeatherStations
+SiteType.element_attributes = _ID_ATTRS
+SiteType.element_children = (
     ("PremisesIdentifiers", PremisesIdentifiers),
     ("PremisesName", PremisesName),
     ("PremisesNotes", PremisesNotes),
@@ -17627,7 +17347,7 @@ SiteType.element_children = [
     ("PrimaryContactID", PrimaryContactID),
     ("Buildings", Buildings),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # BuildingSync.Facilities.Facility.Reports.Report
@@ -17640,9 +17360,7 @@ class Reports(BSElement):
     pass
 
 
-Reports.element_children = [
-    ("Report", Report),
-]
+Reports.element_children = (("Report", Report),)
 
 
 # BuildingSync.Facilities.Facility.Sites
@@ -17651,9 +17369,7 @@ class Sites(BSElement):
         pass
 
 
-Sites.element_children = [
-    ("Site", Sites.Site),
-]
+Sites.element_children = (("Site", Sites.Site),)
 
 
 # BuildingSync.Facilities
@@ -17662,13 +17378,9 @@ class Facilities(BSElement):
         """A group of sites which contain buildings."""
 
 
-Facilities.element_children = [
-    ("Facility", Facilities.Facility),
-]
-Facilities.Facility.element_attributes = [
-    "ID",  # ID
-]
-Facilities.Facility.element_children = [
+Facilities.element_children = (("Facility", Facilities.Facility),)
+Facilities.Facility.element_attributes = _ID_ATTRS
+Facilities.Facility.element_children = (
     ("Sites", Sites),
     ("Systems", Systems),
     ("Schedules", Schedules),
@@ -17678,7 +17390,7 @@ Facilities.Facility.element_children = [
     ("Tenants", Tenants),
     ("AuditCycles", AuditCycles),
     ("UserDefinedFields", UserDefinedFields),
-]
+)
 
 
 # BuildingSync
@@ -17686,7 +17398,13 @@ class BuildingSync(BSElement):
     pass
 
 
-BuildingSync.element_children = [
+BuildingSync.element_children = (
     ("Programs", Programs),
     ("Facilities", Facilities),
-]
+)
+
+# all of the shared pairs, tables and enumerations are referenced by the
+# classes now
+_element_children_pairs.clear()
+_element_children.clear()
+_element_enumerations.clear()
@@ -170,6 +170,20 @@ class BSElement:
         self.element_union = []
         self.element_subclasses = []
 
+    def is_alias(self) -> bool:
+        """A nested element with the same name as its type and nothing of
+        its own is the type itself, rather than a subclass of it.
+        """
+        return (
+            self.element_type == f"auc:{self.element_name}"
+            and not self.element_docstring
+            and not self.element_attributes
+            and not self.element_enumerations
+            and not self.element_children
+            and not self.element_union
+            and not self.element_subclasses
+        )
+
     def do_classes(self, f=sys.stdout, indent=0) -> None:
         skip_pass = False
 
@@ -191,11 +205,13 @@ class BSElement:
         if self.element_enumerations:
             f.write(
                 "    " * indent
-                + f"    element_enumerations = {repr(self.element_enumerations)}\n"
+                + f"    element_enumerations = {repr(tuple(self.element_enumerations))}\n"
             )
             skip_pass = True
 
         for subclass in self.element_subclasses:
+            if subclass.is_alias():
+                continue
             subclass.do_classes(f, indent + 1)
             skip_pass = True
 
@@ -204,21 +220,29 @@ class BSElement:
         f.write("\n")
 
     def do_children(self, f=sys.stdout) -> None:
-        if self.element_attributes:
-            f.write(f"{self.element_short_name}.element_attributes = [\n")
+        for subclass in self.element_subclasses:
+            if subclass.is_alias():
+                f.write(f"{subclass.element_short_name} = {subclass.element_name}\n")
+        attribute_names = [
+            attribute_name for attribute_name, _ in self.element_attributes
+        ]
+        if attribute_names == ["ID"]:
+            f.write(f"{self.element_short_name}.element_attributes = _ID_ATTRS\n")
+        elif self.element_attributes:
+            f.write(f"{self.element_short_name}.element_attributes = (\n")
             for attribute_name, attribute_type in self.element_attributes:
                 f.write(f"    {repr(attribute_name)},  # {attribute_type}\n")
-            f.write(f"    ]\n")
+            f.write(f"    )\n")
         if self.element_children:
-            f.write(f"{self.element_short_name}.element_children = [\n")
+            f.write(f"{self.element_short_name}.element_children = (\n")
             for child_name, child_type in self.element_children:
                 f.write(f"    ({repr(child_name)}, {child_type} ),\n")
-            f.write(f"    ]\n")
+            f.write(f"    )\n")
         if self.element_union:
-            f.write(f"{self.element_short_name}.element_union = [\n")
+            f.write(f"{self.element_short_name}.element_union = (\n")
             for union_type in self.element_union:
                 f.write(f"    {union_type},\n")
-            f.write(f"    ]\n")
+            f.write(f"    )\n")
         for subclass in self.element_subclasses:
             subclass.do_children(f)
 
@@ -813,3 +837,11 @@ with open("bsync.py", "w") as bspy_file:
         bs_element = short_name_to_bs_element[bs_element_name]
         bspy_file.write(f"# {bs_element.element_full_name}\n")
         bs_element.write(bspy_file)
+
+    bspy_file.write(
+        "# all of the shared pairs, tables and enumerations are referenced by the\n"
+        "# classes now\n"
+    )
+    bspy_file.write("_element_children_pairs.clear()\n")
+    bspy_file.write("_element_children.clear()\n")
+    bspy_file.write("_element_enumerations.clear()\n")
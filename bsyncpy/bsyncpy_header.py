@@ -6,21 +6,221 @@ it easier to build BuildingSync XML files.
 """
 
 import datetime
+import types
 from lxml import etree
 
-from typing import Any, List, Tuple
+from typing import Any, Callable, Dict, List, Mapping, Tuple
 
+# the attributes of most of the elements with an identifier, shared by all of
+# them rather than each class having its own list
+_ID_ATTRS = ("ID",)
+
+# many classes have the same (child name, child type) pairs in their element
+# children like ("Capacity", Capacity), this keeps one copy of each
+_element_children_pairs: Dict[Tuple[str, type], Tuple[str, type]] = {}
+
+# classes with the same children, like LinkedSiteID and LinkedBuildingID,
+# share one table and one read-only mapping of the children by name
+_element_children: Dict[tuple, Tuple[tuple, Mapping[str, type]]] = {}
+
+# some classes have the same enumerations, like the climate zones in the
+# DOE and Building America systems, this keeps one copy of each
+_element_enumerations: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# the schema tables of the element classes, always stored as tuples so they
+# cannot be changed in place behind the lookups computed from them
+_element_tables = (
+    "element_attributes",
+    "element_enumerations",
+    "element_children",
+    "element_union",
+)
+
+# class attributes that are computed from the schema tables the first time
+# they are needed, these are thrown away when the table is changed
+_element_caches: Dict[str, Tuple[str, ...]] = {
+    "element_children": ("_toxml_children", "_children_by_tag", "_children_by_type"),
+    "element_enumerations": ("_enumerations",),
+}
+
+
+def _boolean_text(value: Any) -> str:
+    if not isinstance(value, bool):
+        raise TypeError("boolean expected")
+    return "true" if value else "false"
+
+
+def _integer_text(value: Any) -> str:
+    if not isinstance(value, int):
+        raise TypeError("integer expected")
+    return f"{value:d}"
+
+
+def _non_negative_integer_text(value: Any) -> str:
+    if not isinstance(value, int):
+        raise TypeError("integer expected")
+    if value < 0:
+        raise ValueError("non-negative integer expected")
+    return f"{value:d}"
+
+
+def _decimal_text(value: Any) -> str:
+    if not isinstance(value, float):
+        raise TypeError("decimal (float) expected")
+    return f"{value:f}"
+
+
+def _float_text(value: Any) -> str:
+    if not isinstance(value, float):
+        raise TypeError("float expected")
+    return f"{value:G}"
+
+
+def _string_text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError("string expected")
+    return value
+
+
+def _date_text(value: Any) -> str:
+    if not isinstance(value, datetime.date):
+        raise TypeError("datetime.date expected")
+    return value.isoformat()
+
+
+def _time_text(value: Any) -> str:
+    if not isinstance(value, datetime.time):
+        raise TypeError("datetime.time expected")
+    return value.isoformat()
+
+
+def _date_time_text(value: Any) -> str:
+    if not isinstance(value, datetime.datetime):
+        raise TypeError("datetime.datetime expected")
+    return value.isoformat()
+
+
+def _month_day_text(value: Any) -> str:
+    if not isinstance(value, datetime.date):
+        raise TypeError("datetime.date expected")
+    return value.strftime("--%m-%d")
+
+
+# the function that checks the value of a simple element and returns its
+# text, by element type, so the constructor does one lookup rather than
+# comparing the type with each of them
+_element_type_text: Dict[str, Callable[[Any], str]] = {
+    "xs:boolean": _boolean_text,
+    "xs:integer": _integer_text,
+    "xs:int": _integer_text,
+    "xs:nonNegativeInteger": _non_negative_integer_text,
+    "xs:decimal": _decimal_text,
+    "xs:float": _float_text,
+    "xs:string": _string_text,
+    "xs:date": _date_text,
+    "xs:time": _time_text,
+    "xs:dateTime": _date_time_text,
+    "xs:gMonthDay": _month_day_text,
+    "xs:gYear": _integer_text,
+}
+
+
+class BSElementMeta(type):
+    """Metaclass for BuildingSync elements.  The generated module assigns the
+    element children of a class after the class statement, this shares the
+    (child name, child type) pairs and the enumerations between all of the
+    classes, builds a read-only mapping of the children by name for the class,
+    and makes sure nothing computed from an older table is left on the class
+    or the subclasses that inherit it.  The instances of the generated
+    element classes only have the slots of BSElement, there is no instance
+    dictionary, subclasses written outside of this module keep theirs.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if namespace.get("__module__") == __name__:
+            namespace.setdefault("__slots__", ())
+
+        # tables in the class body are set like the generated ones
+        tables = {}
+        for attr in _element_tables:
+            if attr in namespace:
+                tables[attr] = namespace.pop(attr)
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        for attr, value in tables.items():
+            setattr(cls, attr, value)
+        return cls
+
+    def __setattr__(cls, attr, value):
+        if attr == "element_children":
+            child_pairs = []
+            for child_pair in value:
+                child_pair = tuple(child_pair)
+                # catch a missing or misspelled class when the table is set
+                # rather than when an instance is being built or read
+                if len(child_pair) != 2:
+                    raise TypeError(
+                        f"{repr(cls.__name__)} child is not a (name, class) pair: {repr(child_pair)}"
+                    )
+                child_name, child_type = child_pair
+                if not isinstance(child_type, BSElementMeta):
+                    raise TypeError(
+                        f"{repr(cls.__name__)} child {repr(child_name)} is not an element class: {repr(child_type)}"
+                    )
+                child_pairs.append(
+                    _element_children_pairs.setdefault(child_pair, child_pair)
+                )
+            value = tuple(child_pairs)
+            shared = _element_children.get(value)
+            if shared is None:
+                shared = _element_children[value] = (
+                    value,
+                    types.MappingProxyType(dict(value)),
+                )
+            value, children_by_name = shared
+            super().__setattr__("_children_by_name", children_by_name)
+        elif attr == "element_enumerations":
+            value = tuple(value)
+            value = _element_enumerations.setdefault(value, value)
+        elif attr == "element_union":
+            value = tuple(value)
+            for union_type in value:
+                if not isinstance(union_type, BSElementMeta):
+                    raise TypeError(
+                        f"{repr(cls.__name__)} union member is not an element class: {repr(union_type)}"
+                    )
+        elif attr in _element_tables:
+            value = tuple(value)
+        super().__setattr__(attr, value)
+
+        cache_names = _element_caches.get(attr)
+        if cache_names:
+            classes = [cls]
+            while classes:
+                klass = classes.pop()
+                for cache_name in cache_names:
+                    if cache_name in klass.__dict__:
+                        type.__delattr__(klass, cache_name)
+                classes.extend(klass.__subclasses__())
+
+
+class BSElement(metaclass=BSElementMeta):
+    """Base class of the BuildingSync elements.  Elements are compared and
+    hashed by identity, two elements with the same value and children are
+    not equal, so they can be used in sets and as dictionary keys without
+    walking their children.
+    """
+
+    __slots__ = ("_children_values", "_text", "_attributes")
 
-class BSElement:
     element_type: str = ""
-    element_attributes: List[str] = []
-    element_enumerations: List[str] = []
-    element_children: List[Tuple[str, type]] = []
-    element_union: List[type] = []
+    element_attributes: Tuple[str, ...] = ()
+    element_enumerations: Tuple[str, ...] = ()
+    element_children: Tuple[Tuple[str, type], ...] = ()
+    element_union: Tuple[type, ...] = ()
 
     def __init__(self, *args, **kwargs):
         """Create an instance of a BuildingSync element."""
-        self._children_by_name = dict(self.element_children)
         self._children_values = {}
         self._text = None
 
@@ -29,8 +229,7 @@ class BSElement:
             if self.element_enumerations:
                 if len(args) > 1:
                     raise RuntimeError("too many arguments")
-                if args[0] not in self.element_enumerations:
-                    raise ValueError("invalid enumeration")
+                self._check_enumeration(args[0])
                 self._text = args[0]
 
             elif self.element_union:
@@ -46,84 +245,10 @@ class BSElement:
                 else:
                     raise ValueError("invalid argument")
 
-            elif self.element_type == "xs:boolean":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, bool):
-                    raise TypeError("boolean expected")
-                self._text = "true" if args[0] else "false"
-
-            elif self.element_type == "xs:integer" or self.element_type == "xs:int":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, int):
-                    raise TypeError("integer expected")
-                self._text = f"{arg_value:d}"
-
-            elif self.element_type == "xs:nonNegativeInteger":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, int):
-                    raise TypeError("integer expected")
-                if arg_value < 0:
-                    raise ValueError("non-negative integer expected")
-                self._text = f"{arg_value:d}"
-
-            elif self.element_type == "xs:decimal":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, float):
-                    raise TypeError("decimal (float) expected")
-                self._text = f"{arg_value:f}"
-
-            elif self.element_type == "xs:float":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, float):
-                    raise TypeError("float expected")
-                self._text = f"{arg_value:G}"
-
-            elif self.element_type == "xs:string":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, str):
-                    raise TypeError("string expected")
-                self._text = arg_value
-
-            elif self.element_type == "xs:date":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, datetime.date):
-                    raise TypeError("datetime.date expected")
-                self._text = arg_value.isoformat()
-
-            elif self.element_type == "xs:time":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, datetime.time):
-                    raise TypeError("datetime.time expected")
-                self._text = arg_value.isoformat()
-
-            elif self.element_type == "xs:dateTime":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, datetime.datetime):
-                    raise TypeError("datetime.datetime expected")
-                self._text = arg_value.isoformat()
-
-            elif self.element_type == "xs:gMonthDay":
+            elif self.element_type in _element_type_text:
                 if len(args) > 1:
                     raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, datetime.date):
-                    raise TypeError("datetime.date expected")
-                self._text = arg_value.strftime("--%m-%d")
-
-            elif self.element_type == "xs:gYear":
-                if len(args) > 1:
-                    raise RuntimeError("too many arguments")
-                if not isinstance(arg_value, int):
-                    raise TypeError("integer expected")
-                self._text = f"{arg_value:d}"
+                self._text = _element_type_text[self.element_type](arg_value)
 
             else:
                 # add the args as child elements
@@ -180,16 +305,25 @@ class BSElement:
     def __add__(self, value):
         """Add an element value by finding the child element name with the
         correct class.  Return this element so other child element values can
-        be added like 'thing + Child1() + Child2()'.
+        be added like 'thing + Child1() + Child2()'.  The child element name
+        found for each type of value is cached for each class.
         """
-        for child_name, child_type in self.element_children:
-            if isinstance(value, child_type):
-                break
-        else:
-            child_type_names = list(
-                child_type.__name__ for child_name, child_type in self.element_children
-            )
-            raise ValueError(f"expecting one of: {', '.join(child_type_names)}")
+        children_by_type = self.__class__.__dict__.get("_children_by_type")
+        if children_by_type is None:
+            children_by_type = self.__class__._children_by_type = {}
+
+        child_name = children_by_type.get(type(value))
+        if child_name is None:
+            for child_name, child_type in self.element_children:
+                if isinstance(value, child_type):
+                    break
+            else:
+                child_type_names = list(
+                    child_type.__name__
+                    for child_name, child_type in self.element_children
+                )
+                raise ValueError(f"expecting one of: {', '.join(child_type_names)}")
+            children_by_type[type(value)] = child_name
 
         # if this child already has a value, add this to the end
         if child_name in self._children_values:
@@ -246,14 +380,192 @@ class BSElement:
         for k, v in self._attributes.items():
             myroot.set(k, v)
 
-        # maybe I have children
-        for child_name, child_type in self.element_children:
-            for child_value in self._children_values.get(child_name, []):
-                child_value.toxml(myroot, child_name)
+        # maybe I have children, added by a function specialized for this
+        # class that is compiled the first time it is needed
+        if self._children_values:
+            toxml_children = self.__class__.__dict__.get("_toxml_children")
+            if toxml_children is None:
+                toxml_children = self.__class__._compile_toxml_children()
+            toxml_children(self, myroot)
 
         # return this "root" element
         return myroot
 
+    @classmethod
+    def _compile_toxml_children(cls) -> Any:
+        """Compile and cache a function that adds the child element values
+        of an instance to its XML element.  The element children are fixed
+        for each class, so the loop over them is unrolled into straight-line
+        code with the child names as constants.
+        """
+        source = ["def _toxml_children(self, myroot):"]
+        source.append("    values = self._children_values")
+        for child_name, child_type in cls.element_children:
+            source.append(f"    if {child_name!r} in values:")
+            source.append(f"        for child_value in values[{child_name!r}]:")
+            source.append(f"            child_value.toxml(myroot, {child_name!r})")
+
+        namespace: Dict[str, Any] = {}
+        code = compile("\n".join(source), f"<{cls.__qualname__}>", "exec")
+        exec(code, namespace)
+
+        # cache it in this class, subclasses may have different children
+        toxml_children = namespace["_toxml_children"]
+        cls._toxml_children = toxml_children
+        return toxml_children
+
+    @classmethod
+    def fromxml(cls, element) -> "BSElement":
+        """Return an instance of this class from an ElementTree element, the
+        reverse of toxml().  The child elements are matched with the element
+        children by name and any namespace is ignored, so documents with the
+        'auc:' prefix can be read.
+        """
+        self = cls()
+
+        # maybe I have a value
+        if cls.element_type or cls.element_union:
+            if cls.element_enumerations:
+                cls._check_enumeration(element.text)
+            self._text = element.text
+
+        # maybe I have attributes
+        self._attributes = dict(element.attrib)
+
+        # maybe I have children
+        for child in element:
+            # skip over comments and processing instructions
+            if not isinstance(child.tag, str):
+                continue
+
+            child_name, child_type = cls._child_for_tag(child.tag)
+            child_value = child_type.fromxml(child)
+
+            # if this child already has a value, add this to the end
+            if child_name in self._children_values:
+                self._children_values[child_name].append(child_value)
+            else:
+                self._children_values[child_name] = [child_value]
+
+        return self
+
+    @classmethod
+    def fromfile(cls, source) -> "BSElement":
+        """Return an instance of this class read from an XML document, given
+        a file name or a file object, where the document element is one of
+        these, or any element when called as BSElement.fromfile().  The
+        document is parsed incrementally and each XML element is thrown away
+        once it has been read, so large documents are never held in memory
+        twice.
+        """
+        root = None
+        stack: List[BSElement] = []
+
+        # documents may come from anywhere, so entities are never resolved,
+        # a file could otherwise pull in the contents of other files
+        for event, element in etree.iterparse(
+            source, events=("start", "end"), resolve_entities=False
+        ):
+            if event == "start":
+                if stack:
+                    parent = stack[-1]
+                    child_name, child_type = parent._child_for_tag(element.tag)
+                    value = child_type()
+
+                    # if this child already has a value, add this to the end
+                    if child_name in parent._children_values:
+                        parent._children_values[child_name].append(value)
+                    else:
+                        parent._children_values[child_name] = [value]
+                else:
+                    element_name = etree.QName(element).localname
+                    root_type = cls
+                    if cls is BSElement:
+                        element_class = globals().get(element_name)
+                        if (
+                            not isinstance(element_class, BSElementMeta)
+                            or element_class is BSElement
+                        ):
+                            raise ValueError(
+                                f"no element class for document element {repr(element_name)}"
+                            )
+                        root_type = element_class
+                    if element_name != root_type.__name__:
+                        raise ValueError(
+                            f"expecting {repr(root_type.__name__)}, got {repr(element_name)}"
+                        )
+                    root = value = root_type()
+
+                # the attributes are complete at the start
+                value._attributes = dict(element.attrib)
+                stack.append(value)
+
+            else:
+                # the text is complete at the end
+                value = stack.pop()
+                if value.element_type or value.element_union:
+                    if value.element_enumerations:
+                        value._check_enumeration(element.text)
+                    value._text = element.text
+
+                # done with this element and the ones before it, the document
+                # element has no parent but may follow comments and processing
+                # instructions
+                element.clear()
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+        return root
+
+    @classmethod
+    def _child_for_tag(cls, tag: str) -> Tuple[str, type]:
+        """Return the child element name and type for an XML tag.  The tags
+        are cached for each class so the namespace is only stripped the first
+        time a tag is seen.
+        """
+        children_by_tag = cls.__dict__.get("_children_by_tag")
+        if children_by_tag is None:
+            children_by_tag = cls._children_by_tag = {}
+
+        try:
+            return children_by_tag[tag]
+        except KeyError:
+            pass
+
+        child_name = etree.QName(tag).localname
+        for name, child_type in cls.element_children:
+            if name == child_name:
+                children_by_tag[tag] = (name, child_type)
+                return (name, child_type)
+        raise ValueError(f"{repr(cls.__name__)} object has no child {repr(child_name)}")
+
+    @classmethod
+    def _check_enumeration(cls, text: str) -> None:
+        """Make sure a value is one of the enumerations.  The enumerations are
+        turned into a set the first time they are checked so long lists are
+        not searched for every element that is created or read.
+        """
+        enumerations = cls.__dict__.get("_enumerations")
+        if enumerations is None:
+            enumerations = cls._enumerations = frozenset(cls.element_enumerations)
+
+        if not isinstance(text, str) or text not in enumerations:
+            raise ValueError(f"{repr(cls.__name__)} invalid enumeration {repr(text)}")
+
+    def __repr__(self) -> str:
+        """Return a short description of the element with its value and
+        attributes.  The children are not included so this stays cheap for
+        elements at the top of large documents.
+        """
+        description = [self.__class__.__qualname__]
+        if self._text:
+            description.append(repr(self._text))
+        for k, v in self._attributes.items():
+            description.append(f"{k}={repr(v)}")
+        return f"<{' '.join(description)}>"
+
     def __str__(self):
         """Convert the element into a string."""
         return etree.tostring(self.toxml(), pretty_print=True).decode()
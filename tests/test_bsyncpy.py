@@ -1,4 +1,5 @@
 import datetime
+import pytest
 from bsyncpy import bsync
 from lxml import etree
 
@@ -13,6 +14,32 @@ def test_int_datatype():
     assert b is not None
 
 
+def test_simple_types():
+    assert bsync.MultiTenant(True)._text == "true"
+    assert bsync.EIAUtilityID(12)._text == "12"
+    assert bsync.AirInfiltrationValue(1.5)._text == "1.500000"
+    assert (
+        bsync.ApplicableStartDateForEnergyRate(datetime.date(2020, 6, 1))._text
+        == "--06-01"
+    )
+    with pytest.raises(TypeError):
+        bsync.MultiTenant(1)
+    with pytest.raises(ValueError):
+        bsync.EIAUtilityID(-1)
+    with pytest.raises(TypeError):
+        bsync.AirInfiltrationValue(1)
+    with pytest.raises(RuntimeError):
+        bsync.AirInfiltrationValue(1.0, 2.0)
+
+
+def test_enumeration():
+    assert bsync.Tightness("Tight")._text == "Tight"
+    with pytest.raises(ValueError):
+        bsync.Tightness("Drafty")
+    with pytest.raises(ValueError):
+        bsync.Tightness(["Tight"])
+
+
 def test_weather_data_station_id():
     """
     Added to ensure 'strange formulations', as described in https://github.com/BuildingSync/bsyncpy/issues/2
@@ -96,3 +123,210 @@ def test_gmonthday():
         xml_representation.decode("utf-8")
         == "<ApplicableEndDateForDemandRate>--01-01</ApplicableEndDateForDemandRate>"
     )
+
+
+def test_children_schema_order():
+    """
+    Child elements are written in schema order, not the order they were added
+    """
+    bldg = bsync.Buildings.Building()
+    bldg += bsync.WeatherStationName("Station 2")
+    bldg += bsync.PremisesName("Building 1")
+    bldg += bsync.WeatherStationName("Station 3")
+    xml_representation = etree.tostring(bldg.toxml())
+    assert xml_representation.decode("utf-8") == (
+        "<Building><PremisesName>Building 1</PremisesName>"
+        "<WeatherStationName>Station 2</WeatherStationName>"
+        "<WeatherStationName>Station 3</WeatherStationName></Building>"
+    )
+
+
+def test_fromxml():
+    """
+    Elements read from XML, with or without a namespace, write the same XML
+    """
+    xml_text = (
+        '<auc:Buildings xmlns:auc="http://buildingsync.net/schemas/bedes-auc/2019">'
+        '<auc:Building ID="Building-1"><!-- comment -->'
+        "<auc:PremisesName>Building 1</auc:PremisesName>"
+        '<auc:WeatherDataStationID IDref="an-id"/>'
+        "</auc:Building></auc:Buildings>"
+    )
+    bldgs = bsync.Buildings.fromxml(etree.fromstring(xml_text))
+    bldg = bldgs._children_values["Building"][0]
+    assert isinstance(bldg, bsync.Buildings.Building)
+    assert bldg["ID"] == "Building-1"
+    assert isinstance(bldg.PremisesName, bsync.PremisesName)
+    xml_representation = etree.tostring(bldgs.toxml())
+    assert xml_representation.decode("utf-8") == (
+        '<Buildings><Building ID="Building-1">'
+        "<PremisesName>Building 1</PremisesName>"
+        '<WeatherDataStationID IDref="an-id"/>'
+        "</Building></Buildings>"
+    )
+
+    tightness = bsync.Tightness.fromxml(
+        etree.fromstring("<Tightness>Tight</Tightness>")
+    )
+    assert tightness._text == "Tight"
+    with pytest.raises(ValueError):
+        bsync.Tightness.fromxml(etree.fromstring("<Tightness>Drafty</Tightness>"))
+
+
+def test_fromfile(tmp_path):
+    """
+    Documents read incrementally from a file match the written document
+    """
+    root = bsync.BuildingSync(version="2.5.0")
+    site = bsync.Sites.Site(bsync.WeatherStationName("A weather station"))
+    site += bsync.Buildings(bsync.Buildings.Building(bsync.PremisesName("B1")))
+    root += bsync.Facilities(bsync.Facilities.Facility(bsync.Sites(site), ID="F1"))
+    xml_representation = etree.tostring(root.toxml())
+
+    path = tmp_path / "document.xml"
+    path.write_bytes(xml_representation)
+    assert etree.tostring(bsync.BuildingSync.fromfile(str(path)).toxml()) == (
+        xml_representation
+    )
+
+    with pytest.raises(ValueError):
+        bsync.Facilities.fromfile(str(path))
+
+    # comments and processing instructions before the document element
+    for prolog in (b"<!-- generated -->", b'<?xml-stylesheet href="a.xsl"?>'):
+        path.write_bytes(prolog + xml_representation)
+        assert etree.tostring(bsync.BuildingSync.fromfile(str(path)).toxml()) == (
+            xml_representation
+        )
+        assert isinstance(bsync.BSElement.fromfile(str(path)), bsync.BuildingSync)
+    path.write_bytes(xml_representation)
+
+    # the class comes from the document element
+    assert isinstance(bsync.BSElement.fromfile(str(path)), bsync.BuildingSync)
+
+    # nested elements have no module level class and the base class is not
+    # an element
+    for element_name in ("Facility", "BSElement"):
+        path.write_bytes(f"<{element_name}/>".encode())
+        with pytest.raises(ValueError, match=f"document element '{element_name}'"):
+            bsync.BSElement.fromfile(str(path))
+
+
+def test_fromfile_entities(tmp_path):
+    """
+    External entities in a document are not read
+    """
+    secret = tmp_path / "secret.txt"
+    secret.write_text("secret")
+    path = tmp_path / "document.xml"
+    path.write_text(
+        f'<!DOCTYPE PremisesName [<!ENTITY e SYSTEM "{secret.as_uri()}">]>'
+        "<PremisesName>&e;</PremisesName>"
+    )
+    premises_name = bsync.PremisesName.fromfile(str(path))
+    assert "secret" not in (premises_name._text or "")
+
+
+def test_repr():
+    assert repr(bsync.Story(1)) == "<Story '1'>"
+    facility = bsync.Facilities.Facility(bsync.Sites(), ID="Facility-1")
+    assert repr(facility) == "<Facilities.Facility ID='Facility-1'>"
+
+
+def test_element_children_changed():
+    """
+    Changing the children of a class after it has been used is not stale
+    """
+
+    class Thing(bsync.BSElement):
+        pass
+
+    Thing.element_children = [("Story", bsync.Story)]
+    assert Thing.element_children == (("Story", bsync.Story),)
+    assert etree.tostring(Thing(bsync.Story(1)).toxml()) == (
+        b"<Thing><Story>1</Story></Thing>"
+    )
+
+    Thing.element_children = [("Floor", bsync.Story)]
+    assert etree.tostring(Thing(bsync.Story(1)).toxml()) == (
+        b"<Thing><Floor>1</Floor></Thing>"
+    )
+
+    thing = Thing()
+    thing.Floor = bsync.Story(2)
+    with pytest.raises(AttributeError):
+        thing.Story = bsync.Story(3)
+
+    Thing.element_children = [["Story", bsync.Story]]
+    assert Thing.element_children == (("Story", bsync.Story),)
+    assert etree.tostring(Thing(bsync.Story(1)).toxml()) == (
+        b"<Thing><Story>1</Story></Thing>"
+    )
+
+    with pytest.raises(TypeError, match="not an element class"):
+        Thing.element_children = [("Floor", None)]
+    with pytest.raises(TypeError, match="not an element class"):
+        Thing.element_children = [["Floor", []]]
+    with pytest.raises(TypeError, match="not a \\(name, class\\) pair"):
+        Thing.element_children = [("Floor",)]
+
+
+def test_subclass_attributes():
+    """
+    Generated elements have no instance dictionary, user subclasses do
+    """
+
+    class NotedStory(bsync.Story):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._note = "ground floor"
+
+    assert NotedStory(1)._note == "ground floor"
+    with pytest.raises(AttributeError):
+        bsync.Story(1)._note = "ground floor"
+
+
+def test_identity():
+    """
+    Elements are compared by identity, not by value
+    """
+    story1, story2 = bsync.Story(1), bsync.Story(1)
+    assert story1 == story1
+    assert story1 != story2
+    assert len({story1, story2}) == 2
+
+
+def test_shared_tables():
+    """
+    Identical tables and children are shared between element classes
+    """
+    assert (
+        bsync.DOE.ClimateZone.element_enumerations
+        is bsync.BuildingAmerica.ClimateZone.element_enumerations
+    )
+    assert (
+        bsync.LinkedSiteID.element_children is bsync.LinkedBuildingID.element_children
+    )
+    assert (
+        bsync.LinkedSiteID._children_by_name is bsync.LinkedBuildingID._children_by_name
+    )
+    with pytest.raises(TypeError):
+        bsync.LinkedSiteID()._children_by_name["Story"] = bsync.Story
+    assert "Story" not in bsync.LinkedBuildingID._children_by_name
+
+    site_pairs = {pair[0]: pair for pair in bsync.Sites.Site.element_children}
+    building_pairs = {
+        pair[0]: pair for pair in bsync.Buildings.Building.element_children
+    }
+    assert site_pairs["Address"] is building_pairs["Address"]
+
+
+def test_nested_alias():
+    """
+    Nested elements that are the same as their type are the type itself
+    """
+    assert bsync.DirectTankHeatingSource.Unknown is bsync.Unknown
+    source = bsync.DirectTankHeatingSource(bsync.Unknown())
+    assert etree.tostring(source.toxml()) == (
+        b"<DirectTankHeatingSource><Unknown/></DirectTankHeatingSource>"
+    )